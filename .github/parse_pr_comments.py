@@ -3,25 +3,47 @@
 GitHub PR Comment Parser Utility
 
 A utility script to fetch and parse GitHub PR comments with reaction filtering.
-Uses GitHub CLI for fast and reliable API access while providing structured Python output.
+Queries GitHub's GraphQL API over a single persistent HTTP connection so comments,
+commits and reactions arrive in one request, while providing structured Python output.
 
 Usage:
     python .github/parse_pr_comments.py --pr 11 --reaction +1 --user michaelMinar
     python .github/parse_pr_comments.py --pr 11 --bot github-actions[bot] --reaction +1
 
 Requirements:
-    - GitHub CLI (gh) installed and authenticated
+    - GITHUB_TOKEN (or GH_TOKEN) set, or GitHub CLI (gh) installed and authenticated
+    - pip install httpx (h2 optional, enables HTTP/2)
     - pip install python-dotenv (optional)
+    - pip install ciso8601 (optional, faster timestamp parsing)
+    - pip install orjson (optional, faster JSON output)
 """
 
 import argparse
+import bisect
+import importlib.util
 import json
+import os
 import subprocess
 import sys
-from dataclasses import asdict, dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    # Optional C encoder; the stdlib json module is used otherwise
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    # C parser is optional; Python 3.11+ fromisoformat accepts GitHub's 'Z' suffix
+    _parse_iso8601 = datetime.fromisoformat
 
 
 @dataclass
@@ -37,167 +59,338 @@ class CommentData:
     line_number: Optional[int]  # For review comments
     comment_type: str  # 'issue' or 'review'
     html_url: str
-    reactions: Dict[str, List[str]]  # reaction_type -> list of users who reacted
+    reactions: Dict[str, FrozenSet[str]]  # reaction_type -> users who reacted
+
+
+# GraphQL reaction enum -> REST reaction name (what --reaction accepts)
+REACTION_NAMES = {
+    "THUMBS_UP": "+1",
+    "THUMBS_DOWN": "-1",
+    "LAUGH": "laugh",
+    "HOORAY": "hooray",
+    "CONFUSED": "confused",
+    "HEART": "heart",
+    "ROCKET": "rocket",
+    "EYES": "eyes",
+}
+
+REACTION_FIELDS = (
+    "reactionGroups { content reactors(first: 100) { nodes { ... on Actor { login } } } }"
+)
+COMMENT_FIELDS = f"databaseId body createdAt url author {{ login }} {REACTION_FIELDS}"
+
+PAGE_SIZE = 100
+
+
+def _thread_comments_selection(cursor_var: Optional[str] = None) -> str:
+    """Build the selection for one page of a review thread's comments."""
+    after = f", after: ${cursor_var}" if cursor_var else ""
+    return (
+        f"comments(first: {PAGE_SIZE}{after}) {{ pageInfo {{ hasNextPage endCursor }} "
+        f"nodes {{ {COMMENT_FIELDS} path line commit {{ oid }} }} }}"
+    )
+
+
+# Node selection for each paginated pull request connection
+CONNECTION_NODES = {
+    "commits": "commit { oid message authoredDate }",
+    "comments": COMMENT_FIELDS,
+    "reviewThreads": f"id {_thread_comments_selection()}",
+}
+
+GITHUB_API_URL = "https://api.github.com"
+REQUEST_TIMEOUT = 30.0
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _connection_selection(name: str, cursor_var: Optional[str] = None) -> str:
+    """Build the selection for one pull request connection."""
+    after = f", after: ${cursor_var}" if cursor_var else ""
+    return (
+        f"{name}(first: {PAGE_SIZE}{after}) "
+        f"{{ pageInfo {{ hasNextPage endCursor }} nodes {{ {CONNECTION_NODES[name]} }} }}"
+    )
+
+
+# First page of every connection in a single round trip
+PR_QUERY = (
+    "query($owner: String!, $name: String!, $pr: Int!) {"
+    " repository(owner: $owner, name: $name) { pullRequest(number: $pr) { title "
+    + " ".join(_connection_selection(name) for name in CONNECTION_NODES)
+    + " } } }"
+)
+
+
+def _connection_query(name: str) -> str:
+    """Build the query that fetches further pages of a single connection."""
+    return (
+        "query($owner: String!, $name: String!, $pr: Int!, $endCursor: String!) {"
+        " repository(owner: $owner, name: $name) { pullRequest(number: $pr) { "
+        + _connection_selection(name, "endCursor")
+        + " } } }"
+    )
+
+
+# Follow-up page queries, built once rather than per page
+CONNECTION_QUERIES = {name: _connection_query(name) for name in CONNECTION_NODES}
+
+# Further comments of a review thread with more than one page of them
+THREAD_COMMENTS_QUERY = (
+    "query($id: ID!, $endCursor: String!) {"
+    " node(id: $id) { ... on PullRequestReviewThread { "
+    + _thread_comments_selection("endCursor")
+    + " } } }"
+)
+
+
+def get_github_token() -> str:
+    """Return an API token from the environment, falling back to ``gh auth token``."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(
+            "No GitHub token found; set GITHUB_TOKEN or run 'gh auth login'"
+        ) from e
+    return result.stdout.strip()
 
 
 class GitHubCommentParser:
-    """Handles fetching and parsing GitHub PR comments via GitHub CLI."""
+    """Handles fetching and parsing GitHub PR comments via the GraphQL API."""
     
-    def __init__(self, repo_name: str):
+    def __init__(self, repo_name: str, token: Optional[str] = None):
         self.repo_name = repo_name
+        self.owner, self.name = repo_name.split("/", 1)
+        self._repo_variables = {"owner": self.owner, "name": self.name}
+        # One pooled client for every request; avoids a process fork and TLS
+        # handshake per call
+        self._client = httpx.Client(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"bearer {token or get_github_token()}",
+                "Accept": "application/vnd.github+json",
+            },
+            http2=HTTP2_AVAILABLE,
+            timeout=REQUEST_TIMEOUT,
+        )
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+    
+    def __enter__(self) -> "GitHubCommentParser":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+        
+    def _run_graphql(
+        self, query: str, pr_number: int, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a GraphQL query against the PR and return the pullRequest object."""
+        variables: Dict[str, Any] = {**self._repo_variables, "pr": pr_number}
+        if cursor:
+            variables["endCursor"] = cursor
         
-    def _run_gh_command(self, cmd: List[str]) -> Any:
-        """Execute a GitHub CLI command and return JSON result."""
+        repository = self._post_graphql(query, variables).get("repository") or {}
+        return repository.get("pullRequest") or {}
+    
+    def _post_graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data, or {} if the request failed."""
         try:
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                check=True
+            response = self._client.post(
+                "/graphql", json={"query": query, "variables": variables}
             )
-            if result.stdout.strip():
-                return json.loads(result.stdout)
-            return []
-        except subprocess.CalledProcessError as e:
-            print(f"Error running command {' '.join(cmd)}: {e.stderr}", file=sys.stderr)
-            return []
+            response.raise_for_status()
+            payload = response.json()
+        except httpx.HTTPError as e:
+            print(f"Error querying GitHub GraphQL API: {e}", file=sys.stderr)
+            return {}
         except json.JSONDecodeError as e:
             print(f"Error parsing JSON response: {e}", file=sys.stderr)
-            return []
+            return {}
+        
+        for error in payload.get("errors") or []:
+            print(f"GraphQL error: {error.get('message')}", file=sys.stderr)
+        return payload.get("data") or {}
     
-    def get_pr_commits(self, pr_number: int) -> List[Dict]:
-        """Get all commits for a PR."""
-        return self._run_gh_command([
-            "gh", "api", f"repos/{self.repo_name}/pulls/{pr_number}/commits", "--paginate"
-        ])
+    def _collect_nodes(self, pr_data: Dict[str, Any], name: str, pr_number: int) -> List[Dict]:
+        """Return all nodes of a connection, fetching further pages only when needed."""
+        connection = pr_data.get(name) or {}
+        nodes = list(connection.get("nodes") or [])
+        page_info = connection.get("pageInfo") or {}
+        
+        while page_info.get("hasNextPage"):
+            page = self._run_graphql(
+                CONNECTION_QUERIES[name], pr_number, cursor=page_info.get("endCursor")
+            ).get(name) or {}
+            nodes.extend(page.get("nodes") or [])
+            page_info = page.get("pageInfo") or {}
+        
+        if name == "reviewThreads":
+            for thread in nodes:
+                self._collect_thread_comments(thread)
+        return nodes
+    
+    def _collect_thread_comments(self, thread: Dict[str, Any]) -> None:
+        """Fetch the remaining pages of a review thread's comments into the thread."""
+        comments = thread.get("comments") or {}
+        page_info = comments.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            return
+        
+        nodes = list(comments.get("nodes") or [])
+        while page_info.get("hasNextPage"):
+            variables = {"id": thread["id"], "endCursor": page_info.get("endCursor")}
+            page = (
+                (self._post_graphql(THREAD_COMMENTS_QUERY, variables).get("node") or {})
+                .get("comments") or {}
+            )
+            nodes.extend(page.get("nodes") or [])
+            page_info = page.get("pageInfo") or {}
+        thread["comments"] = {"nodes": nodes}
+    
+    @staticmethod
+    def _parse_reactions(node: Dict[str, Any]) -> Dict[str, FrozenSet[str]]:
+        """Group a comment's reactions by REST reaction name."""
+        reaction_map = {}
+        for group in node.get("reactionGroups") or []:
+            users = frozenset(
+                reactor["login"]
+                for reactor in (group.get("reactors") or {}).get("nodes") or []
+                if reactor and reactor.get("login")
+            )
+            if users:
+                content = REACTION_NAMES.get(group["content"], group["content"].lower())
+                reaction_map[content] = users
+        return reaction_map
+    
+    @staticmethod
+    def _author(node: Dict[str, Any]) -> str:
+        """Return the comment author's login (deleted accounts show as 'ghost')."""
+        return (node.get("author") or {}).get("login") or "ghost"
+    
+    @staticmethod
+    def _parse_timestamp(timestamp: str) -> datetime:
+        """Parse a GitHub ISO-8601 timestamp."""
+        return _parse_iso8601(timestamp)
+    
+    def build_commit_index(self, commits: List[Dict]) -> Tuple[List[datetime], List[str]]:
+        """Parse and sort commit dates once so each comment lookup can bisect.
+        
+        Returns the ascending authored dates alongside the matching SHAs.
+        """
+        timeline = sorted(
+            (
+                (self._parse_timestamp(commit['commit']['authoredDate']), commit['commit']['oid'])
+                for commit in commits
+            ),
+            key=lambda entry: entry[0],
+        )
+        return [entry[0] for entry in timeline], [entry[1] for entry in timeline]
     
     def get_preceding_commit(
-        self, commits: List[Dict], comment_timestamp: str
-    ) -> tuple[Optional[str], Optional[str]]:
-        """Find the commit that directly preceded a comment based on timestamp."""
+        self, commit_index: Tuple[List[datetime], List[str]], comment_timestamp: str
+    ) -> Optional[str]:
+        """Find the SHA of the commit that directly preceded a comment."""
         try:
-            comment_dt = datetime.fromisoformat(comment_timestamp.replace('Z', '+00:00'))
-            
-            # Find the most recent commit before the comment timestamp
-            preceding_commit = None
-            for commit in commits:
-                commit_dt = datetime.fromisoformat(
-                    commit['commit']['author']['date'].replace('Z', '+00:00')
-                )
-                if commit_dt <= comment_dt:
-                    if (
-                        not preceding_commit or 
-                        commit_dt > datetime.fromisoformat(
-                            preceding_commit['commit']['author']['date'].replace('Z', '+00:00')
-                        )
-                    ):
-                        preceding_commit = commit
-            
-            if preceding_commit:
-                return preceding_commit['sha'], preceding_commit['commit']['message'].split('\n')[0]
-            return None, None
-            
-        except Exception as e:
+            comment_dt = self._parse_timestamp(comment_timestamp)
+        except ValueError as e:
             print(f"Warning: Could not determine preceding commit: {e}")
-            return None, None
-    
-    def get_comment_reactions(self, comment_id: int, comment_type: str) -> Dict[str, List[str]]:
-        """Fetch all reactions for a specific comment."""
-        if comment_type == "issue":
-            endpoint = f"repos/{self.repo_name}/issues/comments/{comment_id}/reactions"
-        else:  # review
-            endpoint = f"repos/{self.repo_name}/pulls/comments/{comment_id}/reactions"
+            return None
         
-        reactions = self._run_gh_command(["gh", "api", endpoint])
-        
-        # Group reactions by content type
-        reaction_map = {}
-        for reaction in reactions:
-            content = reaction["content"]
-            user = reaction["user"]["login"]
-            if content not in reaction_map:
-                reaction_map[content] = []
-            reaction_map[content].append(user)
-        
-        return reaction_map
+        # Most recent commit at or before the comment timestamp
+        commit_dates, commit_shas = commit_index
+        position = bisect.bisect_right(commit_dates, comment_dt) - 1
+        return commit_shas[position] if position >= 0 else None
     
     def get_pr_comments(self, pr_number: int) -> List[CommentData]:
-        """Fetch all comments (issue + review) for a PR with full metadata."""
-        comments = []
+        """Fetch all comments (issue + review) for a PR with full metadata.
         
-        print(f"Fetching PR #{pr_number} information...")
+        A single GraphQL query returns the PR's commits, issue comments, review
+        threads and every comment's reactions; further pages are only requested
+        for connections that report ``hasNextPage``. Each connection paginates
+        independently in the background, and each result is only awaited when
+        it is first needed, so later pages keep downloading while earlier
+        comments are being processed.
+        """
+        print(f"Fetching PR #{pr_number} comments, commits and reactions...")
+        pr_data = self._run_graphql(PR_QUERY, pr_number)
+        print(f"PR Title: {pr_data.get('title', 'Unknown')}")
         
-        # Get PR info
-        pr_info = self._run_gh_command([
-            "gh", "api", f"repos/{self.repo_name}/pulls/{pr_number}"
-        ])
-        print(f"PR Title: {pr_info.get('title', 'Unknown')}")
+        with ThreadPoolExecutor(max_workers=len(CONNECTION_NODES)) as executor:
+            pending = {
+                name: executor.submit(self._collect_nodes, pr_data, name, pr_number)
+                for name in CONNECTION_NODES
+            }
+            return self._build_comments(pending)
+    
+    def _build_comments(self, pending: Dict[str, Future]) -> List[CommentData]:
+        """Build CommentData records as each connection's nodes become available."""
+        comments = []
         
-        # Get all commits for the PR
-        print("Fetching PR commits...")
-        commits = self.get_pr_commits(pr_number)
+        commits = pending["commits"].result()
         print(f"Found {len(commits)} commits")
+        # First line of each commit message, shared by both comment types
+        commit_messages = {
+            commit['commit']['oid']: commit['commit']['message'].split('\n', 1)[0]
+            for commit in commits
+        }
         
-        # Get issue comments
-        print("Fetching issue comments...")
-        issue_comments = self._run_gh_command([
-            "gh", "api", f"repos/{self.repo_name}/issues/{pr_number}/comments", "--paginate"
-        ])
-        
+        issue_comments = pending["comments"].result()
+        # Only issue comments need the date-sorted index; skip it on quiet PRs
+        if issue_comments:
+            commit_index = self.build_commit_index(commits)
         for comment in issue_comments:
             # Get preceding commit
-            preceding_sha, preceding_msg = self.get_preceding_commit(commits, comment["created_at"])
-            
-            # Get reactions
-            reactions = self.get_comment_reactions(comment["id"], "issue")
+            preceding_sha = self.get_preceding_commit(commit_index, comment["createdAt"])
             
             comments.append(CommentData(
-                comment_id=comment["id"],
+                comment_id=comment["databaseId"],
                 comment_body=comment["body"],
-                reviewer=comment["user"]["login"],
-                timestamp=comment["created_at"],
+                reviewer=self._author(comment),
+                timestamp=comment["createdAt"],
                 preceding_commit=preceding_sha,
-                preceding_commit_message=preceding_msg,
+                preceding_commit_message=commit_messages.get(preceding_sha),
                 file_path=None,
                 line_number=None,
                 comment_type="issue",
-                html_url=comment["html_url"],
-                reactions=reactions
+                html_url=comment["url"],
+                reactions=self._parse_reactions(comment)
             ))
         
         print(f"Found {len(issue_comments)} issue comments")
         
-        # Get review comments
-        print("Fetching review comments...")
-        review_comments = self._run_gh_command([
-            "gh", "api", f"repos/{self.repo_name}/pulls/{pr_number}/comments", "--paginate"
-        ])
-        
-        # Create a commit lookup for review comments
-        commit_cache = {}
-        for commit in commits:
-            commit_cache[commit['sha']] = commit['commit']['message'].split('\n')[0]
+        # Review comments are grouped by thread
+        review_threads = pending["reviewThreads"].result()
+        review_comments = [
+            comment
+            for thread in review_threads
+            for comment in (thread.get("comments") or {}).get("nodes") or []
+        ]
         
         for comment in review_comments:
             # Get commit info for review comments
-            commit_sha = comment.get("commit_id")
-            commit_msg = commit_cache.get(commit_sha)
-            
-            # Get reactions
-            reactions = self.get_comment_reactions(comment["id"], "review")
+            commit_sha = (comment.get("commit") or {}).get("oid")
+            commit_msg = commit_messages.get(commit_sha)
             
             comments.append(CommentData(
-                comment_id=comment["id"],
+                comment_id=comment["databaseId"],
                 comment_body=comment["body"],
-                reviewer=comment["user"]["login"],
-                timestamp=comment["created_at"],
+                reviewer=self._author(comment),
+                timestamp=comment["createdAt"],
                 preceding_commit=commit_sha,
                 preceding_commit_message=commit_msg,
                 file_path=comment.get("path"),
                 line_number=comment.get("line"),
                 comment_type="review",
-                html_url=comment["html_url"],
-                reactions=reactions
+                html_url=comment["url"],
+                reactions=self._parse_reactions(comment)
             ))
         
         print(f"Found {len(review_comments)} review comments")
@@ -205,23 +398,41 @@ class GitHubCommentParser:
         return comments
 
 
+def _json_default(obj: Any) -> Any:
+    """JSON ``default`` hook for comment dataclasses and reactor sets.
+    
+    CommentData fields are exposed without copying them; reactor sets are
+    written as sorted lists so the output is stable.
+    """
+    if isinstance(obj, CommentData):
+        return vars(obj)
+    if isinstance(obj, frozenset):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_comments_to_file(comments: List[CommentData], output_file: Path) -> None:
     """Save comments to a JSON file, sorted by timestamp in reverse order (newest first)."""
     output_file.parent.mkdir(exist_ok=True)
     
-    # Sort comments by timestamp in reverse order (newest first)
+    # Sort newest first; GitHub's ISO-8601 UTC strings sort chronologically as text
     sorted_comments = sorted(comments, key=lambda c: c.timestamp, reverse=True)
     
-    # Convert dataclasses to dicts for JSON serialization
-    comments_data = [asdict(comment) for comment in sorted_comments]
+    payload = {
+        "generated_at": datetime.now().isoformat(),
+        "total_comments": len(comments),
+        "sorted_by": "timestamp desc (newest first)",
+        "comments": sorted_comments
+    }
     
-    with open(output_file, 'w') as f:
-        json.dump({
-            "generated_at": datetime.now().isoformat(),
-            "total_comments": len(comments),
-            "sorted_by": "timestamp desc (newest first)",
-            "comments": comments_data
-        }, f, indent=2)
+    # Dataclasses are serialized field by field as they are written, so no
+    # intermediate list of dicts is built
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(payload, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(payload, f, indent=2, default=_json_default)
     
     print(f"Saved {len(comments)} comments to {output_file} (sorted newest first)")
 
@@ -257,8 +468,14 @@ def main():
     else:
         args.output = Path(args.output)
     
-    parser_tool = GitHubCommentParser(args.repo)
-    all_comments = parser_tool.get_pr_comments(args.pr)
+    try:
+        parser_tool = GitHubCommentParser(args.repo)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    with parser_tool:
+        all_comments = parser_tool.get_pr_comments(args.pr)
     
     # Filter by bot user if specified
     if args.bot:
@@ -39,6 +39,8 @@ CREATE TABLE IF NOT EXISTS embeddings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     post_id INTEGER NOT NULL,
     embedding_blob BLOB NOT NULL, -- Serialized vector embedding
+    dtype TEXT NOT NULL DEFAULT 'float32', -- NumPy element type of embedding_blob
+    scale REAL, -- Dequantization scale of an int8 embedding_blob
     model_name TEXT NOT NULL, -- e.g., 'sentence-transformers/all-MiniLM-L6-v2'
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
@@ -107,7 +109,6 @@ END;
 CREATE INDEX IF NOT EXISTS idx_posts_source_id ON posts(source_id);
 CREATE INDEX IF NOT EXISTS idx_posts_published_at ON posts(published_at);
 CREATE INDEX IF NOT EXISTS idx_posts_ingested_at ON posts(ingested_at);
-CREATE INDEX IF NOT EXISTS idx_posts_content_hash ON posts(content_hash);
 CREATE INDEX IF NOT EXISTS idx_embeddings_post_id ON embeddings(post_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_model_name ON embeddings(model_name);
 CREATE INDEX IF NOT EXISTS idx_sources_type ON sources(type);
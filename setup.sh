@@ -65,7 +65,7 @@ fi
 
 # Add main dependencies
 echo -e "${YELLOW}Adding main dependencies...${NC}"
-poetry add httpx tenacity feedparser sqlite-utils scikit-learn jinja2 pydantic pyyaml
+poetry add httpx feedparser sqlite-utils scikit-learn jinja2 pydantic pyyaml
 
 # Add development dependencies
 echo -e "${YELLOW}Adding development dependencies...${NC}"
@@ -13,9 +13,10 @@ CONNECTOR_REGISTRY: Dict[SourceType, Type[BaseConnector]] = {}
 
 def get_connector_class(source_type: SourceType) -> Type[BaseConnector]:
     """Factory method to get connector class by source type."""
-    if source_type not in CONNECTOR_REGISTRY:
+    connector_class = CONNECTOR_REGISTRY.get(source_type)
+    if connector_class is None:
         raise ValueError(f"No connector registered for source type: {source_type}")
-    return CONNECTOR_REGISTRY[source_type]
+    return connector_class
 
 
 def register_connector(source_type: SourceType, connector_class: Type[BaseConnector]) -> None:
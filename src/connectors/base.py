@@ -1,11 +1,12 @@
 """
 Base connector abstract class implementing Template Method Pattern.
 """
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, MutableMapping, Optional, Set, Tuple
 
 import httpx
 
@@ -13,16 +14,45 @@ from src.database import Database
 from src.models.post import Post
 from src.models.source import Source
 
+# Content longer than this (in characters) is hashed in a worker thread so a
+# single large item does not stall the event loop
+HASH_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+class SourceLoggerAdapter(logging.LoggerAdapter):
+    """Prefix log messages with the name of the source being fetched."""
+    
+    def process(
+        self, msg: Any, kwargs: MutableMapping[str, Any]
+    ) -> Tuple[Any, MutableMapping[str, Any]]:
+        """Add the source prefix; only runs for records that will be emitted."""
+        return f"[{self.extra['source']}] {msg}", kwargs  # type: ignore[index]
+
 
 class BaseConnector(ABC):
     """Abstract base class for content connectors implementing Template Method Pattern."""
     
+    # Normalized posts checked for duplicates and inserted per database round trip
+    batch_size: int = 50
+    
+    # One logger per connector class, shared by all of its instances
+    _class_logger: logging.Logger = logging.getLogger(__name__)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._class_logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+    
     def __init__(self, source: Source, db: Database, http_client: httpx.AsyncClient):
         """Initialize with source configuration, database connection, and shared HTTP client."""
         self.source = source
         self.db = db
         self.http_client = http_client
-        self.logger = logging.getLogger(f"{self.__class__.__name__}:{source.name}")
+        self.logger = SourceLoggerAdapter(self._class_logger, {'source': source.name})
+        # Connector-specific state for the next fetch (e.g. HTTP cache validators),
+        # filled in by fetch_raw_data and saved even when no new posts were stored
+        self.fetch_state_updates: Dict[str, Any] = {}
+        # Set when a batch could not be checked or inserted during the current run
+        self.storage_failed = False
         
     @abstractmethod
     def fetch_raw_data(
@@ -43,22 +73,66 @@ class BaseConnector(ABC):
         """Convert raw data to normalized Post model."""
         pass
         
-    def extract_fetch_state(self, post: Post) -> Dict[str, Any]:
+    def extract_fetch_state(
+        self, post: Post, fetched_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Extract fetch state from a processed post for incremental fetching.
         Override in subclasses for source-specific state extraction.
         
         Args:
             post: Processed post object
+            fetched_at: ISO-8601 timestamp of the run, stamped once by run();
+                        the current time is used when omitted
             
         Returns:
             State dictionary for next fetch
         """
         return {
             'last_seen_id': post.source_guid or post.url,
-            'last_fetch_timestamp': datetime.utcnow().isoformat()
+            'last_fetch_timestamp': fetched_at or datetime.utcnow().isoformat()
         }
     
+    async def _store_batch(self, posts: List[Post], stats: Dict[str, int]) -> Optional[Post]:
+        """
+        Check a batch of posts for duplicates in one query and insert the new ones.
+        
+        Args:
+            posts: Normalized posts with content hashes unique within the run,
+                   in feed order
+            stats: Run statistics, updated in place
+            
+        Returns:
+            The last post inserted, or None if nothing was inserted
+        """
+        try:
+            existing = await self.db.filter_existing_hashes(
+                [post.content_hash for post in posts if post.content_hash is not None]
+            )
+        except Exception as e:
+            self.logger.error("Error checking batch of %d items: %s", len(posts), e)
+            stats['error'] += len(posts)
+            self.storage_failed = True
+            return None
+        
+        # Skip posts already stored
+        new_posts = [post for post in posts if post.content_hash not in existing]
+        stats['duplicate'] += len(posts) - len(new_posts)
+        
+        if not new_posts:
+            return None
+        
+        try:
+            await self.db.insert_posts_many(new_posts)
+        except Exception as e:
+            self.logger.error("Error inserting batch of %d posts: %s", len(new_posts), e)
+            stats['error'] += len(new_posts)
+            self.storage_failed = True
+            return None
+        
+        stats['new'] += len(new_posts)
+        return new_posts[-1]
+    
     async def run(self) -> Dict[str, int]:
         """
         Execute fetch operation with standardized orchestration.
@@ -81,9 +155,17 @@ class BaseConnector(ABC):
             if self.source.id is None:
                 raise ValueError("Source ID cannot be None")
             fetch_state = await self.db.get_source_fetch_state(self.source.id)
+            fetched_at = datetime.utcnow().isoformat()
+            self.fetch_state_updates = {}
+            self.storage_failed = False
             
             # 2. Fetch raw data with incremental support
             last_processed_post = None
+            pending: List[Post] = []
+            # Items repeated within this fetch are skipped before hashing (by GUID)
+            # and before the database check (by content hash)
+            seen_guids: Set[str] = set()
+            seen_hashes: Set[str] = set()
             async for raw_item in self.fetch_raw_data(fetch_state):
                 stats['fetched'] += 1
                 
@@ -92,36 +174,61 @@ class BaseConnector(ABC):
                     post = self.normalize_to_post(raw_item)
                     if not post:
                         continue
+                    
+                    if post.source_guid:
+                        if post.source_guid in seen_guids:
+                            stats['duplicate'] += 1
+                            continue
+                        seen_guids.add(post.source_guid)
                         
                     # 4. Set source_id and generate composite hash
                     if self.source.id is None:
                         raise ValueError("Source ID cannot be None")
                     post.source_id = self.source.id
-                    post.content_hash = Post.generate_content_hash(
-                        post.source_id, post.content, post.url, post.source_guid
-                    )
-                    
-                    # 5. Check for duplicates
-                    if await self.db.post_exists_by_hash(post.content_hash):
-                        stats['duplicate'] += 1
-                        continue
-                        
-                    # 6. Insert new post
-                    await self.db.insert_post(post)
-                    stats['new'] += 1
-                    last_processed_post = post
+                    hash_args = (post.source_id, post.content, post.url, post.source_guid)
+                    if len(post.content) > HASH_OFFLOAD_THRESHOLD:
+                        content_hash = await asyncio.to_thread(
+                            Post.generate_content_hash, *hash_args
+                        )
+                    else:
+                        content_hash = Post.generate_content_hash(*hash_args)
+                    post.content_hash = content_hash
                     
                 except Exception as e:
-                    self.logger.error(f"Error processing item: {e}")
+                    self.logger.error("Error processing item: %s", e)
                     stats['error'] += 1
+                    continue
+                
+                # 5-6. Deduplicate and insert in batches
+                if content_hash in seen_hashes:
+                    stats['duplicate'] += 1
+                    continue
+                seen_hashes.add(content_hash)
+                pending.append(post)
+                if len(pending) >= self.batch_size:
+                    stored = await self._store_batch(pending, stats)
+                    last_processed_post = stored or last_processed_post
+                    pending = []
+            
+            if pending:
+                stored = await self._store_batch(pending, stats)
+                last_processed_post = stored or last_processed_post
                     
-            # 7. Update fetch state if we processed any items
-            if last_processed_post and self.source.id is not None:
-                new_state = self.extract_fetch_state(last_processed_post)
+            # 7. Update fetch state if we processed any items or the connector
+            # has state of its own to carry forward. If any posts failed to store,
+            # the connector's state (e.g. cache validators) is dropped so the next
+            # run fetches them again instead of being told nothing changed.
+            state_updates = {} if self.storage_failed else self.fetch_state_updates
+            if (last_processed_post or state_updates) and self.source.id is not None:
+                if last_processed_post:
+                    new_state = self.extract_fetch_state(last_processed_post, fetched_at)
+                else:
+                    new_state = dict(fetch_state or {})
+                new_state.update(state_updates)
                 await self.db.update_source_fetch_state(self.source.id, new_state)
                 
         except Exception as e:
-            self.logger.error(f"Fatal error in connector run: {type(e).__name__} - {e}")
+            self.logger.error("Fatal error in connector run: %s - %s", type(e).__name__, e)
             raise
             
         return stats
\ No newline at end of file
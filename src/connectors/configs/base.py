@@ -3,12 +3,16 @@ Base configuration class for all connectors.
 """
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseConnectorConfig(BaseModel):
     """Base configuration for all connector types."""
     
+    # Fail if unknown fields are provided; frozen so a validated config can be
+    # shared and reused across runs
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     enabled: bool = Field(default=True, description="Whether this connector is enabled")
     fetch_interval_minutes: int = Field(default=60, description="How often to fetch new content")
     max_items_per_fetch: Optional[int] = Field(
@@ -19,6 +23,3 @@ class BaseConnectorConfig(BaseModel):
     custom_headers: Optional[Dict[str, str]] = Field(
         default=None, description="Custom HTTP headers"
     )
-    
-    class Config:
-        extra = "forbid"  # Fail if unknown fields are provided
\ No newline at end of file
@@ -1,7 +1,11 @@
 """
 RSS-specific configuration.
 """
-from typing import List, Optional
+from typing import Any, List, Optional
+
+from pydantic import PrivateAttr
+
+from src.connectors.keywords import KeywordMatcher
 
 from .base import BaseConnectorConfig
 
@@ -11,4 +15,25 @@ class RSSConfig(BaseConnectorConfig):
     
     parse_full_content: bool = False
     filter_keywords: Optional[List[str]] = None
-    exclude_keywords: Optional[List[str]] = None
\ No newline at end of file
+    exclude_keywords: Optional[List[str]] = None
+    
+    # Keyword filters compiled (lowercased, automaton built) once per config
+    _include_matcher: Optional[KeywordMatcher] = PrivateAttr(default=None)
+    _exclude_matcher: Optional[KeywordMatcher] = PrivateAttr(default=None)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the keyword filters."""
+        if self.filter_keywords:
+            self._include_matcher = KeywordMatcher(self.filter_keywords)
+        if self.exclude_keywords:
+            self._exclude_matcher = KeywordMatcher(self.exclude_keywords)
+    
+    @property
+    def include_matcher(self) -> Optional[KeywordMatcher]:
+        """Matcher for filter_keywords, or None if no include filter is set."""
+        return self._include_matcher
+    
+    @property
+    def exclude_matcher(self) -> Optional[KeywordMatcher]:
+        """Matcher for exclude_keywords, or None if no exclude filter is set."""
+        return self._exclude_matcher
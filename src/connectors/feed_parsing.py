@@ -0,0 +1,268 @@
+"""
+Fast RSS 2.0/Atom parsing on top of lxml's incremental parser.
+
+feedparser stays the reference parser: this module only handles documents
+that parse cleanly as RSS 2.0 or Atom XML and returns None for anything else
+(including when lxml is not installed) so callers can fall back to it.
+Entries are returned as plain dicts using feedparser's key names, and text
+values are cleaned up with feedparser's own helpers so both paths produce the
+same post content (and so the same content hashes).
+"""
+import time
+from datetime import datetime, timezone
+from email.utils import mktime_tz, parsedate_tz
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from lxml import etree  # type: ignore[import-untyped,import-not-found]
+except ImportError:
+    etree = None
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+# Bytes fed to the parser at a time; lets parsing stop early once enough
+# entries have been read
+CHUNK_SIZE = 64 * 1024
+
+ParsedFeed = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
+
+class _Unsupported(Exception):
+    """Raised for markup this module does not reproduce; the caller falls back to feedparser."""
+
+
+_Helpers = Tuple[Callable[..., str], Callable[[str], bool], Dict[int, str]]
+
+
+@lru_cache(maxsize=None)
+def _import_feedparser_helpers() -> Optional[_Helpers]:
+    """Import feedparser's sanitizer, HTML sniffing and cp1252 table, or None if they moved."""
+    try:
+        from feedparser.html import _cp1252  # type: ignore[import-untyped]
+        from feedparser.mixin import _FeedParserMixin  # type: ignore[import-untyped]
+        from feedparser.sanitizer import _sanitize_html  # type: ignore[import-untyped]
+
+        return _sanitize_html, _FeedParserMixin.looks_like_html, _cp1252
+    except (ImportError, AttributeError):
+        return None
+
+
+def _feedparser_helpers() -> _Helpers:
+    """
+    Return feedparser's private text helpers.
+
+    These are feedparser internals; if a feedparser release renames them the
+    document is left to feedparser.parse rather than failing here.
+    """
+    helpers = _import_feedparser_helpers()
+    if helpers is None:
+        raise _Unsupported("feedparser helpers unavailable")
+    return helpers
+
+
+def _finish(value: str, html: Optional[bool]) -> str:
+    """
+    Clean up a text value the way feedparser does before storing it.
+
+    Args:
+        value: Element text
+        html: Whether the value is HTML to sanitize; None guesses from the value
+    """
+    value = value.strip()
+    if "<" in value or "&" in value:
+        sanitize_html, looks_like_html, _ = _feedparser_helpers()
+        if html or (html is None and looks_like_html(value)):
+            value = sanitize_html(value, "utf-8", "text/html")
+    if not value.isascii():
+        _, _, cp1252 = _feedparser_helpers()
+        # Undo UTF-8 that the publisher decoded as ISO-8859-1
+        try:
+            value = value.encode("iso-8859-1").decode("utf-8")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+        value = value.translate(cp1252)
+    return value
+
+
+def _atom_is_html(elem: Any) -> bool:
+    """Return whether an Atom text construct holds HTML, from its type attribute."""
+    content_type = elem.get("type", "text")
+    if content_type in ("xhtml", "application/xhtml+xml"):
+        raise _Unsupported("inline XHTML")
+    return content_type in ("html", "text/html")
+
+
+def _text(elem: Any) -> str:
+    """Return an element's text; inline markup (e.g. XHTML content) is left to feedparser."""
+    if len(elem):
+        raise _Unsupported("inline markup")
+    return elem.text or ""
+
+
+def _parse_rfc822(value: str) -> Optional[time.struct_time]:
+    """Parse an RSS date into a UTC struct_time, as feedparser does."""
+    parsed = parsedate_tz(value.strip())
+    if parsed is None:
+        return None
+    try:
+        return time.gmtime(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
+
+def _parse_iso8601(value: str) -> Optional[time.struct_time]:
+    """Parse an Atom date into a UTC struct_time, as feedparser does."""
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.utctimetuple()
+
+
+def _rss_entry(item: Any) -> Dict[str, Any]:
+    """Build a feedparser-style entry from an RSS <item>."""
+    entry: Dict[str, Any] = {}
+    guid_is_link = False
+    for child in item:
+        tag = child.tag
+        if tag == "title":
+            entry["title"] = _finish(_text(child), None)
+        elif tag == "link":
+            entry["link"] = _text(child).strip()
+        elif tag == "guid":
+            entry["id"] = entry["guid"] = _text(child).strip()
+            guid_is_link = child.get("isPermaLink", "true") == "true"
+        elif tag == "description":
+            entry["summary"] = _finish(_text(child), True)
+        elif tag == CONTENT_NS + "encoded":
+            entry["content"] = [{"value": _finish(_text(child), True)}]
+        elif tag == "pubDate":
+            # feedparser also exposes an RSS pubDate as the updated date
+            entry["published_parsed"] = entry["updated_parsed"] = _parse_rfc822(_text(child))
+        elif tag == "author" or tag == DC_NS + "creator":
+            entry.setdefault("author", _text(child).strip())
+        elif tag == "category":
+            entry.setdefault("tags", []).append({"term": _text(child).strip()})
+    # Like feedparser, a permalink guid stands in for a missing <link>
+    if guid_is_link and "link" not in entry:
+        entry["link"] = entry["guid"]
+    return entry
+
+
+def _atom_entry(item: Any) -> Dict[str, Any]:
+    """Build a feedparser-style entry from an Atom <entry>."""
+    entry: Dict[str, Any] = {}
+    for child in item:
+        tag = child.tag
+        if tag == ATOM_NS + "title":
+            entry["title"] = _finish(_text(child), _atom_is_html(child))
+        elif tag == ATOM_NS + "link":
+            if child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = child.get("href")
+        elif tag == ATOM_NS + "id":
+            entry["id"] = entry["guid"] = _text(child).strip()
+        elif tag == ATOM_NS + "summary":
+            entry["summary"] = _finish(_text(child), _atom_is_html(child))
+        elif tag == ATOM_NS + "content":
+            entry["content"] = [{"value": _finish(_text(child), _atom_is_html(child))}]
+        elif tag == ATOM_NS + "published":
+            entry["published_parsed"] = _parse_iso8601(_text(child))
+        elif tag == ATOM_NS + "updated":
+            entry["updated_parsed"] = _parse_iso8601(_text(child))
+        elif tag == ATOM_NS + "author":
+            name = child.findtext(ATOM_NS + "name")
+            if name:
+                entry["author"] = name.strip()
+        elif tag == ATOM_NS + "category":
+            term = child.get("term")
+            if term:
+                entry.setdefault("tags", []).append({"term": term})
+    return entry
+
+
+def _read_events(parser: Any, content: bytes) -> Iterator[Tuple[str, Any]]:
+    """Feed the document in chunks, yielding parse events as they become available."""
+    for offset in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[offset:offset + CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+# Root tag -> (feed-level parent tag, entry tag, title tag, link tag, entry builder)
+_FORMATS = {
+    "rss": ("channel", "item", "title", "link", _rss_entry),
+    ATOM_NS + "feed": (
+        ATOM_NS + "feed", ATOM_NS + "entry", ATOM_NS + "title", ATOM_NS + "link", _atom_entry
+    ),
+}
+
+
+def parse_feed(content: bytes, max_items: Optional[int] = None) -> Optional[ParsedFeed]:
+    """
+    Parse an RSS 2.0 or Atom document, stopping after max_items entries.
+
+    Each entry element is freed as soon as it has been converted, so memory
+    stays flat on large feeds.
+
+    Args:
+        content: Raw feed document; the encoding is taken from its XML declaration
+        max_items: Stop after this many entries (None or 0 reads them all)
+
+    Returns:
+        (feed_info, entries), or None if lxml is unavailable or the document
+        is not well-formed RSS 2.0/Atom, or uses xml:base or inline markup,
+        and should go through feedparser
+    """
+    # xml:base changes how feedparser resolves relative links in the markup
+    if etree is None or b"xml:base" in content:
+        return None
+
+    parser = etree.XMLPullParser(
+        events=("start", "end"), resolve_entities=False, no_network=True
+    )
+    feed_format = None
+    feed_info: Dict[str, Any] = {}
+    entries: List[Dict[str, Any]] = []
+
+    try:
+        for event, elem in _read_events(parser, content):
+            if feed_format is None:
+                # First event is the root element's start
+                feed_format = _FORMATS.get(elem.tag)
+                if feed_format is None:
+                    return None
+                continue
+            if event != "end":
+                continue
+
+            parent_tag, entry_tag, title_tag, link_tag, build_entry = feed_format
+            if elem.tag == entry_tag:
+                entries.append(build_entry(elem))
+                # Free the converted entry and everything before it
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                if max_items and len(entries) >= max_items:
+                    return feed_info, entries
+            elif elem.getparent() is not None and elem.getparent().tag == parent_tag:
+                if elem.tag == title_tag:
+                    html = _atom_is_html(elem) if elem.tag.startswith(ATOM_NS) else None
+                    feed_info["title"] = _finish(_text(elem), html)
+                elif (
+                    elem.tag == link_tag
+                    and "link" not in feed_info
+                    and elem.get("rel", "alternate") == "alternate"
+                ):
+                    feed_info["link"] = elem.get("href") or _text(elem).strip()
+    except (etree.XMLSyntaxError, _Unsupported):
+        return None
+
+    if feed_format is None:
+        return None
+    return feed_info, entries
@@ -0,0 +1,51 @@
+"""
+Multi-keyword substring matching for connector filters.
+"""
+from collections.abc import Iterable
+
+try:
+    import ahocorasick  # type: ignore[import-untyped,import-not-found]
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive test for whether text contains any of a set of keywords.
+
+    With pyahocorasick installed the keywords are compiled into one
+    Aho-Corasick automaton, so each check is a single pass over the text
+    instead of one substring scan per keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the keywords.
+
+        Args:
+            keywords: Keywords to look for; matching ignores case
+        """
+        self.keywords = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+        # An empty keyword is contained in every text
+        self._matches_everything = "" in self.keywords
+        self._automaton = None
+
+        if ahocorasick is not None and self.keywords and not self._matches_everything:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def matches(self, text: str) -> bool:
+        """
+        Return True if text contains any keyword.
+
+        Args:
+            text: Text to search, already lowercased by the caller
+        """
+        if self._matches_everything:
+            return True
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
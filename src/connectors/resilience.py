@@ -1,19 +1,14 @@
 """
 Resilience patterns for connectors including retry logic and circuit breakers.
 """
+import asyncio
+import inspect
 import logging
 import time
+from collections.abc import Awaitable
 from functools import wraps
 from typing import Any, Callable, Optional, TypeVar, cast
 
-from tenacity import (
-    RetryCallState,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
-
 from src.connectors.exceptions import NetworkError, RateLimitError
 
 logger = logging.getLogger(__name__)
@@ -21,47 +16,90 @@ logger = logging.getLogger(__name__)
 # Type variable for decorated functions
 F = TypeVar('F', bound=Callable[..., Any])
 
+DEFAULT_RETRY_AFTER = 60
 
-def get_retry_after(retry_state: RetryCallState) -> int:
+
+def get_retry_after(error: BaseException) -> int:
     """Extract retry_after value from RateLimitError."""
-    if retry_state.outcome and retry_state.outcome.failed:
-        exception = retry_state.outcome.exception()
-        if isinstance(exception, RateLimitError) and exception.retry_after:
-            return exception.retry_after
-    return 60  # Default to 60 seconds
+    if isinstance(error, RateLimitError) and error.retry_after:
+        return error.retry_after
+    return DEFAULT_RETRY_AFTER
 
 
-# Network retry decorator - exponential backoff for network errors
-network_retry = retry(
-    retry=retry_if_exception_type(NetworkError),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10),
-    before_sleep=lambda retry_state: logger.warning(
-        f"Network error, retrying in "
-        f"{retry_state.next_action.sleep if retry_state.next_action else 0} seconds..."
-    )
-)
+def _retry(
+    exception_type: type[Exception],
+    attempts: int,
+    wait: Callable[[Exception, int], float],
+    before_sleep: Callable[[float], None],
+) -> Callable[[F], F]:
+    """
+    Build a retry decorator for sync and async functions.
+    
+    Args:
+        exception_type: Exception that triggers a retry (others propagate)
+        attempts: Total number of attempts, including the first call
+        wait: Returns the delay in seconds given the error and attempt number
+        before_sleep: Called with the delay before each retry
+        
+    The last error is re-raised once attempts are exhausted. The success
+    path is a plain call with no per-call retry state.
+    """
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                attempt = 1
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exception_type as e:
+                        if attempt >= attempts:
+                            raise
+                        delay = wait(e, attempt)
+                        before_sleep(delay)
+                        await asyncio.sleep(delay)
+                        attempt += 1
+            return cast(F, async_wrapper)
+        
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            attempt = 1
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except exception_type as e:
+                    if attempt >= attempts:
+                        raise
+                    delay = wait(e, attempt)
+                    before_sleep(delay)
+                    time.sleep(delay)
+                    attempt += 1
+        return cast(F, wrapper)
+    return decorator
 
 
-class WaitForRateLimit:
-    """Custom wait strategy that respects rate limit retry-after values."""
-    
-    def __call__(self, retry_state: RetryCallState) -> float:
-        """Return the number of seconds to wait based on retry-after header."""
-        return float(get_retry_after(retry_state))
+def _network_backoff(error: Exception, attempt: int) -> float:
+    """Exponential backoff (1, 2, 4... seconds) clamped to the 4-10 second range."""
+    return float(min(max(2 ** (attempt - 1), 4), 10))
 
 
+# Network retry decorator - exponential backoff for network errors
+network_retry = _retry(
+    NetworkError,
+    attempts=3,
+    wait=_network_backoff,
+    before_sleep=lambda delay: logger.warning(
+        f"Network error, retrying in {delay:g} seconds..."
+    ),
+)
+
 # Rate limit retry decorator - respects retry-after header
-def rate_limit_retry(func: F) -> F:
-    """Retry decorator that respects rate limit retry-after values."""
-    return retry(
-        retry=retry_if_exception_type(RateLimitError),
-        stop=stop_after_attempt(2),  # Try once more after rate limit
-        wait=WaitForRateLimit(),
-        before_sleep=lambda retry_state: logger.info(
-            f"Rate limited, waiting {get_retry_after(retry_state)} seconds..."
-        )
-    )(func)
+rate_limit_retry = _retry(
+    RateLimitError,
+    attempts=2,  # Try once more after rate limit
+    wait=lambda error, attempt: float(get_retry_after(error)),
+    before_sleep=lambda delay: logger.info(f"Rate limited, waiting {delay:g} seconds..."),
+)
 
 
 class CircuitBreaker:
@@ -78,11 +116,22 @@ class CircuitBreaker:
     OPEN = "open"
     HALF_OPEN = "half_open"
     
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "expected_exception",
+        "failure_count",
+        "last_failure_time",
+        "state",
+        "time_source",
+    )
+    
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
         expected_exception: type[Exception] = Exception,
+        time_source: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize circuit breaker.
@@ -91,6 +140,7 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before attempting recovery
             expected_exception: Exception type to catch (others pass through)
+            time_source: Clock returning seconds, used to time the recovery timeout
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
@@ -98,12 +148,40 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time: Optional[float] = None
         self.state = self.CLOSED
+        self.time_source = time_source
         
     def __call__(self, func: F) -> F:
-        """Decorator to protect function calls with circuit breaker."""
+        """
+        Decorator to protect function calls with circuit breaker.
+        
+        Coroutine functions get an async wrapper so the breaker records the
+        awaited outcome rather than the creation of the coroutine. The
+        wrappers inline call()/acall() so each call avoids building a lambda
+        and an extra frame.
+        """
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                self._before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    self._on_exception(e)
+                    raise
+                self._on_success()
+                return result
+            return cast(F, async_wrapper)
+        
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return self.call(lambda: func(*args, **kwargs))
+            self._before_call()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._on_exception(e)
+                raise
+            self._on_success()
+            return result
         return cast(F, wrapper)
     
     def call(self, func: Callable[[], Any]) -> Any:
@@ -119,43 +197,67 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
-        if self.state == self.OPEN:
-            if self._should_attempt_reset():
+        self._before_call()
+        try:
+            result = func()
+        except Exception as e:
+            self._on_exception(e)
+            raise
+        self._on_success()
+        return result
+    
+    async def acall(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+        
+        Args:
+            func: Zero-argument callable returning an awaitable
+            
+        Returns:
+            Awaited result
+            
+        Raises:
+            Exception: If circuit is open or the awaitable fails
+        """
+        self._before_call()
+        try:
+            result = await func()
+        except Exception as e:
+            self._on_exception(e)
+            raise
+        self._on_success()
+        return result
+    
+    def _before_call(self) -> None:
+        """Reject the call while OPEN, or move to HALF_OPEN once recovery is due."""
+        if self.state is self.OPEN:
+            # Reset check inlined so the CLOSED path is a single comparison
+            if (
+                self.last_failure_time is not None
+                and self.time_source() - self.last_failure_time >= self.recovery_timeout
+            ):
                 self.state = self.HALF_OPEN
                 logger.info("Circuit breaker transitioning to HALF_OPEN state for recovery attempt")
             else:
                 raise Exception(f"Circuit breaker is OPEN (failures: {self.failure_count})")
-        
-        try:
-            result = func()
-            self._on_success()
-            return result
-        except self.expected_exception as e:
-            self._on_failure()
-            raise e
-        except Exception as e:
-            # For unexpected exceptions, ensure state is properly handled
-            if self.state == self.HALF_OPEN:
-                # Treat unexpected exceptions as failures during recovery
-                self._on_failure()
-            raise e
     
-    def _should_attempt_reset(self) -> bool:
-        """Check if enough time has passed to attempt reset."""
-        return (
-            self.last_failure_time is not None
-            and time.time() - self.last_failure_time >= self.recovery_timeout
-        )
+    def _on_exception(self, error: Exception) -> None:
+        """Record a failure for expected exceptions, or for any exception during recovery."""
+        if isinstance(error, self.expected_exception) or self.state is self.HALF_OPEN:
+            self._on_failure()
     
     def _on_success(self) -> None:
         """Reset failure count on success."""
-        self.failure_count = 0
-        self.state = self.CLOSED
+        # Steady state is CLOSED with no failures; skip redundant writes
+        if self.failure_count:
+            self.failure_count = 0
+        if self.state is not self.CLOSED:
+            self.state = self.CLOSED
     
     def _on_failure(self) -> None:
         """Increment failure count and possibly open circuit."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = self.time_source()
         
         if self.failure_count >= self.failure_threshold:
             self.state = self.OPEN
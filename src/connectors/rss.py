@@ -1,35 +1,58 @@
 """
 RSS/Atom feed connector implementation.
 """
+from calendar import timegm
 from collections.abc import AsyncGenerator
-from datetime import datetime
-from time import mktime
-from typing import Any, Dict, Optional, cast
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-import feedparser  # type: ignore[import-untyped]
 import httpx
 
 from src.connectors import register_connector
 from src.connectors.base import BaseConnector
 from src.connectors.configs.rss import RSSConfig
 from src.connectors.exceptions import NetworkError, ParseError
+from src.connectors.feed_parsing import parse_feed
 from src.connectors.resilience import network_retry
 from src.models.post import Post
 from src.models.source import SourceType
 
+# fetch_state key, response header and conditional request header for each
+# HTTP cache validator
+CACHE_VALIDATORS = (
+    ('etag', 'ETag', 'If-None-Match'),
+    ('last_modified', 'Last-Modified', 'If-Modified-Since'),
+)
+
 
 class RSSConnector(BaseConnector):
     """Connector for RSS/Atom feeds."""
     
     @network_retry
-    async def _fetch_feed(self, url: str, config: RSSConfig) -> str:
-        """Fetch feed content with retry logic."""
+    async def _fetch_feed(
+        self, url: str, config: RSSConfig, fetch_state: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
+        """
+        Fetch the raw feed document with retry logic.
+
+        The body is returned undecoded: both parsers detect the encoding from
+        the XML declaration themselves, so decoding it here would only add a
+        full-size str copy that feedparser then re-encodes.
+        
+        Cache validators saved from the previous fetch are sent as a conditional
+        GET. Returns None when the server answers 304 Not Modified; otherwise
+        the response's validators are queued in fetch_state_updates.
+        """
         try:
             # Ensure User-Agent header is present (some feeds block requests without it)
             headers = {
                 'User-Agent': 'Daily Intelligence Report RSS Reader/1.0',
                 **(config.custom_headers or {})
             }
+            if fetch_state:
+                for state_key, _, request_header in CACHE_VALIDATORS:
+                    if fetch_state.get(state_key):
+                        headers[request_header] = fetch_state[state_key]
             
             response = await self.http_client.get(
                 url,
@@ -37,8 +60,15 @@ class RSSConnector(BaseConnector):
                 headers=headers,
                 follow_redirects=True
             )
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return None
             response.raise_for_status()
-            return response.text
+            
+            for state_key, response_header, _ in CACHE_VALIDATORS:
+                value = response.headers.get(response_header)
+                if value:
+                    self.fetch_state_updates[state_key] = value
+            return response.content
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error fetching {url}: {e}") from e
         except httpx.TimeoutException as e:
@@ -52,16 +82,14 @@ class RSSConnector(BaseConnector):
                 f"HTTP {e.response.status_code} error fetching {url}"
             ) from e
     
-    async def fetch_raw_data(
-        self, fetch_state: Optional[Dict[str, Any]] = None
-    ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Fetch and parse RSS feed entries."""
-        config = cast(RSSConfig, self.source.typed_config)
-        
-        # Fetch feed with retry logic
-        feed_content = await self._fetch_feed(self.source.identifier, config)
-        
-        # Parse with feedparser
+    def _parse_with_feedparser(
+        self, feed_content: bytes, config: RSSConfig
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Parse with feedparser, which tolerates malformed and legacy feeds."""
+        # Imported on first fallback only: most feeds take the lxml path, and
+        # importing feedparser compiles a large set of regexes
+        import feedparser  # type: ignore[import-untyped]
+
         feed = feedparser.parse(feed_content)
         
         # Check for parsing errors
@@ -73,16 +101,40 @@ class RSSConnector(BaseConnector):
                 )
             # Otherwise just log a warning and continue
             self.logger.warning(
-                f"Feed parsing warning for {self.source.identifier}: {feed.bozo_exception}"
+                "Feed parsing warning for %s: %s", self.source.identifier, feed.bozo_exception
             )
         
-        # Handle incremental fetching
-        last_seen_guid = fetch_state.get('last_seen_id') if fetch_state else None
-        
         # Get entries, limiting to max_items_per_fetch
         entries = feed.entries
         if config.max_items_per_fetch:
             entries = entries[:config.max_items_per_fetch]
+        return feed.feed, entries
+    
+    async def fetch_raw_data(
+        self, fetch_state: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Fetch and parse RSS feed entries."""
+        config = cast(RSSConfig, self.source.typed_config)
+        
+        # Fetch feed with retry logic; None means unchanged since the last fetch
+        feed_content = await self._fetch_feed(self.source.identifier, config, fetch_state)
+        if feed_content is None:
+            self.logger.debug("Feed not modified since last fetch")
+            return
+        
+        # Fast path for well-formed RSS 2.0/Atom; stops after max_items_per_fetch
+        parsed = parse_feed(feed_content, config.max_items_per_fetch)
+        if parsed is not None:
+            feed_info, entries = parsed
+        else:
+            feed_info, entries = self._parse_with_feedparser(feed_content, config)
+        
+        # Handle incremental fetching
+        last_seen_guid = fetch_state.get('last_seen_id') if fetch_state else None
+        
+        # Keyword filters are compiled once when the config is validated
+        include_matcher = config.include_matcher
+        exclude_matcher = config.exclude_matcher
         
         # Process entries
         for entry in entries:
@@ -93,28 +145,26 @@ class RSSConnector(BaseConnector):
                     break
             
             # Apply keyword filters if configured
-            if config.filter_keywords or config.exclude_keywords:
-                # Combine title and summary/content for filtering
-                filter_text = entry.get('title', '') + ' ' + entry.get('summary', '')
+            if include_matcher or exclude_matcher:
+                # Combine title and summary/content for filtering with a single
+                # join and a single lowercase pass
+                parts = [entry.get('title', ''), entry.get('summary', '')]
                 if 'content' in entry and entry.get('content'):
-                    filter_text += ' ' + entry['content'][0].get('value', '')
-                
-                filter_text = filter_text.lower()
+                    parts.append(entry['content'][0].get('value', ''))
+                filter_text = ' '.join(parts).lower()
                 
                 # Check filter keywords (must contain at least one)
-                if config.filter_keywords:
-                    if not any(kw.lower() in filter_text for kw in config.filter_keywords):
-                        continue
+                if include_matcher and not include_matcher.matches(filter_text):
+                    continue
                 
                 # Check exclude keywords (must not contain any)
-                if config.exclude_keywords:
-                    if any(kw.lower() in filter_text for kw in config.exclude_keywords):
-                        continue
+                if exclude_matcher and exclude_matcher.matches(filter_text):
+                    continue
             
             # Yield entry with feed info
             yield {
                 'entry': entry,
-                'feed_info': feed.feed
+                'feed_info': feed_info
             }
     
     def normalize_to_post(self, raw_data: Dict[str, Any]) -> Optional[Post]:
@@ -147,18 +197,17 @@ class RSSConnector(BaseConnector):
             url = entry.get('link')
             
             # Extract published date
+            # (feedparser's parsed dates are UTC struct_times)
             published_at = None
-            if 'published_parsed' in entry and entry['published_parsed']:
-                try:
-                    published_at = datetime.fromtimestamp(mktime(entry['published_parsed']))
-                except (ValueError, OverflowError):
-                    pass
-            
-            if not published_at and 'updated_parsed' in entry and entry['updated_parsed']:
-                try:
-                    published_at = datetime.fromtimestamp(mktime(entry['updated_parsed']))
-                except (ValueError, OverflowError):
-                    pass
+            for date_key in ('published_parsed', 'updated_parsed'):
+                if entry.get(date_key):
+                    try:
+                        published_at = datetime.fromtimestamp(
+                            timegm(entry[date_key]), tz=timezone.utc
+                        )
+                        break
+                    except (ValueError, OverflowError):
+                        pass
             
             # Extract GUID (prefer id over guid over link)
             source_guid = entry.get('id') or entry.get('guid') or url
@@ -171,8 +220,9 @@ class RSSConnector(BaseConnector):
             }
             
             # Add tags if present
-            if 'tags' in entry and entry['tags']:
-                metadata['tags'] = [tag.get('term', '') for tag in entry['tags'] if tag.get('term')]
+            terms = [term for term in (tag.get('term') for tag in entry.get('tags') or ()) if term]
+            if terms:
+                metadata['tags'] = terms
             
             # Create Post instance
             if self.source.id is None:
@@ -189,7 +239,7 @@ class RSSConnector(BaseConnector):
             )
             
         except Exception as e:
-            self.logger.error(f"Error normalizing RSS entry: {e}")
+            self.logger.error("Error normalizing RSS entry: %s", e)
             return None
 
 
@@ -0,0 +1,88 @@
+"""
+Concurrent execution of connectors over a shared HTTP client.
+"""
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, List, Sequence, Union
+
+import httpx
+
+from src.connectors import get_connector_class
+from src.database import Database
+from src.models.source import Source
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of connectors fetching at the same time
+DEFAULT_CONCURRENCY = 8
+
+# HTTP/2 needs the optional h2 package; without it httpx falls back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RunResult = Union[Dict[str, int], BaseException]
+
+
+def create_http_client(
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+    timeout_seconds: float = 30.0,
+) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client shared by every connector in a run.
+
+    Connections are kept alive between sources, and with HTTP/2 requests to
+    the same host are multiplexed over a single connection.
+
+    Args:
+        max_connections: Upper bound on open connections across all hosts
+        max_keepalive_connections: Idle connections kept for reuse
+        timeout_seconds: Default timeout; connectors may override per request
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=httpx.Timeout(timeout_seconds),
+    )
+
+
+async def run_connectors(
+    sources: Sequence[Source],
+    db: Database,
+    http_client: httpx.AsyncClient,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[RunResult]:
+    """
+    Run the connector for each source concurrently.
+
+    Wall-clock time becomes roughly that of the slowest feeds rather than the
+    sum of all of them, while the semaphore caps how many fetch at once.
+
+    Args:
+        sources: Sources to fetch
+        db: Database shared by all connectors
+        http_client: Client shared by all connectors (see create_http_client)
+        concurrency: Maximum number of connectors running at the same time
+
+    Returns:
+        One entry per source, in order: the run statistics, or the exception
+        that connector raised. One failing source does not cancel the others.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(source: Source) -> Dict[str, int]:
+        connector = get_connector_class(source.type)(source, db, http_client)
+        async with semaphore:
+            return await connector.run()
+
+    results = await asyncio.gather(
+        *(run_one(source) for source in sources), return_exceptions=True
+    )
+
+    for source, result in zip(sources, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("Connector for %s failed: %s", source.name, result)
+    return results
@@ -2,11 +2,16 @@
 Database interface for connectors.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections.abc import Collection, Sequence
+from typing import Any, Dict, List, Optional, Set
 
 from src.models.post import Post
 from src.models.source import Source
 
+# Bound on bound parameters per statement; stays under SQLite's historical
+# SQLITE_MAX_VARIABLE_NUMBER default of 999
+MAX_QUERY_PARAMETERS = 500
+
 
 class Database(ABC):
     """Abstract database interface."""
@@ -16,11 +21,35 @@ class Database(ABC):
         """Check if a post with the given content hash already exists."""
         pass
     
+    async def filter_existing_hashes(self, content_hashes: Collection[str]) -> Set[str]:
+        """
+        Return the subset of content hashes that already exist.
+        
+        Backends should override this with a single batched query
+        (e.g. ``WHERE content_hash IN (...)``), split into chunks of at most
+        MAX_QUERY_PARAMETERS hashes; the default falls back to one
+        post_exists_by_hash call per hash.
+        """
+        return {
+            content_hash
+            for content_hash in content_hashes
+            if await self.post_exists_by_hash(content_hash)
+        }
+    
     @abstractmethod
     async def insert_post(self, post: Post) -> int:
         """Insert a new post and return its ID."""
         pass
     
+    async def insert_posts_many(self, posts: Sequence[Post]) -> List[int]:
+        """
+        Insert several posts and return their IDs in order.
+        
+        Backends should override this with a single executemany/COPY; the
+        default falls back to one insert_post call per post.
+        """
+        return [await self.insert_post(post) for post in posts]
+    
     @abstractmethod
     async def get_active_sources(self) -> List[Source]:
         """Get all active sources."""
@@ -5,9 +5,11 @@ This package provides the core functionality for the daily intelligence report s
 
 import logging.config
 
-from .logging_config import LOGGING_CONFIG
+from .logging_config import LOGGING_CONFIG, setup_logging, shutdown_logging
 
 # Bootstrap logging configuration on import
 logging.config.dictConfig(LOGGING_CONFIG)
 
+__all__ = ["setup_logging", "shutdown_logging"]
+
 __version__ = "0.1.0"
@@ -1,6 +1,59 @@
-from typing import Any, Dict
+import copy
+import os
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, Collection, Dict, Tuple, Union, cast
 
 import yaml
+from yaml.composer import Composer
+from yaml.events import (
+    MappingEndEvent,
+    MappingStartEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import Node
+
+try:
+    # libyaml-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+class _HeaderLoader(SafeLoader, Composer):
+    """SafeLoader that can compose single nodes from the event stream.
+
+    The libyaml loader only composes whole documents, so the pure-Python
+    Composer supplies compose_node on top of its parser.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__(stream)
+        self.anchors = {}
+
+
+# Parsed YAML by absolute path, with the (mtime_ns, size) of the file it was read from
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_yaml(config_path: Union[str, Path]) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The cached data is shared between callers and must not be modified.
+    """
+    path = os.path.abspath(config_path)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    _YAML_CACHE[path] = (version, data)
+    return data
 
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -8,17 +61,92 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     
     Note: This function now only handles YAML parsing. 
     For full configuration with environment variable handling, use Settings.from_yaml() instead.
+
+    The parse is shared with Settings.from_yaml through _load_yaml's cache;
+    each call returns its own copy, so callers may modify the result.
     """
     try:
-        with open(config_path) as f:
-            raw = yaml.safe_load(f)
+        raw = _load_yaml(config_path)
         if raw is None:
             raise ValueError(f"Config file {config_path} is empty")
         if not isinstance(raw, dict):
             raise ValueError(f"Config file {config_path} must contain a dictionary")
 
-        return raw
+        return copy.deepcopy(raw)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in config file {config_path}: {e}") from e
+
+
+def _compose_node(loader: _HeaderLoader) -> Node:
+    """Compose the next node of the stream on its own, outside any parent node."""
+    return cast(Node, loader.compose_node(None, None))  # type: ignore[arg-type]
+
+
+def _skip_node(loader: _HeaderLoader) -> None:
+    """Consume the events of one node without composing it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def load_config_header(config_path: str, keys: Collection[str]) -> Dict[str, Any]:
+    """Load only the given top-level keys of a YAML configuration file.
+
+    The document is parsed as a stream of events: values of other keys are
+    skipped without being built, and parsing stops as soon as every requested
+    key has been read, so the rest of a large file is never parsed.
+
+    Documents this cannot stream (a non-mapping root, merge keys or unhashable
+    keys at the top level, aliases to skipped anchors) go through load_config
+    instead, which also raises its errors for empty, malformed or non-dict files.
+
+    Returns:
+        Mapping of each requested key present in the file to its value
+    """
+    wanted = set(keys)
+    found: Dict[str, Any] = {}
+    try:
+        with open(config_path) as f:
+            loader = _HeaderLoader(f)
+            try:
+                loader.get_event()  # StreamStart
+                if loader.check_event(StreamEndEvent):
+                    return _select(load_config(config_path), wanted)
+                loader.get_event()  # DocumentStart
+                if not loader.check_event(MappingStartEvent):
+                    return _select(load_config(config_path), wanted)
+                loader.get_event()
+
+                while len(found) < len(wanted) and not loader.check_event(MappingEndEvent):
+                    key_node = _compose_node(loader)
+                    if key_node.tag == "tag:yaml.org,2002:merge":
+                        return _select(load_config(config_path), wanted)
+                    key = loader.construct_object(key_node, deep=True)
+                    if not isinstance(key, Hashable):
+                        return _select(load_config(config_path), wanted)
+                    if key in wanted:
+                        found[key] = loader.construct_object(_compose_node(loader), deep=True)
+                    else:
+                        _skip_node(loader)
+            finally:
+                loader.dispose()
     except FileNotFoundError:
         raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    except yaml.composer.ComposerError:
+        return _select(load_config(config_path), wanted)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in config file {config_path}: {e}") from e
+    return found
+
+
+def _select(config: Dict[str, Any], keys: Collection[str]) -> Dict[str, Any]:
+    """Return the entries of config whose keys are in keys."""
+    return {key: value for key, value in config.items() if key in keys}
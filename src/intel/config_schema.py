@@ -1,12 +1,21 @@
 """Configuration schema defining required and optional environment variables."""
 
-from typing import Dict, List, Set
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
-# Required environment variables that must be set
-REQUIRED_ENV_VARS: Set[str] = {"DIR_X_API_TOKEN", "DIR_EMAIL_PASS", "DIR_TRANSCRIPT_API_KEY"}
+# Required environment variables that must be set, in the order they are reported
+REQUIRED_ENV_VARS_ORDERED: Tuple[str, ...] = (
+    "DIR_X_API_TOKEN",
+    "DIR_EMAIL_PASS",
+    "DIR_TRANSCRIPT_API_KEY",
+)
+REQUIRED_ENV_VARS: FrozenSet[str] = frozenset(REQUIRED_ENV_VARS_ORDERED)
 
 # Optional environment variables with defaults
-OPTIONAL_ENV_VARS: Set[str] = {"DIR_OPENAI_API_KEY", "DIR_ANTHROPIC_API_KEY", "DIR_GOOGLE_API_KEY"}
+OPTIONAL_ENV_VARS: FrozenSet[str] = frozenset(
+    {"DIR_OPENAI_API_KEY", "DIR_ANTHROPIC_API_KEY", "DIR_GOOGLE_API_KEY"}
+)
 
 # Environment variable to config path mapping
 # Useful for documentation, tooling, and enhanced error messages
@@ -20,16 +29,26 @@ ENV_VAR_MAPPING: Dict[str, str] = {
 }
 
 
-def get_missing_required_vars(env_vars: Dict[str, str]) -> List[str]:
-    """Return list of missing required environment variables."""
-    return [var for var in REQUIRED_ENV_VARS if not env_vars.get(var)]
+def get_missing_required_vars(env_vars: Optional[Mapping[str, str]] = None) -> List[str]:
+    """Return list of missing required environment variables, in a fixed order.
 
+    env_vars defaults to os.environ, which is probed directly rather than copied.
+    """
+    if env_vars is None:
+        env_vars = os.environ
+    return [var for var in REQUIRED_ENV_VARS_ORDERED if not env_vars.get(var)]
 
-def get_remediation_message(missing_vars: List[str]) -> str:
+
+def get_remediation_message(missing_vars: Sequence[str]) -> str:
     """Generate helpful remediation message for missing environment variables."""
     if not missing_vars:
         return ""
+    return _build_remediation_message(tuple(missing_vars))
+
 
+@lru_cache(maxsize=32)
+def _build_remediation_message(missing_vars: Tuple[str, ...]) -> str:
+    """Build the remediation message; memoized since it depends only on its input."""
     var_list = ", ".join(missing_vars)
     example_var = missing_vars[0]
 
@@ -5,7 +5,7 @@ import logging
 import sqlite3
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 try:
     from importlib.metadata import distribution
@@ -23,16 +23,48 @@ except ImportError:
     except ImportError:
         distribution = None  # type: ignore[assignment]
 
+from .logging_config import setup_logging
 from .utils.log import get_logger
 
 logger = get_logger(__name__)
 
 DEFAULT_DB_PATH = "./data/dev/intel.db"
 
+# Schema version recorded in PRAGMA user_version
+SCHEMA_VERSION = 4
+
+# Statements upgrading a database from the previous version to each version.
+# schema.sql always describes the latest version, so these only run for
+# databases created before it.
+MIGRATIONS: Dict[int, List[str]] = {
+    2: ["ALTER TABLE embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'float32'"],
+    3: ["ALTER TABLE embeddings ADD COLUMN scale REAL"],
+    # UNIQUE(content_hash) already indexes the column
+    4: ["DROP INDEX IF EXISTS idx_posts_content_hash"],
+}
+
+# Connection settings for the ingest workload: many small inserts plus hash lookups.
+# journal_mode persists in the database file; the rest must be set per connection.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -65536",  # 64 MiB
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA journal_size_limit = 67108864",  # 64 MiB
+)
+
 
 def get_schema_path() -> Path:
     """Get schema file path for both development and installed packages."""
-    # Try to use importlib.resources for installed packages
+    # Check the development checkout first; it is a single stat, whereas the package
+    # lookup below may walk installed distribution metadata
+    dev_schema_path = Path(__file__).parent.parent.parent / "infra" / "schema.sql"
+    if dev_schema_path.exists():
+        return dev_schema_path
+
+    # Otherwise use importlib.resources for installed packages
     try:
         # Get package names using more reliable methods
         package_names = []
@@ -89,14 +121,23 @@ def get_schema_path() -> Path:
     except Exception:
         pass
 
-    # Fallback to relative path for development
-    schema_path = Path(__file__).parent.parent.parent / "infra" / "schema.sql"
-    if schema_path.exists():
-        return schema_path
-
     raise FileNotFoundError("Could not locate schema.sql file")
 
 
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the standard pragmas to a SQLite connection.
+
+    WAL with synchronous=NORMAL lets readers run alongside the writer and only
+    syncs at checkpoints, which is durable against application crashes; mmap and
+    a larger page cache speed up reads. Call this on every runtime connection.
+
+    Args:
+        conn: Open SQLite connection
+    """
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
 def get_schema_version(db_path: Path) -> int:
     """Get the current schema version from the database.
 
@@ -155,14 +196,26 @@ def initialize_database(db_path: Optional[str] = None) -> bool:
 
         # Connect and execute schema
         with sqlite3.connect(db_file) as conn:
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
+            # Enable foreign keys, WAL and the other connection settings
+            configure_connection(conn)
+
+            # Databases created before versioning was introduced report 0
+            installed_version = current_version
+            if not installed_version and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='embeddings'"
+            ).fetchone():
+                installed_version = 1
+
+            # Upgrade databases created with an older schema
+            if installed_version:
+                for version in range(installed_version + 1, SCHEMA_VERSION + 1):
+                    for statement in MIGRATIONS.get(version, []):
+                        conn.execute(statement)
 
             # Execute schema SQL
             conn.executescript(schema_sql)
 
-            # Set schema version to 1 for initial schema
-            conn.execute("PRAGMA user_version = 1")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
             # Verify the schema was applied
             new_version = conn.execute("PRAGMA user_version").fetchone()[0]
@@ -215,6 +268,7 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    setup_logging()
 
     # Adjust logging level based on verbosity
     if args.verbose >= 2:
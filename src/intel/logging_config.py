@@ -1,7 +1,13 @@
 """Logging configuration for the daily intelligence report system."""
 
+import atexit
+import logging
+import logging.config
 import os
+import queue
+from logging.handlers import QueueListener
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 # Default log directory
 DEFAULT_LOG_DIR = "./logs"
@@ -10,7 +16,14 @@ DEFAULT_LOG_DIR = "./logs"
 log_dir = Path(os.getenv("INTEL_LOG_DIR", DEFAULT_LOG_DIR))
 log_dir.mkdir(parents=True, exist_ok=True)
 
-LOGGING_CONFIG = {
+# Under setup_logging() loggers only enqueue records here; a QueueListener formats and
+# writes them on a background thread so callers never block on console/file I/O
+LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+
+# Logger that owns the real console/file handlers used by the listener
+LISTENER_LOGGER = "intel.log_listener"
+
+LOGGING_CONFIG: Dict[str, Any] = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
@@ -67,3 +80,59 @@ LOGGING_CONFIG = {
         "handlers": ["console", "file"],
     },
 }
+
+# Same loggers, routed through LOG_QUEUE to the listener's console/file handlers
+QUEUED_LOGGING_CONFIG: Dict[str, Any] = {
+    **LOGGING_CONFIG,
+    "handlers": {
+        **LOGGING_CONFIG["handlers"],
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": LOG_QUEUE,
+        },
+    },
+    "loggers": {
+        LISTENER_LOGGER: {
+            "level": "DEBUG",
+            "handlers": ["console", "file"],
+            "propagate": False,
+        },
+        **{
+            name: {**logger, "handlers": ["queue"]}
+            for name, logger in LOGGING_CONFIG["loggers"].items()
+        },
+    },
+    "root": {**LOGGING_CONFIG["root"], "handlers": ["queue"]},
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> QueueListener:
+    """Switch logging to the queued configuration and start its listener.
+
+    Meant to be called once by entry points; importing the package only applies
+    the synchronous LOGGING_CONFIG so no thread is started as a side effect.
+
+    Returns:
+        The running listener; calling again returns the same one
+    """
+    global _listener
+    if _listener is None:
+        logging.config.dictConfig(QUEUED_LOGGING_CONFIG)
+        _listener = QueueListener(
+            LOG_QUEUE, *logging.getLogger(LISTENER_LOGGER).handlers, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Stop the listener, flushing queued records, and restore LOGGING_CONFIG."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    logging.config.dictConfig(LOGGING_CONFIG)
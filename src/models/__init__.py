@@ -1,8 +1,8 @@
 """Data models for the daily intelligence report system."""
 
 from .cluster import Cluster
-from .embedding import Embedding
+from .embedding import Embedding, EmbeddingStore
 from .post import Post
 from .source import Source, SourceType
 
-__all__ = ["Source", "SourceType", "Post", "Embedding", "Cluster"]
+__all__ = ["Source", "SourceType", "Post", "Embedding", "EmbeddingStore", "Cluster"]
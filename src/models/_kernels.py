@@ -0,0 +1,156 @@
+"""Vector kernels shared by the embedding and cluster models.
+
+SimSIMD's fused SIMD kernels are used when the package is installed. Without
+it, pairwise cosine similarity uses a Numba-compiled loop when Numba is
+installed, and everything else is computed with NumPy.
+"""
+
+import math
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, cast
+
+import numpy as np
+
+try:
+    import simsimd  # type: ignore[import-untyped,import-not-found]
+except ImportError:
+    simsimd = None  # type: ignore[assignment]
+
+# Element types SimSIMD computes on directly (without converting to float32)
+_SIMD_DTYPES = (np.dtype(np.float32), np.dtype(np.float16), np.dtype(np.int8))
+
+# Element types NumPy would accumulate in at reduced precision or overflow
+_NARROW_DTYPES = (np.dtype(np.float16), np.dtype(np.int8))
+
+
+def _simd_operands(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return contiguous operands of a single dtype for SimSIMD.
+
+    Operands that already share a natively supported dtype are passed through
+    without a copy; anything else is converted to float32.
+    """
+    dtype = a.dtype
+    if dtype not in _SIMD_DTYPES or b.dtype != dtype:
+        dtype = np.dtype(np.float32)
+    return np.ascontiguousarray(a, dtype=dtype), np.ascontiguousarray(b, dtype=dtype)
+
+
+def _widen(vector: np.ndarray) -> np.ndarray:
+    """Upcast half-precision and int8 input so NumPy accumulates in float32."""
+    return vector.astype(np.float32) if vector.dtype in _NARROW_DTYPES else vector
+
+
+@lru_cache(maxsize=None)
+def _get_jit_cosine() -> Optional[Callable[[np.ndarray, np.ndarray], float]]:
+    """
+    Build the Numba cosine kernel, or return None if Numba is not installed.
+
+    Importing Numba is slow, so it only happens the first time a cosine
+    similarity is computed without SimSIMD.
+    """
+    try:
+        import numba  # type: ignore[import-untyped,import-not-found]
+    except ImportError:
+        return None
+
+    # Compiled on first call; cache=True keeps the machine code between runs
+    @numba.njit(cache=True, fastmath=True)  # type: ignore[misc]
+    def _jit_cosine(a: np.ndarray, b: np.ndarray) -> float:
+        """Cosine similarity in one pass over both vectors; 0.0 if either is all zeros."""
+        dot = 0.0
+        norm_a = 0.0
+        norm_b = 0.0
+        for i in range(a.shape[0]):
+            dot += a[i] * b[i]
+            norm_a += a[i] * a[i]
+            norm_b += b[i] * b[i]
+        if norm_a == 0.0 or norm_b == 0.0:
+            return 0.0
+        return float(dot / np.sqrt(norm_a * norm_b))
+
+    return cast(Callable[[np.ndarray, np.ndarray], float], _jit_cosine)
+
+
+def vector_norm(vector: np.ndarray) -> float:
+    """L2 norm of a vector."""
+    vector = _widen(vector)
+    return float(np.sqrt(np.vdot(vector, vector)))
+
+
+def cosine_similarity(
+    a: np.ndarray,
+    b: np.ndarray,
+    norm_a: Optional[float] = None,
+    norm_b: Optional[float] = None,
+) -> float:
+    """
+    Cosine similarity of two vectors of the same shape; 0.0 if either is all zeros.
+
+    When both norms are already known (see vector_norm) only the dot product
+    is computed.
+    """
+    if norm_a is not None and norm_b is not None:
+        denominator = norm_a * norm_b
+        if denominator == 0:
+            return 0.0
+        if simsimd is not None:
+            dot = simsimd.dot(*_simd_operands(a, b))
+            return float(dot) / denominator  # type: ignore[arg-type]
+        return float(np.vdot(_widen(a), _widen(b))) / denominator
+
+    if simsimd is not None:
+        # SimSIMD returns the cosine distance, fusing the dot product and both norms
+        distance = simsimd.cosine(*_simd_operands(a, b))
+        return 1.0 - float(distance)  # type: ignore[arg-type]
+
+    jit_cosine = _get_jit_cosine()
+    if jit_cosine is not None:
+        return float(jit_cosine(_widen(a), _widen(b)))
+
+    # vdot avoids np.linalg.norm's dispatch and takes one sqrt
+    a, b = _widen(a), _widen(b)
+    denominator = np.sqrt(np.vdot(a, a) * np.vdot(b, b))
+    if denominator == 0:
+        return 0.0
+
+    return float(np.vdot(a, b) / denominator)
+
+
+def squared_euclidean_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Squared Euclidean distance between two vectors of the same shape.
+
+    Orders vectors the same way as euclidean_distance without the sqrt, so
+    prefer it when distances are only compared.
+    """
+    if simsimd is not None:
+        # Fuses the subtraction, squaring and sum without a temporary difference array
+        return float(simsimd.sqeuclidean(*_simd_operands(a, b)))  # type: ignore[arg-type]
+
+    diff = _widen(a) - _widen(b)
+    return float(np.vdot(diff, diff))
+
+
+def euclidean_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """Euclidean distance between two vectors of the same shape."""
+    return math.sqrt(squared_euclidean_distance(a, b))
+
+
+def batch_cosine_similarity(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of query against each row of matrix in one vectorized call.
+
+    Rows (or a query) that are all zeros get a similarity of 0.0.
+    """
+    if simsimd is not None:
+        query, matrix = _simd_operands(query, matrix)
+        distances = simsimd.cdist(query[np.newaxis, :], matrix, "cosine")
+        return 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+
+    # A BLAS matrix-vector product; faster here than a compiled per-row loop
+    query, matrix = _widen(query), _widen(matrix)
+    row_norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    denominators = row_norms * np.sqrt(np.vdot(query, query))
+    dots = matrix @ query
+    return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators != 0)
@@ -0,0 +1,16 @@
+"""Fast access to pydantic private attributes for the models' caches."""
+
+from typing import Any, Dict, cast
+
+from pydantic import BaseModel
+
+
+def private_state(model: BaseModel) -> Dict[str, Any]:
+    """Return the dict holding a model's private attribute values.
+
+    Reading a private attribute as model._name falls through to
+    BaseModel.__getattr__, which costs a few microseconds per read in pydantic
+    2.x (about 30x a field read). Caches consulted on every access read and
+    write this dict instead.
+    """
+    return cast(Dict[str, Any], model.__pydantic_private__)
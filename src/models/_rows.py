@@ -0,0 +1,20 @@
+"""Helpers for building models from database rows."""
+
+import json
+import sqlite3
+from typing import Any, Dict, Mapping, Union
+
+# A fetched row: sqlite3.Row (with row_factory set) or any column -> value mapping
+Row = Union[Mapping[str, Any], sqlite3.Row]
+
+
+def row_values(row: Row) -> Dict[str, Any]:
+    """Copy a row into a plain dict of column -> value."""
+    return dict(row)
+
+
+def parse_json(value: Any) -> Any:
+    """Decode a JSON TEXT column; values that are not strings pass through."""
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return value
@@ -4,7 +4,16 @@ from datetime import datetime
 from typing import Optional
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+from ._kernels import (
+    cosine_similarity,
+    euclidean_distance,
+    squared_euclidean_distance,
+    vector_norm,
+)
+from ._private import private_state
+from ._rows import Row, row_values
 
 
 class Cluster(BaseModel):
@@ -32,6 +41,14 @@ class Cluster(BaseModel):
     # Transient field for working with centroid as numpy array (not serialized)
     centroid_vector_cache: Optional[np.ndarray] = Field(default=None, exclude=True)
 
+    # Array view decoded from centroid_blob, and the blob it was decoded from
+    _decoded: Optional[np.ndarray] = PrivateAttr(default=None)
+    _decoded_blob: Optional[bytes] = PrivateAttr(default=None)
+
+    # Norm of centroid_vector, and the array it was computed from
+    _norm: Optional[float] = PrivateAttr(default=None)
+    _norm_vector: Optional[np.ndarray] = PrivateAttr(default=None)
+
     @field_validator("label")
     @classmethod
     def validate_label(cls, v: str) -> str:
@@ -40,6 +57,11 @@ class Cluster(BaseModel):
             raise ValueError("Cluster label cannot be empty")
         return v.strip()
 
+    @classmethod
+    def from_row(cls, row: Row) -> "Cluster":
+        """Build a cluster from a clusters row."""
+        return cls.model_validate(row_values(row))
+
     @property
     def centroid_vector(self) -> Optional[np.ndarray]:
         """Get centroid as numpy array."""
@@ -47,7 +69,14 @@ class Cluster(BaseModel):
             return self.centroid_vector_cache
 
         if self.centroid_blob is not None:
-            return np.frombuffer(self.centroid_blob, dtype=np.float32)
+            # frombuffer is a zero-copy view; keep it until the blob is replaced
+            state = private_state(self)
+            decoded: Optional[np.ndarray] = state["_decoded"]
+            if state["_decoded_blob"] is not self.centroid_blob:
+                decoded = np.frombuffer(self.centroid_blob, dtype=np.float32)
+                state["_decoded"] = decoded
+                state["_decoded_blob"] = self.centroid_blob
+            return decoded
 
         return None
 
@@ -57,12 +86,34 @@ class Cluster(BaseModel):
         if not isinstance(vector, np.ndarray):
             raise ValueError("Centroid must be a numpy array")
 
-        # Ensure float32 dtype for consistency
-        if vector.dtype != np.float32:
-            vector = vector.astype(np.float32)
+        # Ensure float32 dtype for consistency; no copy when the input already is
+        vector = vector.astype(np.float32, copy=False)
 
-        self.centroid_vector_cache = vector
+        # Keep only the blob and a zero-copy view of it rather than the caller's
+        # array as well, so each centroid is held in memory once
+        self.centroid_vector_cache = None
         self.centroid_blob = vector.tobytes()
+        self._decoded = np.frombuffer(self.centroid_blob, dtype=np.float32)
+        self._decoded_blob = self.centroid_blob
+
+    @property
+    def centroid_norm(self) -> Optional[float]:
+        """L2 norm of centroid_vector, computed once per vector array.
+
+        The norm follows whichever array centroid_vector returns, so replacing
+        centroid_vector_cache or the blob recomputes it; modifying an array's
+        values in place does not.
+        """
+        centroid = self.centroid_vector
+        if centroid is None:
+            return None
+        state = private_state(self)
+        norm: Optional[float] = state["_norm"]
+        if state["_norm_vector"] is not centroid or norm is None:
+            norm = vector_norm(centroid)
+            state["_norm"] = norm
+            state["_norm_vector"] = centroid
+        return norm
 
     def distance_to_centroid(self, embedding_vector: np.ndarray) -> float:
         """Calculate Euclidean distance from embedding to cluster centroid."""
@@ -74,7 +125,23 @@ class Cluster(BaseModel):
         if embedding_vector.shape != centroid.shape:
             raise ValueError("Embedding and centroid vectors must have the same shape")
 
-        return float(np.linalg.norm(embedding_vector - centroid))
+        return euclidean_distance(embedding_vector, centroid)
+
+    def sqdistance_to_centroid(self, embedding_vector: np.ndarray) -> float:
+        """Calculate squared Euclidean distance from embedding to cluster centroid.
+
+        Ranks clusters the same as distance_to_centroid without taking a square
+        root, for callers that only compare distances (e.g. nearest centroid).
+        """
+        centroid = self.centroid_vector
+
+        if centroid is None:
+            raise ValueError("Cluster must have a centroid to calculate distance")
+
+        if embedding_vector.shape != centroid.shape:
+            raise ValueError("Embedding and centroid vectors must have the same shape")
+
+        return squared_euclidean_distance(embedding_vector, centroid)
 
     def similarity_to_centroid(self, embedding_vector: np.ndarray) -> float:
         """Calculate cosine similarity between embedding and cluster centroid."""
@@ -86,15 +153,7 @@ class Cluster(BaseModel):
         if embedding_vector.shape != centroid.shape:
             raise ValueError("Embedding and centroid vectors must have the same shape")
 
-        # Cosine similarity
-        dot_product = np.dot(embedding_vector, centroid)
-        norm1 = np.linalg.norm(embedding_vector)
-        norm2 = np.linalg.norm(centroid)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return float(dot_product / (norm1 * norm2))
+        return cosine_similarity(embedding_vector, centroid, norm_b=self.centroid_norm)
 
     def __str__(self) -> str:
         """String representation."""
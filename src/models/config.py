@@ -1,14 +1,20 @@
 """Pydantic models for configuration validation."""
 
 import os
+import re
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, validator
 from pydantic_settings import BaseSettings
 
+from src.intel.config_loader import _load_yaml
+
+# A config value that is exactly "${VAR}"
+ENV_VAR_PATTERN = re.compile(r"\$\{(.+)\}", re.DOTALL)
+
 
 class StorageSettings(BaseModel):
     sqlite_path: str = "./data/dev/intel.db"
@@ -87,7 +93,7 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env", "extra": "ignore"}
 
     @classmethod
-    def from_yaml(cls, config_path: str = "config.yaml") -> "Settings":
+    def from_yaml(cls, config_path: Union[str, Path] = "config.yaml") -> "Settings":
         """Factory method to create Settings from YAML file with environment variable expansion."""
         # Load .env file if present (look in same directory as config file and current directory)
         # Note: load_dotenv() will not override existing environment variables by default
@@ -98,16 +104,19 @@ class Settings(BaseSettings):
             load_dotenv()  # Then try current directory if different from config dir
 
         try:
-            with open(config_path) as f:
-                raw_config = yaml.safe_load(f)
+            # Parsing is cached by file version; environment expansion below never
+            # modifies the cached data and runs on every call so it always sees the
+            # current environment
+            raw_config = _load_yaml(config_path)
 
             if raw_config is None:
                 raise ValueError(f"Config file {config_path} is empty")
             if not isinstance(raw_config, dict):
                 raise ValueError(f"Config file {config_path} must contain a dictionary")
 
-            # Expand environment variables in the config
-            expanded_config = cls._expand_env_vars(raw_config)
+            # Expand environment variables in the config against a single snapshot
+            # of the environment (os.environ decodes on every access)
+            expanded_config = cls._expand_env_vars(raw_config, dict(os.environ))
             
             # Create the settings instance
             instance = cls(**expanded_config)
@@ -120,21 +129,39 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid YAML in config file {config_path}: {e}") from e
 
     @staticmethod
-    def _expand_env_vars(data: Any) -> Any:
-        """Recursively expand environment variables in configuration data."""
-        if isinstance(data, dict):
-            return {key: Settings._expand_env_vars(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [Settings._expand_env_vars(item) for item in data]
-        elif (
-            isinstance(data, str) and data.startswith("${") and data.endswith("}") and len(data) > 3
-        ):
-            env_var = data[2:-1]
-            value = os.getenv(env_var)
-            if value is None:
-                # Return None for missing env vars so they can be handled by validation
-                return None
+    def _expand_env_vars(data: Any, environ: Optional[Mapping[str, str]] = None) -> Any:
+        """Expand environment variable placeholders in configuration data.
+
+        Copy-on-write: a dict or list is copied only if something inside it
+        expands, and any other value is returned as the same object, so the
+        input is left unchanged and static parts of the config are not
+        duplicated. Variables are looked up in environ, defaulting to os.environ.
+        """
+        lookup = (os.environ if environ is None else environ).get
+
+        def expand(value: Any) -> Any:
+            if isinstance(value, str):
+                match = ENV_VAR_PATTERN.fullmatch(value)
+                # Missing env vars become None so they can be handled by validation
+                return lookup(match.group(1)) if match else value
+            if isinstance(value, dict):
+                expanded_dict: Optional[Dict[Any, Any]] = None
+                for key, item in value.items():
+                    new_item = expand(item)
+                    if new_item is not item:
+                        if expanded_dict is None:
+                            expanded_dict = dict(value)
+                        expanded_dict[key] = new_item
+                return value if expanded_dict is None else expanded_dict
+            if isinstance(value, list):
+                expanded_list: Optional[List[Any]] = None
+                for index, item in enumerate(value):
+                    new_item = expand(item)
+                    if new_item is not item:
+                        if expanded_list is None:
+                            expanded_list = list(value)
+                        expanded_list[index] = new_item
+                return value if expanded_list is None else expanded_list
             return value
-        else:
-            return data
 
+        return expand(data)
@@ -1,10 +1,21 @@
 """Embedding model for vector representations of posts."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Literal, Optional, Sequence, Tuple
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+from ._kernels import batch_cosine_similarity, cosine_similarity, vector_norm
+from ._private import private_state
+from ._rows import Row, row_values
+
+# Element types an embedding can be stored as; float16 halves the blob size and
+# int8 (symmetric quantization with a per-embedding scale) quarters it
+EmbeddingDType = Literal["float32", "float16", "int8"]
+
+# Largest magnitude of a quantized int8 component
+INT8_MAX = 127
 
 
 class Embedding(BaseModel):
@@ -15,6 +26,12 @@ class Embedding(BaseModel):
     embedding_blob: Optional[bytes] = Field(
         default=None, description="Serialized vector embedding as bytes"
     )
+    dtype: EmbeddingDType = Field(
+        default="float32", description="NumPy element type of the values in embedding_blob"
+    )
+    scale: Optional[float] = Field(
+        default=None, description="Dequantization scale of an int8 embedding_blob"
+    )
     model_name: str = Field(..., description="Name of the model used to generate the embedding")
     created_at: Optional[datetime] = None
 
@@ -29,6 +46,14 @@ class Embedding(BaseModel):
     # Transient field for working with embeddings as numpy arrays (not serialized)
     embedding_vector_cache: Optional[np.ndarray] = Field(default=None, exclude=True)
 
+    # Array view decoded from embedding_blob, and the (blob, dtype, scale) it was decoded from
+    _decoded: Optional[np.ndarray] = PrivateAttr(default=None)
+    _decoded_key: Optional[Tuple[bytes, str, Optional[float]]] = PrivateAttr(default=None)
+
+    # Norm of embedding_vector, and the array it was computed from
+    _norm: Optional[float] = PrivateAttr(default=None)
+    _norm_vector: Optional[np.ndarray] = PrivateAttr(default=None)
+
     @field_validator("model_name")
     @classmethod
     def validate_model_name(cls, v: str) -> str:
@@ -37,6 +62,18 @@ class Embedding(BaseModel):
             raise ValueError("Model name cannot be empty")
         return v.strip()
 
+    @classmethod
+    def from_row(cls, row: Row) -> "Embedding":
+        """Build an embedding from an embeddings row."""
+        return cls.model_validate(row_values(row))
+
+    @property
+    def stored_vector(self) -> Optional[np.ndarray]:
+        """Get embedding_blob as a numpy array of its stored dtype (int8 stays quantized)."""
+        if self.embedding_blob is None:
+            return None
+        return np.frombuffer(self.embedding_blob, dtype=self.dtype)
+
     @property
     def embedding_vector(self) -> Optional[np.ndarray]:
         """Get embedding as numpy array."""
@@ -44,7 +81,22 @@ class Embedding(BaseModel):
             return self.embedding_vector_cache
 
         if self.embedding_blob is not None:
-            return np.frombuffer(self.embedding_blob, dtype=np.float32)
+            # frombuffer is a zero-copy view; keep it until the blob is replaced
+            state = private_state(self)
+            decoded: Optional[np.ndarray] = state["_decoded"]
+            key = state["_decoded_key"]
+            if (
+                key is None
+                or key[0] is not self.embedding_blob
+                or key[1] != self.dtype
+                or key[2] != self.scale
+            ):
+                decoded = np.frombuffer(self.embedding_blob, dtype=self.dtype)
+                if self.dtype == "int8":
+                    decoded = decoded * np.float32(self.scale or 0.0)
+                state["_decoded"] = decoded
+                state["_decoded_key"] = (self.embedding_blob, self.dtype, self.scale)
+            return decoded
 
         return None
 
@@ -54,12 +106,45 @@ class Embedding(BaseModel):
         if not isinstance(vector, np.ndarray):
             raise ValueError("Embedding must be a numpy array")
 
-        # Ensure float32 dtype for consistency
-        if vector.dtype != np.float32:
-            vector = vector.astype(np.float32)
+        if self.dtype == "int8":
+            peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+            scale = peak / INT8_MAX if peak else 1.0
+            # Round the scaled copy in place rather than allocating another array
+            scaled = vector / scale
+            quantized = np.rint(scaled, out=scaled).astype(np.int8)
+            self.scale = scale
+            self.embedding_vector_cache = None
+            self.embedding_blob = quantized.tobytes()
+            return
 
-        self.embedding_vector_cache = vector
+        # Store with the embedding's dtype; no copy when the input already has it
+        vector = vector.astype(self.dtype, copy=False)
+
+        # Keep only the blob and a zero-copy view of it rather than the caller's
+        # array as well, so each vector is held in memory once
+        self.embedding_vector_cache = None
         self.embedding_blob = vector.tobytes()
+        self._decoded = np.frombuffer(self.embedding_blob, dtype=self.dtype)
+        self._decoded_key = (self.embedding_blob, self.dtype, self.scale)
+
+    @property
+    def embedding_norm(self) -> Optional[float]:
+        """L2 norm of embedding_vector, computed once per vector array.
+
+        The norm follows whichever array embedding_vector returns, so replacing
+        embedding_vector_cache or the blob, dtype or scale recomputes it;
+        modifying an array's values in place does not.
+        """
+        vector = self.embedding_vector
+        if vector is None:
+            return None
+        state = private_state(self)
+        norm: Optional[float] = state["_norm"]
+        if state["_norm_vector"] is not vector or norm is None:
+            norm = vector_norm(vector)
+            state["_norm"] = norm
+            state["_norm_vector"] = vector
+        return norm
 
     def similarity(self, other: "Embedding") -> float:
         """Calculate cosine similarity with another embedding."""
@@ -72,15 +157,72 @@ class Embedding(BaseModel):
         if vec1.shape != vec2.shape:
             raise ValueError("Embedding vectors must have the same shape")
 
-        # Cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        if self.dtype == "int8" and other.dtype == "int8":
+            # The scales cancel in the cosine ratio, so compare the quantized values directly
+            quantized1, quantized2 = self.stored_vector, other.stored_vector
+            if quantized1 is not None and quantized2 is not None:
+                return cosine_similarity(quantized1, quantized2)
+
+        return cosine_similarity(vec1, vec2, self.embedding_norm, other.embedding_norm)
+
+    def to_torch(self, device: str = "cuda") -> Any:
+        """Copy the embedding to a torch tensor on device.
+
+        torch is optional and imported on first use; install it to use this.
+
+        Args:
+            device: Torch device for the tensor, e.g. "cuda" or "cpu"
+        """
+        import torch  # type: ignore[import-not-found]
+
+        vector = self.embedding_vector
+        if vector is None:
+            raise ValueError("Embedding must have a vector to convert")
+        return torch.tensor(vector, device=device)
+
+    @classmethod
+    def batch_cosine(cls, query: np.ndarray, others: Sequence["Embedding"]) -> np.ndarray:
+        """Calculate cosine similarity of query against many embeddings at once.
+
+        The stored blobs are stacked into one matrix and compared in a single
+        vectorized call instead of calling similarity() once per embedding.
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        Args:
+            query: Query vector
+            others: Embeddings to compare against
 
-        return float(dot_product / (norm1 * norm2))
+        Returns:
+            Similarities in the same order as others
+        """
+        if not others:
+            return np.empty(0, dtype=np.float32)
+
+        blobs: List[bytes] = []
+        for other in others:
+            if other.embedding_blob is None:
+                raise ValueError("All embeddings must have vectors to calculate similarity")
+            blobs.append(other.embedding_blob)
+
+        dtype = others[0].dtype
+        if all(other.dtype == dtype for other in others):
+            if any(len(blob) != len(blobs[0]) for blob in blobs):
+                raise ValueError("Embedding vectors must have the same shape")
+            matrix = np.frombuffer(b"".join(blobs), dtype=dtype).reshape(len(blobs), -1)
+        else:
+            # Dequantize int8 rows so they are comparable with the float rows
+            vectors = [
+                np.frombuffer(blob, dtype=other.dtype) * np.float32(other.scale or 0.0)
+                if other.dtype == "int8"
+                else np.frombuffer(blob, dtype=other.dtype)
+                for blob, other in zip(blobs, others, strict=True)
+            ]
+            if any(vector.shape != vectors[0].shape for vector in vectors):
+                raise ValueError("Embedding vectors must have the same shape")
+            matrix = np.stack(vectors, dtype=np.float32)
+        if matrix.shape[1:] != query.shape:
+            raise ValueError("Embedding vectors must have the same shape")
+
+        return batch_cosine_similarity(query, matrix)
 
     def __str__(self) -> str:
         """String representation."""
@@ -96,3 +238,138 @@ class Embedding(BaseModel):
         return (
             f"Embedding(id={self.id}, post_id={self.post_id}, " f"model_name='{self.model_name}')"
         )
+
+
+class EmbeddingStore:
+    """Query-time store packing many embeddings into one contiguous matrix.
+
+    Embedding rows stay the serialization format; the store copies their
+    vectors into a single C-contiguous (N, D) float32 matrix of unit rows, so
+    a top-k search over all of them is one matrix-vector product instead of a
+    decode and similarity call per embedding.
+    """
+
+    def __init__(self, dimension: int, capacity: int = 1024):
+        """Create an empty store.
+
+        Args:
+            dimension: Length of every embedding vector
+            capacity: Rows to allocate up front; the store doubles it when full
+        """
+        if dimension <= 0:
+            raise ValueError("Embedding dimension must be positive")
+        self.dimension = dimension
+        self._matrix = np.zeros((max(capacity, 1), dimension), dtype=np.float32)
+        self._post_ids = np.zeros(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+        # Copy of matrix on a torch device, and the number of rows it holds
+        self._device_matrix: Any = None
+        self._device_rows = 0
+
+    def __len__(self) -> int:
+        """Number of embeddings in the store."""
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Normalized vectors, one row per embedding in insertion order."""
+        return self._matrix[:self._size]
+
+    @property
+    def post_ids(self) -> np.ndarray:
+        """Post IDs matching the rows of matrix."""
+        return self._post_ids[:self._size]
+
+    def add(self, embedding: Embedding) -> None:
+        """Append an embedding's vector, normalized to unit length."""
+        vector = embedding.embedding_vector
+        if vector is None:
+            raise ValueError("Embedding must have a vector to be stored")
+        if vector.shape != (self.dimension,):
+            raise ValueError("Embedding vectors must have the same shape")
+
+        if self._size == len(self._matrix):
+            self._grow()
+        row = self._matrix[self._size]
+        row[:] = vector
+        norm = embedding.embedding_norm
+        if norm:
+            row /= norm
+        self._post_ids[self._size] = embedding.post_id
+        self._size += 1
+
+    def top_k(self, query: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """Find the k stored embeddings most similar to query.
+
+        Args:
+            query: Query vector of the store's dimension
+            k: Number of results
+
+        Returns:
+            (post_id, cosine similarity) pairs, most similar first
+        """
+        if query.shape != (self.dimension,):
+            raise ValueError("Embedding vectors must have the same shape")
+        if k <= 0 or not self._size:
+            return []
+
+        query = np.asarray(query, dtype=np.float32)
+        query_norm = vector_norm(query)
+        scores: np.ndarray = (
+            self.matrix @ (query / np.float32(query_norm))
+            if query_norm
+            else np.zeros(self._size, dtype=np.float32)
+        )
+
+        if k < self._size:
+            # Select the k best in linear time, then sort only those
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(self._size)
+        best = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(self._post_ids[i]), float(scores[i])) for i in best]
+
+    def top_k_torch(self, query: Any, k: int) -> List[Tuple[int, float]]:
+        """Find the k stored embeddings most similar to query with torch.
+
+        The matrix is copied to query's device on first use and again only
+        after embeddings are added, so repeated searches on a GPU that is
+        already loaded (e.g. by the encoder) run as one kernel each.
+
+        Args:
+            query: torch tensor of the store's dimension, on the device to search on
+            k: Number of results
+
+        Returns:
+            (post_id, cosine similarity) pairs, most similar first
+        """
+        import torch  # type: ignore[import-not-found]
+
+        if tuple(query.shape) != (self.dimension,):
+            raise ValueError("Embedding vectors must have the same shape")
+        if k <= 0 or not self._size:
+            return []
+
+        matrix = self._device_matrix
+        if matrix is None or matrix.device != query.device or self._device_rows != self._size:
+            matrix = torch.from_numpy(self.matrix).to(query.device)
+            self._device_matrix, self._device_rows = matrix, self._size
+
+        query = query.to(torch.float32)
+        query_norm = torch.linalg.vector_norm(query)
+        if query_norm == 0:
+            scores = torch.zeros(self._size, device=query.device)
+        else:
+            scores = matrix @ (query / query_norm)
+        values, indices = torch.topk(scores, min(k, self._size))
+        post_ids = self._post_ids[indices.cpu().numpy()]
+        return list(zip(post_ids.tolist(), values.cpu().tolist(), strict=True))
+
+    def _grow(self) -> None:
+        """Double the allocated rows, keeping the stored ones."""
+        capacity = 2 * len(self._matrix)
+        matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        post_ids = np.zeros(capacity, dtype=np.int64)
+        post_ids[:self._size] = self._post_ids[:self._size]
+        self._matrix, self._post_ids = matrix, post_ids
@@ -4,7 +4,9 @@ import hashlib
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from ._rows import Row, parse_json, row_values
 
 
 class Post(BaseModel):
@@ -54,12 +56,20 @@ class Post(BaseModel):
             SHA-256 hash string for deduplication
         """
         identifier = source_guid or url or ""
-        hash_input = f"{source_id}:{identifier}:{content}"
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+        # Hash the prefix and content separately (same digest as hashing
+        # f"{source_id}:{identifier}:{content}") so large content is not copied
+        # into a concatenated string first
+        digest = hashlib.sha256(f"{source_id}:{identifier}:".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
 
-    @computed_field
+    @property
     def computed_content_hash(self) -> str:
-        """Compute SHA-256 hash using the generate_content_hash method."""
+        """Compute SHA-256 hash using the generate_content_hash method.
+
+        A plain property rather than a computed field, so dumping or serializing
+        a post does not re-hash its content.
+        """
         return self.generate_content_hash(
             self.source_id, self.content, self.url, self.source_guid
         )
@@ -68,11 +78,24 @@ class Post(BaseModel):
     def set_content_hash(self) -> "Post":
         """Set content_hash after model initialization if not provided."""
         if self.content_hash is None:
-            self.content_hash = str(self.computed_content_hash)
+            self.content_hash = self.computed_content_hash
         return self
 
     model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat() if v else None})
 
+    @classmethod
+    def from_row(cls, row: Row) -> "Post":
+        """Build a post from a posts row.
+
+        content_hash is taken from the row, so the content is not hashed again.
+        Validation is kept: pydantic-core validates a row faster than
+        model_construct assigns it field by field in Python.
+        """
+        values = row_values(row)
+        if "metadata_json" in values:
+            values["metadata_json"] = parse_json(values["metadata_json"])
+        return cls.model_validate(values)
+
     def __str__(self) -> str:
         """String representation."""
         return f"{self.title}"
@@ -1,13 +1,18 @@
 """Source model for content sources like RSS feeds, Twitter, etc."""
 
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from functools import cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 if TYPE_CHECKING:
     from src.connectors.configs.base import BaseConnectorConfig
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from ._private import private_state
+from ._rows import Row, parse_json, row_values
 
 
 class SourceType(str, Enum):
@@ -20,6 +25,23 @@ class SourceType(str, Enum):
     YOUTUBE = "youtube"
 
 
+@cache
+def _config_class(source_type: "SourceType") -> Type["BaseConnectorConfig"]:
+    """Return the config class for a source type, resolved once per type.
+
+    The imports are deferred because src.connectors imports this module.
+    """
+    from src.connectors.configs.base import BaseConnectorConfig
+    from src.connectors.configs.rss import RSSConfig
+
+    # Map source types to config classes
+    config_map: Dict[SourceType, Type[BaseConnectorConfig]] = {
+        SourceType.RSS: RSSConfig,
+        # Add other mappings as we implement them
+    }
+    return config_map.get(source_type, BaseConnectorConfig)
+
+
 class Source(BaseModel):
     """Model for content sources."""
 
@@ -36,24 +58,48 @@ class Source(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     active: bool = Field(default=True, description="Whether the source is active")
+
+    # Validated config, and the type and a copy of the config dict it was built from
+    _typed_config: Optional['BaseConnectorConfig'] = PrivateAttr(default=None)
+    _typed_config_type: Optional[SourceType] = PrivateAttr(default=None)
+    _typed_config_source: Optional[Dict[str, Any]] = PrivateAttr(default=None)
     
     @property
     def typed_config(self) -> 'BaseConnectorConfig':
-        """Return strongly-typed configuration object."""
-        from src.connectors.configs.base import BaseConnectorConfig
-        from src.connectors.configs.rss import RSSConfig
-        
-        # Map source types to config classes
-        config_map = {
-            SourceType.RSS: RSSConfig,
-            # Add other mappings as we implement them
-        }
-        
-        config_class = config_map.get(self.type, BaseConnectorConfig)
-        return config_class(**self.config) if self.config else config_class()
+        """Return strongly-typed configuration object.
+
+        Configs are frozen, so the validated object is reused until type or
+        config changes, whether config is reassigned or modified in place.
+        """
+        state = private_state(self)
+        typed_config: Optional['BaseConnectorConfig'] = state["_typed_config"]
+        if (
+            typed_config is None
+            or state["_typed_config_type"] is not self.type
+            or state["_typed_config_source"] != self.config
+        ):
+            config_class = _config_class(self.type)
+            typed_config = config_class(**self.config) if self.config else config_class()
+            state["_typed_config"] = typed_config
+            state["_typed_config_type"] = self.type
+            state["_typed_config_source"] = deepcopy(self.config)
+        return typed_config
 
     model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat() if v else None})
 
+    @classmethod
+    def from_row(cls, row: Row) -> "Source":
+        """Build a source from a sources row.
+
+        The url and config_json columns map to identifier and config.
+        """
+        values = row_values(row)
+        if "url" in values:
+            values["identifier"] = values.pop("url")
+        if "config_json" in values:
+            values["config"] = parse_json(values.pop("config_json"))
+        return cls.model_validate(values)
+
     def __str__(self) -> str:
         """String representation."""
         return f"{self.name} ({self.type.value})"
@@ -0,0 +1,21 @@
+"""Shared test fixtures."""
+
+import pytest
+
+# Settings file whose secrets all come from the DIR_* environment variables
+SETTINGS_YAML = """
+auth:
+  x_bearer_token: ${DIR_X_API_TOKEN}
+  imap_password: ${DIR_EMAIL_PASS}
+transcription:
+  provider: whisper
+  api_key: ${DIR_TRANSCRIPT_API_KEY}
+"""
+
+
+@pytest.fixture(scope="session")
+def settings_yaml(tmp_path_factory):
+    """Path to a settings file shared by tests that only vary the environment."""
+    config_file = tmp_path_factory.mktemp("config") / "config.yaml"
+    config_file.write_text(SETTINGS_YAML)
+    return config_file
@@ -1,10 +1,13 @@
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
+import yaml
 
-from src.intel.config_loader import load_config
+from src.intel.config_loader import load_config, load_config_header
+from src.models.config import Settings
+
+# The repository's own config file
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
 
 
 class TestLoadConfig:
@@ -13,74 +16,57 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError, match="Config file not found"):
             load_config("nonexistent.yaml")
 
-    def test_invalid_yaml(self):
+    def test_invalid_yaml(self, tmp_path):
         """Test load_config raises ValueError for invalid YAML"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            temp_path = f.name
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("invalid: yaml: content: [")
 
-        try:
-            with pytest.raises(ValueError, match="Invalid YAML"):
-                load_config(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_config(str(config_file))
 
-    def test_empty_file(self):
+    def test_empty_file(self, tmp_path):
         """Test load_config raises ValueError for empty YAML file"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("")
-            temp_path = f.name
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("")
 
-        try:
-            with pytest.raises(ValueError, match="Config file .* is empty"):
-                load_config(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Config file .* is empty"):
+            load_config(str(config_file))
 
-    def test_non_dict_content(self):
+    def test_non_dict_content(self, tmp_path):
         """Test load_config raises ValueError for non-dict YAML content"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("- item1\n- item2")
-            temp_path = f.name
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("- item1\n- item2")
 
-        try:
-            with pytest.raises(ValueError, match="must contain a dictionary"):
-                load_config(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="must contain a dictionary"):
+            load_config(str(config_file))
 
-    def test_valid_config_without_env_expansion(self):
+    def test_valid_config_without_env_expansion(self, tmp_path):
         """Test load_config successfully loads config without expanding environment variables"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 database:
   host: localhost
   password: ${TEST_VAR}
 settings:
   debug: true
 """
-            )
-            temp_path = f.name
+        )
 
-        try:
-            config = load_config(temp_path)
-            # load_config now only parses YAML, doesn't expand env vars
-            assert config["database"]["password"] == "${TEST_VAR}"
-            assert config["database"]["host"] == "localhost"
-            assert config["settings"]["debug"] is True
-        finally:
-            os.unlink(temp_path)
+        config = load_config(str(config_file))
+        # load_config now only parses YAML, doesn't expand env vars
+        assert config["database"]["password"] == "${TEST_VAR}"
+        assert config["database"]["host"] == "localhost"
+        assert config["settings"]["debug"] is True
 
 
 
 class TestConfigLoaderIntegration:
     def test_load_actual_config_file(self):
         """Integration test with the actual config.yaml file"""
-        config_path = Path(__file__).parent.parent / "config.yaml"
-        if config_path.exists():
+        if CONFIG_PATH.exists():
             # This should not raise any exceptions
-            config = load_config(str(config_path))
+            config = load_config(str(CONFIG_PATH))
 
             # Verify basic structure
             assert isinstance(config, dict)
@@ -91,3 +77,122 @@ class TestConfigLoaderIntegration:
             # Verify environment variable placeholders are preserved (not expanded)
             assert config["auth"]["x_bearer_token"] == "${DIR_X_API_TOKEN}"
             assert config["auth"]["imap_password"] == "${DIR_EMAIL_PASS}"
+
+
+class TestLoadConfigCache:
+    def test_unchanged_file_not_reparsed(self, tmp_path, monkeypatch):
+        """Test load_config reuses the parse of an unchanged file"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: intel.db\n")
+        assert load_config(str(config_file)) == {"storage": {"sqlite_path": "intel.db"}}
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("unchanged config file was parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail_load)
+        assert load_config(str(config_file)) == {"storage": {"sqlite_path": "intel.db"}}
+
+    def test_modified_file_reparsed(self, tmp_path):
+        """Test load_config parses a file again after it changes"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: first.db\n")
+        assert load_config(str(config_file))["storage"]["sqlite_path"] == "first.db"
+
+        config_file.write_text("storage:\n  sqlite_path: second_path.db\n")
+        assert load_config(str(config_file))["storage"]["sqlite_path"] == "second_path.db"
+
+    def test_returns_independent_copies(self, tmp_path):
+        """Test modifying a returned config does not affect later loads"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: intel.db\n")
+        load_config(str(config_file))["storage"]["sqlite_path"] = "changed.db"
+
+        assert load_config(str(config_file))["storage"]["sqlite_path"] == "intel.db"
+
+    def test_parse_shared_with_settings(self, tmp_path, monkeypatch):
+        """Test Settings.from_yaml reuses the parse load_config made of the same file"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: intel.db\n")
+        load_config(str(config_file))
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("unchanged config file was parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail_load)
+        assert Settings.from_yaml(config_file).storage.sqlite_path == "intel.db"
+
+
+ANCHORED_YAML = """
+defaults: &defaults
+  timeout: 30
+  retries: 2
+storage:
+  sqlite_path: intel.db
+service:
+  <<: *defaults
+  name: intel
+logging:
+  settings: *defaults
+"""
+
+
+class TestLoadConfigHeader:
+    @pytest.mark.parametrize(
+        "keys", [{"storage"}, {"storage", "logging", "auth"}, {"auth", "missing"}, set()]
+    )
+    def test_matches_load_config(self, keys):
+        """Test load_config_header returns the same values as load_config for the keys"""
+        config = load_config(str(CONFIG_PATH))
+        expected = {key: value for key, value in config.items() if key in keys}
+
+        assert load_config_header(str(CONFIG_PATH), keys) == expected
+
+    @pytest.mark.parametrize(
+        "keys", [{"storage"}, {"service"}, {"logging"}, {"defaults", "logging"}]
+    )
+    def test_anchors_and_merge_keys(self, tmp_path, keys):
+        """Test aliases and merge keys resolve as they do in load_config"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(ANCHORED_YAML)
+        config = load_config(str(config_file))
+        expected = {key: value for key, value in config.items() if key in keys}
+
+        assert load_config_header(str(config_file), keys) == expected
+
+    def test_stops_after_requested_keys(self, tmp_path):
+        """Test the document after the last requested key is never parsed"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: intel.db\nrest: [unterminated\n")
+
+        assert load_config_header(str(config_file), {"storage"}) == {
+            "storage": {"sqlite_path": "intel.db"}
+        }
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_config_header(str(config_file), {"rest"})
+
+    @pytest.mark.parametrize("key", ["{a: 1}", "[a, b]"])
+    def test_unhashable_key(self, tmp_path, key):
+        """Test an unhashable top-level key raises the same error as load_config"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(f"? {key}\n: x\nstorage:\n  sqlite_path: intel.db\n")
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_config(str(config_file))
+
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_config_header(str(config_file), {"storage"})
+
+    def test_missing_file(self):
+        """Test load_config_header raises FileNotFoundError for missing file"""
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            load_config_header("nonexistent.yaml", {"storage"})
+
+    @pytest.mark.parametrize(
+        "content, message", [("", "is empty"), ("- item1\n- item2", "must contain a dictionary")]
+    )
+    def test_invalid_root(self, tmp_path, content, message):
+        """Test empty and non-dict files raise the same errors as load_config"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(content)
+
+        with pytest.raises(ValueError, match=message):
+            load_config_header(str(config_file), {"storage"})
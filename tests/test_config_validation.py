@@ -5,9 +5,11 @@ import pytest
 
 from src.intel.config_schema import (
     REQUIRED_ENV_VARS,
+    REQUIRED_ENV_VARS_ORDERED,
     get_missing_required_vars,
     get_remediation_message,
 )
+from src.models.config import Settings
 
 
 class TestConfigSchema:
@@ -42,6 +44,12 @@ class TestConfigSchema:
         for var in REQUIRED_ENV_VARS:
             assert var in missing
 
+    def test_get_missing_required_vars_fixed_order(self):
+        """Test missing variables are reported in declaration order."""
+        missing = get_missing_required_vars({"DIR_EMAIL_PASS": "pass"})
+        assert missing == ["DIR_X_API_TOKEN", "DIR_TRANSCRIPT_API_KEY"]
+        assert get_missing_required_vars({}) == list(REQUIRED_ENV_VARS_ORDERED)
+
     def test_get_missing_required_vars_empty_values_considered_missing(self):
         """Test that empty string values are considered missing."""
         env_vars = {
@@ -79,75 +87,31 @@ class TestConfigSchema:
 class TestConfigValidationIntegration:
     """Integration tests for configuration validation."""
 
-    def test_settings_validation_with_actual_env(self, monkeypatch):
+    def test_settings_validation_with_actual_env(self, settings_yaml, monkeypatch):
         """Test that Settings.from_yaml works with valid environment variables."""
-        import os
-        import tempfile
-
-        from src.models.config import Settings
-
         # Set required environment variables
         monkeypatch.setenv("DIR_X_API_TOKEN", "test_token")
         monkeypatch.setenv("DIR_EMAIL_PASS", "test_pass")
         monkeypatch.setenv("DIR_TRANSCRIPT_API_KEY", "test_key")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
-auth:
-  x_bearer_token: ${DIR_X_API_TOKEN}
-  imap_password: ${DIR_EMAIL_PASS}
-transcription:
-  provider: whisper
-  api_key: ${DIR_TRANSCRIPT_API_KEY}
-"""
-            )
-            temp_path = f.name
-
-        try:
-            settings = Settings.from_yaml(temp_path)
-            assert settings.auth.x_bearer_token == "test_token"
-            assert settings.auth.imap_password == "test_pass"
-            assert settings.transcription.api_key == "test_key"
-        finally:
-            os.unlink(temp_path)
-
-    def test_settings_validation_with_empty_strings_raises_error(self, monkeypatch):
-        """Test that empty string environment variables cause validation to fail."""
-        import os
-        import tempfile
-
-        from src.models.config import Settings
+        settings = Settings.from_yaml(settings_yaml)
+        assert settings.auth.x_bearer_token == "test_token"
+        assert settings.auth.imap_password == "test_pass"
+        assert settings.transcription.api_key == "test_key"
 
+    def test_settings_validation_with_empty_strings_raises_error(self, settings_yaml, monkeypatch):
+        """Test that empty string environment variables cause validation to fail."""
         # Set empty environment variables
         monkeypatch.setenv("DIR_X_API_TOKEN", "")
         monkeypatch.setenv("DIR_EMAIL_PASS", "valid_pass")
         monkeypatch.setenv("DIR_TRANSCRIPT_API_KEY", "valid_key")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
-auth:
-  x_bearer_token: ${DIR_X_API_TOKEN}
-  imap_password: ${DIR_EMAIL_PASS}
-transcription:
-  provider: whisper
-  api_key: ${DIR_TRANSCRIPT_API_KEY}
-"""
-            )
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Authentication field cannot be empty string"):
-                Settings.from_yaml(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Authentication field cannot be empty string"):
+            Settings.from_yaml(settings_yaml)
 
     def test_get_missing_required_vars_integration(self, monkeypatch):
         """Test get_missing_required_vars and get_remediation_message functions
         with actual environment."""
-        import os
-
         # Clear environment variables
         for var in REQUIRED_ENV_VARS:
             monkeypatch.delenv(var, raising=False)
@@ -155,7 +119,7 @@ transcription:
         # Set only some variables
         monkeypatch.setenv("DIR_X_API_TOKEN", "test_token")
 
-        missing = get_missing_required_vars(dict(os.environ))
+        missing = get_missing_required_vars()
         assert "DIR_EMAIL_PASS" in missing
         assert "DIR_TRANSCRIPT_API_KEY" in missing
         assert "DIR_X_API_TOKEN" not in missing
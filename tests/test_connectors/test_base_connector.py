@@ -1,13 +1,14 @@
 """
 Tests for base connector functionality.
 """
+import asyncio
 from typing import Any, AsyncIterator, Dict, Optional
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
-from src.connectors.base import BaseConnector
+from src.connectors.base import HASH_OFFLOAD_THRESHOLD, BaseConnector
 from src.database import Database
 from src.models.post import Post
 from src.models.source import Source, SourceType
@@ -20,11 +21,13 @@ class MockConnector(BaseConnector):
         super().__init__(source, db, http_client)
         self.raw_data_items = []
         self.normalize_responses = {}
+        self.state_updates = {}
     
     async def fetch_raw_data(
         self, fetch_state: Optional[Dict[str, Any]] = None
     ) -> AsyncIterator[Dict[str, Any]]:
-        """Yield test data."""
+        """Queue the configured state updates and yield test data."""
+        self.fetch_state_updates.update(self.state_updates)
         for item in self.raw_data_items:
             yield item
     
@@ -33,9 +36,9 @@ class MockConnector(BaseConnector):
         return self.normalize_responses.get(id(raw_data))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_source():
-    """Create a mock source."""
+    """Create a mock source, shared by the module's tests since none modify it."""
     return Source(
         id=1,
         type=SourceType.RSS,
@@ -50,15 +53,15 @@ def mock_db():
     """Create a mock database."""
     db = Mock(spec=Database)
     db.get_source_fetch_state = AsyncMock(return_value=None)
-    db.post_exists_by_hash = AsyncMock(return_value=False)
-    db.insert_post = AsyncMock(return_value=1)
+    db.filter_existing_hashes = AsyncMock(return_value=set())
+    db.insert_posts_many = AsyncMock(return_value=[])
     db.update_source_fetch_state = AsyncMock()
     return db
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_http_client():
-    """Create a mock HTTP client."""
+    """Create a mock HTTP client, shared by the module's tests since none call it."""
     return Mock(spec=httpx.AsyncClient)
 
 
@@ -77,7 +80,8 @@ class TestBaseConnector:
         assert connector.source == mock_source
         assert connector.db == mock_db
         assert connector.http_client == mock_http_client
-        assert "MockConnector:Test Source" in connector.logger.name
+        assert connector.logger.name.endswith(".MockConnector")
+        assert connector.logger.extra == {'source': "Test Source"}
     
     def test_extract_fetch_state_with_guid(self):
         """Test extract_fetch_state with source_guid."""
@@ -108,6 +112,20 @@ class TestBaseConnector:
         state = connector.extract_fetch_state(post)
         assert state['last_seen_id'] == "https://example.com"
     
+    def test_extract_fetch_state_uses_run_timestamp(self):
+        """Test extract_fetch_state reuses the timestamp stamped by run()."""
+        connector = MockConnector(Mock(), Mock(), Mock())
+        post = Post(
+            source_id=1,
+            title="Test",
+            content="Content",
+            source_guid="guid-123",
+            url="https://example.com"
+        )
+        
+        state = connector.extract_fetch_state(post, "2024-01-01T00:00:00")
+        assert state['last_fetch_timestamp'] == "2024-01-01T00:00:00"
+    
     @pytest.mark.asyncio
     async def test_run_successful_flow(self, mock_connector, mock_db):
         """Test successful run with new posts."""
@@ -138,15 +156,12 @@ class TestBaseConnector:
         stats = await mock_connector.run()
         
         # Verify stats
-        assert stats['fetched'] == 2
-        assert stats['new'] == 2
-        assert stats['duplicate'] == 0
-        assert stats['error'] == 0
+        assert stats == {'fetched': 2, 'new': 2, 'duplicate': 0, 'error': 0}
         
         # Verify database calls
         assert mock_db.get_source_fetch_state.call_count == 1
-        assert mock_db.post_exists_by_hash.call_count == 2
-        assert mock_db.insert_post.call_count == 2
+        assert mock_db.filter_existing_hashes.call_count == 1
+        mock_db.insert_posts_many.assert_called_once_with([post1, post2])
         assert mock_db.update_source_fetch_state.call_count == 1
     
     @pytest.mark.asyncio
@@ -165,19 +180,16 @@ class TestBaseConnector:
         mock_connector.normalize_responses = {id(raw_item): post}
         
         # Mark post as duplicate
-        mock_db.post_exists_by_hash.return_value = True
+        mock_db.filter_existing_hashes.side_effect = lambda hashes: set(hashes)
         
         # Run connector
         stats = await mock_connector.run()
         
         # Verify stats
-        assert stats['fetched'] == 1
-        assert stats['new'] == 0
-        assert stats['duplicate'] == 1
-        assert stats['error'] == 0
+        assert stats == {'fetched': 1, 'new': 0, 'duplicate': 1, 'error': 0}
         
         # Verify no insert was called
-        assert mock_db.insert_post.call_count == 0
+        assert mock_db.insert_posts_many.call_count == 0
         # Verify no state update (no new posts)
         assert mock_db.update_source_fetch_state.call_count == 0
     
@@ -195,10 +207,7 @@ class TestBaseConnector:
         stats = await mock_connector.run()
         
         # Verify stats
-        assert stats['fetched'] == 1
-        assert stats['new'] == 0
-        assert stats['duplicate'] == 0
-        assert stats['error'] == 1
+        assert stats == {'fetched': 1, 'new': 0, 'duplicate': 0, 'error': 1}
     
     @pytest.mark.asyncio
     async def test_run_with_incremental_fetch(self, mock_connector, mock_db):
@@ -226,11 +235,147 @@ class TestBaseConnector:
         stats = await mock_connector.run()
         
         # Item was fetched but not processed
-        assert stats['fetched'] == 1
-        assert stats['new'] == 0
-        assert stats['duplicate'] == 0
-        assert stats['error'] == 0
+        assert stats == {'fetched': 1, 'new': 0, 'duplicate': 0, 'error': 0}
         
         # No database operations should occur
-        assert mock_db.post_exists_by_hash.call_count == 0
-        assert mock_db.insert_post.call_count == 0
\ No newline at end of file
+        assert mock_db.filter_existing_hashes.call_count == 0
+        assert mock_db.insert_posts_many.call_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_run_hashes_large_content_off_loop(self, mock_connector, mock_db):
+        """Test large content is hashed in a worker thread with the same result."""
+        raw_item = {"id": 1}
+        content = "x" * (HASH_OFFLOAD_THRESHOLD + 1)
+        post = Post(source_id=1, title="Big", content=content, source_guid="guid-1")
+        mock_connector.raw_data_items = [raw_item]
+        mock_connector.normalize_responses = {id(raw_item): post}
+        
+        with patch("src.connectors.base.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            stats = await mock_connector.run()
+        
+        assert stats['new'] == 1
+        assert to_thread.call_count == 1
+        assert post.content_hash == Post.generate_content_hash(1, content, None, "guid-1")
+    
+    @pytest.mark.asyncio
+    async def test_run_batches_database_calls(self, mock_connector, mock_db):
+        """Test posts are checked and inserted in batches of batch_size."""
+        mock_connector.batch_size = 2
+        raw_items = [{"id": i} for i in range(5)]
+        mock_connector.raw_data_items = raw_items
+        mock_connector.normalize_responses = {
+            id(item): Post(
+                source_id=1,
+                title=f"Post {i}",
+                content=f"Content {i}",
+                source_guid=f"guid-{i}"
+            )
+            for i, item in enumerate(raw_items)
+        }
+        
+        stats = await mock_connector.run()
+        
+        assert stats['new'] == 5
+        assert mock_db.filter_existing_hashes.call_count == 3
+        assert [len(call.args[0]) for call in mock_db.insert_posts_many.call_args_list] == [2, 2, 1]
+        # Fetch state tracks the last post inserted
+        state = mock_db.update_source_fetch_state.call_args.args[1]
+        assert state['last_seen_id'] == "guid-4"
+    
+    @pytest.mark.asyncio
+    async def test_run_skips_repeats_within_batch(self, mock_connector, mock_db):
+        """Test a post repeated within one batch is inserted only once."""
+        raw_item1 = {"id": 1}
+        raw_item2 = {"id": 2}
+        mock_connector.raw_data_items = [raw_item1, raw_item2]
+        mock_connector.normalize_responses = {
+            id(raw_item1): Post(source_id=1, title="Post", content="Same", source_guid="guid-1"),
+            id(raw_item2): Post(source_id=1, title="Post", content="Same", source_guid="guid-1"),
+        }
+        
+        stats = await mock_connector.run()
+        
+        assert stats['new'] == 1
+        assert stats['duplicate'] == 1
+        assert len(mock_db.insert_posts_many.call_args.args[0]) == 1
+    
+    @pytest.mark.asyncio
+    async def test_run_skips_repeats_across_batches(self, mock_connector, mock_db):
+        """Test repeats later in the fetch are skipped without another database check."""
+        mock_connector.batch_size = 1
+        raw_items = [{"id": i} for i in range(3)]
+        mock_connector.raw_data_items = raw_items
+        mock_connector.normalize_responses = {
+            id(raw_items[0]): Post(source_id=1, title="A", content="Same", url="https://a"),
+            # No GUID; same URL and content as the first post, so the same hash
+            id(raw_items[1]): Post(source_id=1, title="A", content="Same", url="https://a"),
+            id(raw_items[2]): Post(source_id=1, title="B", content="Other", url="https://b"),
+        }
+        
+        stats = await mock_connector.run()
+        
+        assert stats == {'fetched': 3, 'new': 2, 'duplicate': 1, 'error': 0}
+        assert mock_db.filter_existing_hashes.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_run_skips_repeated_guid_before_hashing(self, mock_connector, mock_db):
+        """Test an item whose GUID was already seen in this fetch is not hashed again."""
+        raw_item1 = {"id": 1}
+        raw_item2 = {"id": 2}
+        mock_connector.raw_data_items = [raw_item1, raw_item2]
+        mock_connector.normalize_responses = {
+            id(raw_item1): Post(source_id=1, title="Post", content="First", source_guid="guid-1"),
+            id(raw_item2): Post(source_id=1, title="Post", content="Edited", source_guid="guid-1"),
+        }
+        
+        with patch.object(Post, 'generate_content_hash', wraps=Post.generate_content_hash) as gen:
+            stats = await mock_connector.run()
+        
+        assert stats['duplicate'] == 1
+        assert gen.call_count == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failing_call", ["filter_existing_hashes", "insert_posts_many"])
+    async def test_run_drops_state_updates_after_storage_error(
+        self, mock_connector, mock_db, failing_call
+    ):
+        """Test cache validators are not saved when posts from the fetch failed to store."""
+        mock_connector.batch_size = 1
+        raw_items = [{"id": 1}, {"id": 2}]
+        mock_connector.raw_data_items = raw_items
+        mock_connector.normalize_responses = {
+            id(raw_items[0]): Post(source_id=1, title="A", content="First", source_guid="guid-1"),
+            id(raw_items[1]): Post(source_id=1, title="B", content="Second", source_guid="guid-2"),
+        }
+        mock_connector.state_updates = {'etag': '"v2"'}
+        # The first batch is stored, the second fails
+        getattr(mock_db, failing_call).side_effect = [
+            getattr(mock_db, failing_call).return_value,
+            RuntimeError("database is locked"),
+        ]
+        
+        stats = await mock_connector.run()
+        
+        assert stats == {'fetched': 2, 'new': 1, 'duplicate': 0, 'error': 1}
+        mock_db.update_source_fetch_state.assert_called_once()
+        state = mock_db.update_source_fetch_state.call_args.args[1]
+        assert state['last_seen_id'] == "guid-1"
+        assert 'etag' not in state
+    
+    @pytest.mark.asyncio
+    async def test_run_saves_state_updates_without_new_posts(self, mock_connector, mock_db):
+        """Test cache validators are saved when every post was already stored."""
+        raw_item = {"id": 1}
+        post = Post(source_id=1, title="A", content="First", source_guid="guid-1")
+        mock_connector.raw_data_items = [raw_item]
+        mock_connector.normalize_responses = {id(raw_item): post}
+        mock_connector.state_updates = {'etag': '"v2"'}
+        mock_db.get_source_fetch_state.return_value = {'last_seen_id': 'guid-1'}
+        mock_db.filter_existing_hashes.side_effect = lambda hashes: set(hashes)
+        
+        stats = await mock_connector.run()
+        
+        assert stats == {'fetched': 1, 'new': 0, 'duplicate': 1, 'error': 0}
+        mock_db.update_source_fetch_state.assert_called_once_with(
+            1, {'last_seen_id': 'guid-1', 'etag': '"v2"'}
+        )
@@ -51,6 +51,12 @@ class TestBaseConnectorConfig:
         
         with pytest.raises(ValidationError):
             BaseConnectorConfig(fetch_interval_minutes="not an int")
+    
+    def test_config_is_frozen(self):
+        """Test that validated configs are immutable."""
+        config = BaseConnectorConfig()
+        with pytest.raises(ValidationError):
+            config.timeout_seconds = 5  # type: ignore[misc]
 
 
 class TestRSSConfig:
@@ -82,4 +88,12 @@ class TestRSSConfig:
         """Test empty keyword lists."""
         config = RSSConfig(filter_keywords=[], exclude_keywords=[])
         assert config.filter_keywords == []
-        assert config.exclude_keywords == []
\ No newline at end of file
+        assert config.exclude_keywords == []
+        assert config.include_matcher is None
+        assert config.exclude_matcher is None
+    
+    def test_keyword_matchers_compiled(self):
+        """Test keyword filters are compiled once with the config."""
+        config = RSSConfig(filter_keywords=["AI"], exclude_keywords=["Spam"])
+        assert config.include_matcher.keywords == ("ai",)
+        assert config.exclude_matcher.keywords == ("spam",)
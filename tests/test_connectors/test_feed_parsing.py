@@ -0,0 +1,184 @@
+"""
+Tests for the lxml-based feed parser.
+"""
+import feedparser
+import pytest
+
+from src.connectors import feed_parsing
+from src.connectors.feed_parsing import parse_feed
+
+pytest.importorskip("lxml")
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Test Blog</title>
+    <link>https://example.com</link>
+    <item>
+      <title>First &amp; Post</title>
+      <link>https://example.com/post1</link>
+      <guid>post-1</guid>
+      <description><![CDATA[<p>This is the <b>first</b> post</p>]]></description>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 +0200</pubDate>
+      <dc:creator>John Doe</dc:creator>
+      <category>ai</category>
+    </item>
+    <item>
+      <title>Second Post</title>
+      <link>https://example.com/post2</link>
+      <guid isPermaLink="false">post-2</guid>
+      <description>This is the second post</description>
+      <content:encoded>Full content of the second post</content:encoded>
+      <pubDate>Tue, 02 Jan 2024 12:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Third Post</title>
+      <guid>https://example.com/post3</guid>
+      <description>Only a permalink guid</description>
+    </item>
+    <item>
+      <title>Fourth Post</title>
+      <guid isPermaLink="false">post-4</guid>
+    </item>
+  </channel>
+</rss>"""
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Blog</title>
+  <link rel="self" href="https://example.com/feed.atom"/>
+  <link href="https://example.com/"/>
+  <entry>
+    <title>Atom Post</title>
+    <link rel="alternate" href="https://example.com/a1"/>
+    <id>urn:uuid:1</id>
+    <updated>2024-01-03T10:00:00Z</updated>
+    <published>2024-01-02T10:00:00+01:00</published>
+    <summary>Short</summary>
+    <content type="html">&lt;p&gt;Long&lt;/p&gt;</content>
+    <author><name>Jane</name></author>
+    <category term="python"/>
+  </entry>
+</feed>"""
+
+# Escaped and CDATA markup that feedparser sanitizes, plus padding and mojibake it cleans up
+MARKUP_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Markup Blog</title>
+    <link>https://example.com</link>
+    <item>
+      <title>Tom &amp; Jerry &lt;b&gt;live&lt;/b&gt;</title>
+      <link>https://example.com/post1</link>
+      <description>
+        <![CDATA[<p onclick="x()">Hi<script>alert(1)</script> <b style="color:red">there</b></p>]]>
+      </description>
+      <content:encoded>&lt;p&gt;CafÃ© &lt;iframe src="https://evil"&gt;&lt;/iframe&gt;&lt;/p&gt;</content:encoded>
+    </item>
+    <item>
+      <title>  Padded  </title>
+      <description>AT&amp;T &lt;img src=x onerror=y&gt;</description>
+    </item>
+  </channel>
+</rss>"""
+
+ATOM_MARKUP_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Blog</title>
+  <entry>
+    <title type="html">&lt;em&gt;Atom&lt;/em&gt; Post</title>
+    <id>urn:uuid:1</id>
+    <summary type="text">  &lt;b&gt;not html&lt;/b&gt; </summary>
+    <content type="html">&lt;p&gt;Long&lt;script&gt;bad()&lt;/script&gt;&lt;/p&gt;</content>
+  </entry>
+</feed>"""
+
+COMPARED_KEYS = [
+    'title', 'link', 'id', 'guid', 'summary', 'published_parsed', 'updated_parsed', 'author'
+]
+
+
+class TestParseFeed:
+    """Tests for parse_feed."""
+
+    @pytest.mark.parametrize("document", [RSS_FEED, ATOM_FEED])
+    def test_matches_feedparser(self, document):
+        """Test entries carry the same values feedparser would produce."""
+        expected = feedparser.parse(document)
+        feed_info, entries = parse_feed(document.encode())
+
+        assert feed_info['title'] == expected.feed['title']
+        assert feed_info['link'] == expected.feed['link']
+        assert len(entries) == len(expected.entries)
+        for entry, reference in zip(entries, expected.entries, strict=True):
+            for key in COMPARED_KEYS:
+                assert entry.get(key) == reference.get(key), key
+            assert entry.get('content') == (
+                [{'value': reference['content'][0]['value']}] if 'content' in reference else None
+            )
+            assert entry.get('tags', []) == [{'term': t['term']} for t in reference.get('tags', [])]
+
+    @pytest.mark.parametrize("document", [MARKUP_FEED, ATOM_MARKUP_FEED], ids=["rss", "atom"])
+    def test_text_cleaned_up_like_feedparser(self, document):
+        """Test titles, summaries and content are sanitized and stripped as feedparser does."""
+        expected = feedparser.parse(document.encode())
+        _, entries = parse_feed(document.encode())
+
+        for entry, reference in zip(entries, expected.entries, strict=True):
+            assert entry['title'] == reference['title']
+            assert entry.get('summary') == reference.get('summary')
+            assert entry.get('content', [{}])[0].get('value') == (
+                reference['content'][0]['value'] if 'content' in reference else None
+            )
+
+    def test_decodes_declared_encoding(self):
+        """Test the document encoding is taken from the XML declaration."""
+        document = RSS_FEED.replace('UTF-8', 'ISO-8859-1').replace('Second Post', 'Caf\u00e9 Post')
+        _, entries = parse_feed(document.encode('iso-8859-1'))
+
+        assert entries[1]['title'] == 'Caf\u00e9 Post'
+
+    def test_stops_after_max_items(self):
+        """Test parsing stops once max_items entries have been read."""
+        _, entries = parse_feed(RSS_FEED.encode(), max_items=1)
+
+        assert [entry['guid'] for entry in entries] == ['post-1']
+
+    def test_malformed_feed_returns_none(self):
+        """Test malformed XML is left to feedparser."""
+        assert parse_feed(b"<rss><channel><item><title>Broken</channel></rss>") is None
+
+    def test_undeclared_namespace_returns_none(self):
+        """Test feeds using undeclared prefixes are left to feedparser."""
+        document = RSS_FEED.replace(
+            ' xmlns:content="http://purl.org/rss/1.0/modules/content/"', ''
+        )
+        assert parse_feed(document.encode()) is None
+
+    def test_inline_markup_returns_none(self):
+        """Test inline XHTML content is left to feedparser."""
+        document = ATOM_FEED.replace(
+            '<content type="html">&lt;p&gt;Long&lt;/p&gt;</content>',
+            '<content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Long</div></content>',
+        )
+        assert parse_feed(document.encode()) is None
+
+    def test_xml_base_returns_none(self):
+        """Test feeds setting xml:base, which feedparser resolves links against, are left to it."""
+        document = ATOM_FEED.replace('<feed ', '<feed xml:base="https://example.com/" ')
+        assert parse_feed(document.encode()) is None
+
+    def test_missing_feedparser_helpers_returns_none(self, monkeypatch):
+        """Test a feedparser without the private text helpers leaves the document to it."""
+        monkeypatch.delattr(feedparser.sanitizer, '_sanitize_html')
+        feed_parsing._import_feedparser_helpers.cache_clear()
+        try:
+            assert parse_feed(MARKUP_FEED.encode()) is None
+        finally:
+            monkeypatch.undo()
+            feed_parsing._import_feedparser_helpers.cache_clear()
+
+    def test_unknown_format_returns_none(self):
+        """Test non-RSS/Atom documents are left to feedparser."""
+        assert parse_feed(b"<html><body>Not a feed</body></html>") is None
@@ -0,0 +1,44 @@
+"""
+Tests for keyword matching.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.connectors.keywords import KeywordMatcher
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def matcher_backend(request):
+    """Run each test with and without the optional Aho-Corasick backend."""
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+        yield
+    else:
+        with patch("src.connectors.keywords.ahocorasick", None):
+            yield
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+    
+    def test_matches_any_keyword(self, matcher_backend):
+        """Test text containing any keyword matches."""
+        matcher = KeywordMatcher(["Python", "rust"])
+        
+        assert matcher.matches("learning python today")
+        assert matcher.matches("why rust")
+        assert not matcher.matches("go and java")
+    
+    def test_matches_substrings(self, matcher_backend):
+        """Test keywords match inside words, like a plain substring check."""
+        matcher = KeywordMatcher(["ai"])
+        
+        assert matcher.matches("training")
+    
+    def test_empty_keyword_matches_everything(self, matcher_backend):
+        """Test an empty keyword matches any text, including empty text."""
+        matcher = KeywordMatcher(["", "rust"])
+        
+        assert matcher.matches("")
+        assert matcher.matches("anything")
@@ -1,7 +1,7 @@
 """
 Tests for connector resilience features.
 """
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -36,20 +36,26 @@ class TestRetryDecorators:
         ])
         decorated = network_retry(mock_func)
         
-        result = decorated()
+        with patch('src.connectors.resilience.time.sleep') as mock_sleep:
+            result = decorated()
         
         assert result == "success"
         assert mock_func.call_count == 3
+        # Exponential backoff clamped to at least 4 seconds
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [4.0, 4.0]
     
     def test_network_retry_exhausts_attempts(self):
         """Test retry gives up after max attempts."""
         mock_func = Mock(side_effect=NetworkError("Network error"))
         decorated = network_retry(mock_func)
         
-        # tenacity raises RetryError when attempts exhausted
-        from tenacity import RetryError
-        with pytest.raises(RetryError):
-            decorated()
+        # The last error is re-raised when attempts are exhausted
+        with patch('src.connectors.resilience.time.sleep') as mock_sleep:
+            with pytest.raises(NetworkError):
+                decorated()
+        
+        # No sleep after the final attempt
+        assert mock_sleep.call_count == 2
         
         # Should try 3 times (initial + 2 retries)
         assert mock_func.call_count == 3
@@ -68,7 +74,7 @@ class TestRetryDecorators:
     def test_rate_limit_retry_respects_retry_after(self):
         """Test rate limit retry waits specified time."""
         # Mock time.sleep to avoid actual waiting
-        with patch('tenacity.nap.time') as mock_nap:
+        with patch('src.connectors.resilience.time.sleep') as mock_sleep:
             error = RateLimitError("Rate limited", retry_after=5)
             mock_func = Mock(side_effect=[error, "success"])
             decorated = rate_limit_retry(mock_func)
@@ -78,25 +84,28 @@ class TestRetryDecorators:
             assert result == "success"
             assert mock_func.call_count == 2
             # Should sleep for 5 seconds (from retry_after)
-            mock_nap.sleep.assert_called_with(5)
+            mock_sleep.assert_called_with(5)
+    
+    @pytest.mark.asyncio
+    async def test_network_retry_async_function(self):
+        """Test retry awaits coroutine functions and sleeps without blocking."""
+        mock_func = AsyncMock(side_effect=[NetworkError("Network error"), "success"])
+        decorated = network_retry(mock_func)
+        
+        with patch('src.connectors.resilience.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await decorated()
+        
+        assert result == "success"
+        assert mock_func.call_count == 2
+        mock_sleep.assert_awaited_once_with(4.0)
     
     def test_get_retry_after_extracts_value(self):
         """Test get_retry_after extracts retry_after from exception."""
-        # Create mock retry state with RateLimitError
-        retry_state = Mock()
-        retry_state.outcome = Mock(failed=True)
-        retry_state.outcome.exception.return_value = RateLimitError("Error", retry_after=30)
-        
-        assert get_retry_after(retry_state) == 30
+        assert get_retry_after(RateLimitError("Error", retry_after=30)) == 30
     
     def test_get_retry_after_defaults_to_60(self):
         """Test get_retry_after defaults when no retry_after."""
-        # Create mock retry state without retry_after
-        retry_state = Mock()
-        retry_state.outcome = Mock(failed=True)
-        retry_state.outcome.exception.return_value = RateLimitError("Error")
-        
-        assert get_retry_after(retry_state) == 60
+        assert get_retry_after(RateLimitError("Error")) == 60
 
 
 class TestCircuitBreaker:
@@ -136,7 +145,8 @@ class TestCircuitBreaker:
     
     def test_circuit_breaker_half_open_after_timeout(self):
         """Test circuit breaker enters half-open state after timeout."""
-        cb = CircuitBreaker(failure_threshold=2, recovery_timeout=1)
+        now = 1000.0
+        cb = CircuitBreaker(failure_threshold=2, recovery_timeout=1, time_source=lambda: now)
         mock_func = Mock(side_effect=Exception("Error"))
         
         # Open the circuit
@@ -145,21 +155,20 @@ class TestCircuitBreaker:
                 cb.call(mock_func)
         
         assert cb.state == CircuitBreaker.OPEN
+        assert cb.last_failure_time == 1000.0
         
-        # Mock time.sleep to avoid actual waiting and control timing
-        with patch('time.time') as mock_time:
-            # Set initial time
-            mock_time.return_value = 1000.0
-            
-            # Record failure time
-            cb.last_failure_time = 1000.0
-            
-            # Advance time past recovery timeout
-            mock_time.return_value = 1002.0  # 2 seconds later
-            
-            # Next call should attempt function (half-open state)
-            with pytest.raises(Exception, match="Error"):
-                cb.call(mock_func)
+        # Still open before the recovery timeout has passed
+        now = 1000.5
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            cb.call(mock_func)
+        assert mock_func.call_count == 2
+        
+        # Advance time past recovery timeout
+        now = 1002.0  # 2 seconds later
+        
+        # Next call should attempt function (half-open state)
+        with pytest.raises(Exception, match="Error"):
+            cb.call(mock_func)
         
         # Function should have been called again
         assert mock_func.call_count == 3
@@ -167,11 +176,12 @@ class TestCircuitBreaker:
     def test_circuit_breaker_resets_on_success(self):
         """Test circuit breaker resets on successful call."""
         cb = CircuitBreaker(failure_threshold=3)
+        mock_func = Mock(side_effect=Exception("Error"))
         
         # Add some failures
         for _ in range(2):
             with pytest.raises(Exception, match="Error"):
-                cb.call(Mock(side_effect=Exception("Error")))
+                cb.call(mock_func)
         
         assert cb.failure_count == 2
         
@@ -226,11 +236,12 @@ class TestCircuitBreaker:
     def test_circuit_breaker_manual_reset(self):
         """Test manual reset of circuit breaker."""
         cb = CircuitBreaker(failure_threshold=2)
+        mock_func = Mock(side_effect=Exception("Error"))
         
         # Open the circuit
         for _ in range(2):
             with pytest.raises(Exception, match="Error"):
-                cb.call(Mock(side_effect=Exception("Error")))
+                cb.call(mock_func)
         
         assert cb.state == CircuitBreaker.OPEN
         
@@ -247,11 +258,45 @@ class TestCircuitBreaker:
         
         assert cb.is_closed
         assert not cb.is_open
+        mock_func = Mock(side_effect=Exception("Error"))
         
         # Open the circuit
         for _ in range(5):  # Default threshold is 5
             with pytest.raises(Exception, match="Error"):
-                cb.call(Mock(side_effect=Exception("Error")))
+                cb.call(mock_func)
         
         assert not cb.is_closed
-        assert cb.is_open
\ No newline at end of file
+        assert cb.is_open
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_acall(self):
+        """Test acall records the awaited outcome."""
+        cb = CircuitBreaker(failure_threshold=1)
+        
+        assert await cb.acall(AsyncMock(return_value="success")) == "success"
+        
+        with pytest.raises(Exception, match="Error"):
+            await cb.acall(AsyncMock(side_effect=Exception("Error")))
+        
+        assert cb.is_open
+    
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_async_decorator(self):
+        """Test decorating a coroutine function counts failures when awaited."""
+        cb = CircuitBreaker(failure_threshold=2)
+        
+        @cb
+        async def test_func(value):
+            if value == "error":
+                raise Exception("Error")
+            return value
+        
+        assert await test_func("hello") == "hello"
+        
+        for _ in range(2):
+            with pytest.raises(Exception, match="Error"):
+                await test_func("error")
+        
+        assert cb.is_open
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            await test_func("hello")
@@ -1,12 +1,14 @@
 """
 Tests for RSS connector.
 """
+from datetime import timezone
 from time import struct_time
 from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
 
+from src.connectors.feed_parsing import parse_feed
 from src.connectors.rss import RSSConnector
 from src.database import Database
 from src.models.source import Source, SourceType
@@ -37,6 +39,28 @@ SAMPLE_RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
   </channel>
 </rss>"""
 
+# Items whose content feedparser sanitizes: markup in CDATA, escaped markup and padding
+MARKUP_RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Markup Blog</title>
+    <item>
+      <title>Scripted</title>
+      <guid>post-1</guid>
+      <description>
+        <![CDATA[<p onclick="x()">Hi<script>alert(1)</script> <b>there</b></p>]]>
+      </description>
+    </item>
+    <item>
+      <title>Escaped</title>
+      <guid>post-2</guid>
+      <content:encoded>
+        &lt;p style="color:red"&gt;Full &lt;iframe src="https://evil"&gt;&lt;/iframe&gt;&lt;/p&gt;
+      </content:encoded>
+    </item>
+  </channel>
+</rss>"""
+
 
 @pytest.fixture
 def mock_source():
@@ -59,7 +83,9 @@ def mock_db():
     db = Mock(spec=Database)
     db.get_source_fetch_state = AsyncMock(return_value=None)
     db.post_exists_by_hash = AsyncMock(return_value=False)
+    db.filter_existing_hashes = AsyncMock(return_value=set())
     db.insert_post = AsyncMock(return_value=1)
+    db.insert_posts_many = AsyncMock(return_value=[])
     db.update_source_fetch_state = AsyncMock()
     return db
 
@@ -68,7 +94,9 @@ def mock_db():
 def mock_http_response():
     """Create a mock HTTP response."""
     response = Mock(spec=httpx.Response)
-    response.text = SAMPLE_RSS_FEED
+    response.status_code = 200
+    response.headers = httpx.Headers()
+    response.content = SAMPLE_RSS_FEED.encode()
     response.raise_for_status = Mock()
     return response
 
@@ -93,9 +121,7 @@ class TestRSSConnector:
     @pytest.mark.asyncio
     async def test_fetch_raw_data_basic(self, rss_connector, mock_http_client):
         """Test basic RSS feed fetching."""
-        items = []
-        async for item in rss_connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in rss_connector.fetch_raw_data()]
         
         # Should have 2 items from sample feed
         assert len(items) == 2
@@ -119,9 +145,7 @@ class TestRSSConnector:
         """Test incremental fetching with previous state."""
         fetch_state = {'last_seen_id': 'post-1'}
         
-        items = []
-        async for item in rss_connector.fetch_raw_data(fetch_state):
-            items.append(item)
+        items = [item async for item in rss_connector.fetch_raw_data(fetch_state)]
         
         # Should stop at post-1, so no items returned
         assert len(items) == 0
@@ -132,9 +156,7 @@ class TestRSSConnector:
         mock_source.config = {'max_items_per_fetch': 1}
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         # Should only return 1 item due to config
         assert len(items) == 1
@@ -150,9 +172,7 @@ class TestRSSConnector:
         }
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         # Should only return the second post
         assert len(items) == 1
@@ -169,9 +189,7 @@ class TestRSSConnector:
         }
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         # Should exclude the first post
         assert len(items) == 1
@@ -188,9 +206,7 @@ class TestRSSConnector:
         }
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         # Should return no items since none match the filter keywords
         assert len(items) == 0
@@ -206,9 +222,7 @@ class TestRSSConnector:
         }
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         # Should return no items since all are excluded
         assert len(items) == 0
@@ -330,6 +344,13 @@ class TestRSSConnector:
         assert post is not None
         assert post.metadata_json['tags'] == ['python', 'programming']
     
+    def test_normalize_to_post_without_tag_terms(self, rss_connector):
+        """Test tags key is omitted when no tag has a term."""
+        entry = {'title': 'Untagged', 'tags': [{'term': ''}, {'label': 'x'}]}
+        post = rss_connector.normalize_to_post({'entry': entry, 'feed_info': {}})
+        
+        assert 'tags' not in post.metadata_json
+    
     def test_normalize_to_post_guid_fallback(self, rss_connector):
         """Test GUID fallback logic."""
         # Test with id
@@ -357,6 +378,7 @@ class TestRSSConnector:
         post = rss_connector.normalize_to_post({'entry': entry, 'feed_info': {}})
         assert post.published_at.day == 15
         assert post.published_at.hour == 10
+        assert post.published_at.tzinfo == timezone.utc
         
         # Test with updated_parsed (no published)
         entry = {
@@ -382,6 +404,29 @@ class TestRSSConnector:
         # Should return None and not raise
         assert post is None
     
+    def test_normalized_content_matches_feedparser(self, rss_connector):
+        """Test both parsers give posts the same content, so content hashes do not change."""
+        feed_content = MARKUP_RSS_FEED.encode()
+        fast = parse_feed(feed_content)
+        assert fast is not None
+        fallback = rss_connector._parse_with_feedparser(
+            feed_content, rss_connector.source.typed_config
+        )
+        
+        contents = [
+            [
+                rss_connector.normalize_to_post({'entry': entry, 'feed_info': feed_info}).content
+                for entry in entries
+            ]
+            for feed_info, entries in (fast, fallback)
+        ]
+        
+        assert contents[0] == contents[1]
+        assert contents[0] == [
+            '<p>Hi <b>there</b></p>',
+            '<p style="color: red;">Full </p>',
+        ]
+    
     @pytest.mark.asyncio
     async def test_integration_with_base_connector(self, rss_connector, mock_db):
         """Test integration with base connector run method."""
@@ -394,9 +439,41 @@ class TestRSSConnector:
         assert stats['duplicate'] == 0
         assert stats['error'] == 0
         
-        # Check database interactions
-        assert mock_db.insert_post.call_count == 2
+        # Check database interactions: one batched lookup and one batched insert
+        assert mock_db.filter_existing_hashes.call_count == 1
+        assert mock_db.insert_posts_many.call_count == 1
+        assert len(mock_db.insert_posts_many.call_args.args[0]) == 2
         assert mock_db.update_source_fetch_state.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_conditional_get_not_modified(self, rss_connector, mock_http_response):
+        """Test saved validators are sent and a 304 yields no entries."""
+        mock_http_response.status_code = 304
+        fetch_state = {'last_seen_id': 'post-1', 'etag': '"abc"', 'last_modified': 'Mon'}
+        
+        items = [item async for item in rss_connector.fetch_raw_data(fetch_state)]
+        
+        assert items == []
+        headers = rss_connector.http_client.get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == 'Mon'
+        mock_http_response.raise_for_status.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_validators_saved_without_new_posts(
+        self, rss_connector, mock_db, mock_http_response
+    ):
+        """Test cache validators are persisted even when every post is a duplicate."""
+        mock_http_response.headers = httpx.Headers({'ETag': '"v2"'})
+        mock_db.get_source_fetch_state.return_value = {'last_seen_id': 'post-9'}
+        mock_db.filter_existing_hashes.side_effect = lambda hashes: set(hashes)
+        
+        stats = await rss_connector.run()
+        
+        assert stats['new'] == 0
+        mock_db.update_source_fetch_state.assert_called_once_with(
+            1, {'last_seen_id': 'post-9', 'etag': '"v2"'}
+        )
 
 
 class TestRSSConnectorRegistration:
@@ -1,16 +1,33 @@
 """
 Tests for RSS connector resilience features.
 """
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
 
-from src.connectors.exceptions import ParseError
+from src.connectors.exceptions import NetworkError, ParseError
 from src.connectors.rss import RSSConnector
 from src.database import Database
 from src.models.source import Source, SourceType
 
+FEED_CONTENT = b"""<rss><channel><title>Test</title>
+<item><title>Test Post</title><link>http://example.com</link></item>
+</channel></rss>"""
+
+
+def feed_response():
+    """Build a successful response carrying FEED_CONTENT."""
+    return Mock(content=FEED_CONTENT, raise_for_status=Mock())
+
+
+def http_status_error(status_code):
+    """Build the error httpx raises for a response with the given status."""
+    return httpx.HTTPStatusError(
+        f"HTTP {status_code}", request=Mock(), response=Mock(status_code=status_code)
+    )
+
 
 @pytest.fixture
 def mock_source():
@@ -31,107 +48,65 @@ def mock_db():
     db = Mock(spec=Database)
     db.get_source_fetch_state = AsyncMock(return_value=None)
     db.post_exists_by_hash = AsyncMock(return_value=False)
+    db.filter_existing_hashes = AsyncMock(return_value=set())
     db.insert_post = AsyncMock(return_value=1)
+    db.insert_posts_many = AsyncMock(return_value=[])
     db.update_source_fetch_state = AsyncMock()
     return db
 
 
+@pytest.fixture(autouse=True)
+def backoff_sleep(monkeypatch):
+    """Skip the real retry backoff; the retry tests only count attempts."""
+    sleep = AsyncMock()
+    monkeypatch.setattr("src.connectors.resilience.asyncio.sleep", sleep)
+    return sleep
+
+
 class TestRSSConnectorResilience:
     """Test RSS connector resilience features."""
     
     @pytest.mark.asyncio
-    async def test_retry_on_network_error(self, mock_source, mock_db):
-        """Test retry logic on network errors."""
-        # Create HTTP client that fails twice then succeeds
-        mock_http_client = Mock(spec=httpx.AsyncClient)
-        responses = [
-            httpx.NetworkError("Network error 1"),
-            httpx.NetworkError("Network error 2"),
-            Mock(text="""<rss><channel><title>Test</title>
-                        <item><title>Test Post</title><link>http://example.com</link></item>
-                        </channel></rss>""", 
-                 raise_for_status=Mock())
-        ]
-        mock_http_client.get = AsyncMock(side_effect=responses)
-        
-        connector = RSSConnector(mock_source, mock_db, mock_http_client)
-        
-        # Should succeed after retries
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
-        
-        # Should have called get 3 times
-        assert mock_http_client.get.call_count == 3
-        # Verify that the data fetched after retry is correct
-        assert len(items) == 1
-        assert items[0]['entry']['title'] == 'Test Post'
-    
-    @pytest.mark.asyncio
-    async def test_retry_on_timeout(self, mock_source, mock_db):
-        """Test retry logic on timeout errors."""
-        mock_http_client = Mock(spec=httpx.AsyncClient)
-        responses = [
-            httpx.TimeoutException("Timeout"),
-            Mock(text="<rss><channel><title>Test</title></channel></rss>", 
-                 raise_for_status=Mock())
-        ]
-        mock_http_client.get = AsyncMock(side_effect=responses)
-        
-        connector = RSSConnector(mock_source, mock_db, mock_http_client)
-        
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
-        
-        assert mock_http_client.get.call_count == 2
-    
-    @pytest.mark.asyncio
-    async def test_retry_on_5xx_errors(self, mock_source, mock_db):
-        """Test retry logic on server errors (5xx)."""
-        mock_http_client = Mock(spec=httpx.AsyncClient)
-        
-        # Create mock responses
-        error_response = Mock(status_code=503)
-        error = httpx.HTTPStatusError(
-            "Service unavailable", request=Mock(), response=error_response
-        )
-        
-        success_response = Mock(
-            text="<rss><channel><title>Test</title></channel></rss>",
-            raise_for_status=Mock()
-        )
-        
-        mock_http_client.get = AsyncMock(side_effect=[error, success_response])
-        
-        connector = RSSConnector(mock_source, mock_db, mock_http_client)
-        
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
-        
-        assert mock_http_client.get.call_count == 2
-    
-    @pytest.mark.asyncio
-    async def test_no_retry_on_4xx_errors(self, mock_source, mock_db):
-        """Test no retry on client errors (4xx)."""
+    @pytest.mark.parametrize(
+        "responses, expected_call_count, expected_exception",
+        [
+            # Network errors are retried until the fetch succeeds
+            (
+                lambda: [
+                    httpx.NetworkError("Network error 1"),
+                    httpx.NetworkError("Network error 2"),
+                    feed_response(),
+                ],
+                3,
+                None,
+            ),
+            (lambda: [httpx.TimeoutException("Timeout"), feed_response()], 2, None),
+            # Server errors (5xx) are retried
+            (lambda: [http_status_error(503), feed_response()], 2, None),
+            # Client errors (4xx) are raised without retrying
+            (lambda: http_status_error(404), 1, httpx.HTTPStatusError),
+            # Exhausting the configured retry attempts re-raises the network error
+            (lambda: httpx.NetworkError("Persistent error"), 3, NetworkError),
+        ],
+        ids=["network_error", "timeout", "5xx", "4xx", "retry_exhaustion"],
+    )
+    async def test_retry_behaviour(
+        self, mock_source, mock_db, responses, expected_call_count, expected_exception
+    ):
+        """Test which fetch errors are retried and how many attempts are made."""
         mock_http_client = Mock(spec=httpx.AsyncClient)
-        
-        # Create 404 error
-        error_response = Mock(status_code=404)
-        error = httpx.HTTPStatusError("Not found", request=Mock(), response=error_response)
-        
-        mock_http_client.get = AsyncMock(side_effect=error)
-        
+        # Responses are built per case so no mock or exception is shared between runs
+        mock_http_client.get = AsyncMock(side_effect=responses())
+
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
-        
-        # Should raise immediately without retry
-        with pytest.raises(httpx.HTTPStatusError):
-            async for _ in connector.fetch_raw_data():
-                pass
-        
-        # Should only call once (no retry)
-        assert mock_http_client.get.call_count == 1
+
+        with pytest.raises(expected_exception) if expected_exception else nullcontext():
+            items = [item async for item in connector.fetch_raw_data()]
+
+        assert mock_http_client.get.call_count == expected_call_count
+        if expected_exception is None:
+            # The feed fetched after the retries is parsed normally
+            assert [item['entry']['title'] for item in items] == ['Test Post']
     
     @pytest.mark.asyncio
     async def test_parse_error_on_invalid_feed(self, mock_source, mock_db):
@@ -139,7 +114,7 @@ class TestRSSConnectorResilience:
         mock_http_client = Mock(spec=httpx.AsyncClient)
         # Use completely invalid XML that feedparser can't handle
         mock_response = Mock(
-            text="Not even XML, just plain text",
+            content=b"Not even XML, just plain text",
             raise_for_status=Mock()
         )
         mock_http_client.get = AsyncMock(return_value=mock_response)
@@ -174,38 +149,17 @@ class TestRSSConnectorResilience:
           </channel>
         </rss>"""
         
-        mock_response = Mock(text=partial_rss, raise_for_status=Mock())
+        mock_response = Mock(content=partial_rss.encode(), raise_for_status=Mock())
         mock_http_client.get = AsyncMock(return_value=mock_response)
         
         connector = RSSConnector(mock_source, mock_db, mock_http_client)
         
         # Should process the valid item despite parse warning
-        items = []
-        async for item in connector.fetch_raw_data():
-            items.append(item)
+        items = [item async for item in connector.fetch_raw_data()]
         
         assert len(items) >= 1  # At least one valid item
         assert items[0]['entry']['title'] == 'Valid Item'
     
-    @pytest.mark.asyncio
-    async def test_retry_exhaustion_raises_error(self, mock_source, mock_db):
-        """Test that exhausting retries raises the error."""
-        mock_http_client = Mock(spec=httpx.AsyncClient)
-        
-        # Always fail with network error
-        mock_http_client.get = AsyncMock(side_effect=httpx.NetworkError("Persistent error"))
-        
-        connector = RSSConnector(mock_source, mock_db, mock_http_client)
-        
-        # Should eventually raise RetryError after retries exhausted
-        from tenacity import RetryError
-        with pytest.raises(RetryError):
-            async for _ in connector.fetch_raw_data():
-                pass
-        
-        # Should have tried 3 times (configured retry attempts)
-        assert mock_http_client.get.call_count == 3
-    
     @pytest.mark.asyncio 
     async def test_successful_retry_resets_state(self, mock_source, mock_db):
         """Test that successful retry properly processes feed."""
@@ -225,7 +179,7 @@ class TestRSSConnectorResilience:
         
         responses = [
             httpx.NetworkError("Temporary error"),
-            Mock(text=valid_rss, raise_for_status=Mock())
+            Mock(content=valid_rss.encode(), raise_for_status=Mock())
         ]
         mock_http_client.get = AsyncMock(side_effect=responses)
         
@@ -237,4 +191,4 @@ class TestRSSConnectorResilience:
         assert stats['fetched'] == 1
         assert stats['new'] == 1
         assert stats['error'] == 0
-        assert mock_db.insert_post.call_count == 1
\ No newline at end of file
+        assert mock_db.insert_posts_many.call_count == 1
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Tests for concurrent connector execution.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from src.connectors import CONNECTOR_REGISTRY
+from src.connectors.base import BaseConnector
+from src.connectors.runner import create_http_client, run_connectors
+from src.database import Database
+from src.models.post import Post
+from src.models.source import Source, SourceType
+
+
+class SlowConnector(BaseConnector):
+    """Connector whose run tracks how many instances are active at once."""
+
+    active = 0
+    peak = 0
+
+    async def fetch_raw_data(
+        self, fetch_state: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield nothing."""
+        return
+        yield
+
+    def normalize_to_post(self, raw_data: Dict[str, Any]) -> Optional[Post]:
+        """Never called."""
+        return None
+
+    async def run(self) -> Dict[str, int]:
+        """Record concurrency, then fail for sources named 'broken'."""
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        if self.source.name == "broken":
+            raise RuntimeError("feed unavailable")
+        return {'fetched': 0, 'new': 0, 'duplicate': 0, 'error': 0}
+
+
+@pytest.fixture
+def slow_connector(monkeypatch):
+    """Register SlowConnector for RSS sources."""
+    monkeypatch.setitem(CONNECTOR_REGISTRY, SourceType.RSS, SlowConnector)
+    SlowConnector.active = 0
+    SlowConnector.peak = 0
+    return SlowConnector
+
+
+def make_source(index: int, name: Optional[str] = None) -> Source:
+    """Create an RSS source."""
+    return Source(
+        id=index,
+        type=SourceType.RSS,
+        identifier=f"https://example.com/{index}.xml",
+        name=name or f"Feed {index}",
+    )
+
+
+class TestRunConnectors:
+    """Tests for run_connectors."""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_within_limit(self, slow_connector):
+        """Test connectors overlap but never exceed the concurrency limit."""
+        sources = [make_source(i) for i in range(6)]
+
+        results = await run_connectors(sources, Mock(spec=Database), Mock(), concurrency=3)
+
+        assert len(results) == 6
+        assert slow_connector.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_other_sources(self, slow_connector):
+        """Test a failing connector is reported in place without stopping the rest."""
+        sources = [make_source(1), make_source(2, "broken"), make_source(3)]
+
+        results = await run_connectors(sources, Mock(spec=Database), Mock())
+
+        assert results[0]['fetched'] == 0
+        assert isinstance(results[1], RuntimeError)
+        assert results[2]['fetched'] == 0
+
+
+class TestCreateHttpClient:
+    """Tests for create_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_creates_async_client(self):
+        """Test the shared client is an AsyncClient with the requested timeout."""
+        client = create_http_client(timeout_seconds=5)
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+            assert client.timeout.read == 5
+        finally:
+            await client.aclose()
@@ -1,7 +1,6 @@
 """Test environment variable precedence and validation."""
 
 import os
-import tempfile
 
 import pytest
 
@@ -32,31 +31,14 @@ class TestEnvPrecedence:
             ),
         ],
     )
-    def test_env_vars_override_yaml(self, env_vars, expected_token, monkeypatch):
+    def test_env_vars_override_yaml(self, env_vars, expected_token, monkeypatch, settings_yaml):
         """Test that environment variables override YAML config values."""
         # Set environment variables
         for key, value in env_vars.items():
             monkeypatch.setenv(key, value)
 
-        # Create temporary YAML config
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
-auth:
-  x_bearer_token: ${DIR_X_API_TOKEN}
-  imap_password: ${DIR_EMAIL_PASS}
-transcription:
-  provider: whisper
-  api_key: ${DIR_TRANSCRIPT_API_KEY}
-"""
-            )
-            temp_path = f.name
-
-        try:
-            config = Settings.from_yaml(temp_path)
-            assert config.auth.x_bearer_token == expected_token
-        finally:
-            os.unlink(temp_path)
+        config = Settings.from_yaml(settings_yaml)
+        assert config.auth.x_bearer_token == expected_token
 
     def test_dotenv_file_support(self, monkeypatch, tmp_path):
         """Test that .env file variables are loaded."""
@@ -87,7 +69,7 @@ transcription:
         original_cwd = os.getcwd()
         try:
             os.chdir(tmp_path)
-            config = Settings.from_yaml(str(config_file))
+            config = Settings.from_yaml(config_file)
             assert config.auth.x_bearer_token == "dotenv_token"
             assert config.auth.imap_password == "dotenv_pass"
             assert config.transcription.api_key == "dotenv_key"
@@ -121,7 +103,7 @@ transcription:
         original_cwd = os.getcwd()
         try:
             os.chdir(tmp_path)
-            config = Settings.from_yaml(str(config_file))
+            config = Settings.from_yaml(config_file)
             assert config.auth.x_bearer_token == "env_override"  # env wins over .env
         finally:
             os.chdir(original_cwd)
@@ -130,33 +112,17 @@ transcription:
 class TestConfigValidation:
     """Test configuration validation and error handling."""
 
-    def test_missing_required_env_vars_sets_none_values(self, monkeypatch):
+    def test_missing_required_env_vars_sets_none_values(self, monkeypatch, settings_yaml):
         """Test that missing environment variables result in None values."""
         # Clear all relevant env vars
         for var in ["DIR_X_API_TOKEN", "DIR_EMAIL_PASS", "DIR_TRANSCRIPT_API_KEY"]:
             monkeypatch.delenv(var, raising=False)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
-auth:
-  x_bearer_token: ${DIR_X_API_TOKEN}
-  imap_password: ${DIR_EMAIL_PASS}
-transcription:
-  provider: whisper
-  api_key: ${DIR_TRANSCRIPT_API_KEY}
-"""
-            )
-            temp_path = f.name
-
-        try:
-            settings = Settings.from_yaml(temp_path)
-            # Missing env vars should result in None values
-            assert settings.auth.x_bearer_token is None
-            assert settings.auth.imap_password is None
-            assert settings.transcription.api_key is None
-        finally:
-            os.unlink(temp_path)
+        settings = Settings.from_yaml(settings_yaml)
+        # Missing env vars should result in None values
+        assert settings.auth.x_bearer_token is None
+        assert settings.auth.imap_password is None
+        assert settings.transcription.api_key is None
 
     @pytest.mark.parametrize(
         "malformed_value",
@@ -166,40 +132,24 @@ transcription:
             "\t\n",
         ],
     )
-    def test_malformed_env_values_raise_error(self, malformed_value, monkeypatch):
+    def test_malformed_env_values_raise_error(self, malformed_value, monkeypatch, settings_yaml):
         """Test that malformed environment variable values raise validation errors."""
         monkeypatch.setenv("DIR_X_API_TOKEN", malformed_value)
         monkeypatch.setenv("DIR_EMAIL_PASS", "valid_pass")
         monkeypatch.setenv("DIR_TRANSCRIPT_API_KEY", "valid_key")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
-auth:
-  x_bearer_token: ${DIR_X_API_TOKEN}
-  imap_password: ${DIR_EMAIL_PASS}
-transcription:
-  provider: whisper
-  api_key: ${DIR_TRANSCRIPT_API_KEY}
-"""
-            )
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Authentication field cannot be empty string"):
-                Settings.from_yaml(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Authentication field cannot be empty string"):
+            Settings.from_yaml(settings_yaml)
 
-    def test_valid_config_loads_successfully(self, monkeypatch):
+    def test_valid_config_loads_successfully(self, monkeypatch, tmp_path):
         """Test that valid configuration loads without errors."""
         monkeypatch.setenv("DIR_X_API_TOKEN", "valid_token")
         monkeypatch.setenv("DIR_EMAIL_PASS", "valid_pass")
         monkeypatch.setenv("DIR_TRANSCRIPT_API_KEY", "valid_key")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 storage:
   sqlite_path: "./data/test.db"
 auth:
@@ -212,18 +162,14 @@ llm:
   provider: ollama
   model: llama3:8b
 """
-            )
-            temp_path = f.name
+        )
 
-        try:
-            config = Settings.from_yaml(temp_path)
-            assert config.auth.x_bearer_token == "valid_token"
-            assert config.auth.imap_password == "valid_pass"
-            assert config.transcription.api_key == "valid_key"
-            assert config.storage.sqlite_path == "./data/test.db"
-            assert config.llm.provider == "ollama"
-        finally:
-            os.unlink(temp_path)
+        config = Settings.from_yaml(config_file)
+        assert config.auth.x_bearer_token == "valid_token"
+        assert config.auth.imap_password == "valid_pass"
+        assert config.transcription.api_key == "valid_key"
+        assert config.storage.sqlite_path == "./data/test.db"
+        assert config.llm.provider == "ollama"
 
 
 class TestErrorMessages:
@@ -234,26 +180,18 @@ class TestErrorMessages:
         with pytest.raises(FileNotFoundError, match="Config file not found: nonexistent.yaml"):
             Settings.from_yaml("nonexistent.yaml")
 
-    def test_invalid_yaml_error_message(self):
+    def test_invalid_yaml_error_message(self, tmp_path):
         """Test that invalid YAML produces helpful error message."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            temp_path = f.name
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("invalid: yaml: content: [")
 
-        try:
-            with pytest.raises(ValueError, match="Invalid YAML"):
-                Settings.from_yaml(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            Settings.from_yaml(config_file)
 
-    def test_empty_config_error_message(self):
+    def test_empty_config_error_message(self, tmp_path):
         """Test that empty config file produces helpful error message."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("")
-            temp_path = f.name
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("")
 
-        try:
-            with pytest.raises(ValueError, match="Config file .* is empty"):
-                Settings.from_yaml(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValueError, match="Config file .* is empty"):
+            Settings.from_yaml(config_file)
@@ -0,0 +1,100 @@
+"""Tests for database initialization and schema migrations."""
+
+import sqlite3
+from typing import List, Set
+
+from src.intel.init_db import SCHEMA_VERSION, initialize_database
+
+# Tables and index from the version 1 schema that later migrations change
+SCHEMA_V1 = """
+CREATE TABLE sources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL CHECK (type IN ('rss', 'twitter', 'email', 'podcast', 'youtube')),
+    url TEXT NOT NULL,
+    name TEXT NOT NULL,
+    config_json TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    active BOOLEAN DEFAULT TRUE,
+    UNIQUE(type, url)
+);
+CREATE TABLE posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    url TEXT,
+    published_at DATETIME,
+    ingested_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    content_hash TEXT NOT NULL,
+    metadata_json TEXT,
+    FOREIGN KEY (source_id) REFERENCES sources(id) ON DELETE CASCADE,
+    UNIQUE(content_hash)
+);
+CREATE TABLE embeddings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id INTEGER NOT NULL,
+    embedding_blob BLOB NOT NULL,
+    model_name TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
+    UNIQUE(post_id, model_name)
+);
+CREATE INDEX idx_posts_content_hash ON posts(content_hash);
+INSERT INTO sources (id, type, url, name) VALUES (1, 'rss', 'https://example.com/feed', 'Example');
+INSERT INTO posts (id, source_id, title, content, content_hash) VALUES (1, 1, 'T', 'C', 'h1');
+INSERT INTO embeddings (post_id, embedding_blob, model_name) VALUES (1, x'0000803f', 'm');
+PRAGMA user_version = 1;
+"""
+
+
+def embedding_columns(conn: sqlite3.Connection) -> List[str]:
+    """Return the column names of the embeddings table."""
+    return [row[1] for row in conn.execute("PRAGMA table_info(embeddings)")]
+
+
+def index_names(conn: sqlite3.Connection) -> Set[str]:
+    """Return the names of the indexes in the database."""
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+
+
+class TestInitializeDatabase:
+    """Tests for initialize_database."""
+
+    def test_new_database_gets_latest_schema(self, tmp_path):
+        """Test a new database is created at the current schema version."""
+        db_path = tmp_path / "intel.db"
+
+        assert initialize_database(str(db_path))
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            assert {"dtype", "scale"} <= set(embedding_columns(conn))
+            assert "idx_posts_content_hash" not in index_names(conn)
+
+    def test_upgrades_version_1_database(self, tmp_path):
+        """Test a version 1 database is migrated and keeps its rows."""
+        db_path = tmp_path / "intel.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA_V1)
+
+        assert initialize_database(str(db_path))
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            assert embedding_columns(conn)[-2:] == ["dtype", "scale"]
+            assert "idx_posts_content_hash" not in index_names(conn)
+            assert conn.execute("SELECT dtype, scale FROM embeddings").fetchall() == [
+                ("float32", None)
+            ]
+
+    def test_rerun_is_idempotent(self, tmp_path):
+        """Test initializing an up-to-date database again succeeds without changes."""
+        db_path = tmp_path / "intel.db"
+        assert initialize_database(str(db_path))
+
+        assert initialize_database(str(db_path))
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            assert embedding_columns(conn).count("dtype") == 1
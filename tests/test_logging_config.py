@@ -0,0 +1,44 @@
+"""Tests for the queued logging setup."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from src.intel import setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def listener():
+    """Start the queue listener and restore the import-time config afterwards."""
+    yield setup_logging()
+    shutdown_logging()
+
+
+def test_import_does_not_queue_records():
+    """Test importing the package configures logging without the queue listener."""
+    handlers = logging.getLogger("intel").handlers
+    assert handlers
+    assert not any(isinstance(handler, QueueHandler) for handler in handlers)
+
+
+def test_setup_logging_is_idempotent(listener):
+    """Test a second call returns the running listener."""
+    assert setup_logging() is listener
+
+
+def test_record_reaches_listener_handlers(listener, monkeypatch):
+    """Test a record logged on intel is written by the listener's handlers once stopped."""
+    received = {}
+    for handler in listener.handlers:
+        received[handler] = []
+        monkeypatch.setattr(handler, "emit", received[handler].append)
+    logger = logging.getLogger("intel")
+    assert any(isinstance(handler, QueueHandler) for handler in logger.handlers)
+
+    logger.warning("queued record")
+    shutdown_logging()
+
+    assert len(received) == 2
+    for records in received.values():
+        assert [record.getMessage() for record in records] == ["queued record"]
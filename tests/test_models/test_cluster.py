@@ -0,0 +1,50 @@
+"""
+Tests for the Cluster model.
+"""
+import numpy as np
+import pytest
+
+from src.models.cluster import Cluster
+
+
+def make_cluster(centroid: np.ndarray) -> Cluster:
+    """Create a cluster with the given centroid."""
+    cluster = Cluster(label="Topic")
+    cluster.centroid_vector = centroid
+    return cluster
+
+
+class TestCentroidDistance:
+    """Tests for distances to the cluster centroid."""
+
+    def test_distance_and_squared_distance(self):
+        """Test the squared distance is the square of the Euclidean distance."""
+        cluster = make_cluster(np.array([0.0, 3.0], dtype=np.float32))
+        embedding = np.array([4.0, 0.0], dtype=np.float32)
+
+        assert cluster.distance_to_centroid(embedding) == pytest.approx(5.0)
+        assert cluster.sqdistance_to_centroid(embedding) == pytest.approx(25.0)
+
+    def test_requires_centroid(self):
+        """Test a cluster without a centroid is rejected."""
+        with pytest.raises(ValueError, match="must have a centroid"):
+            Cluster(label="Topic").sqdistance_to_centroid(np.ones(2, dtype=np.float32))
+
+    def test_shape_mismatch(self):
+        """Test an embedding of a different dimension is rejected."""
+        cluster = make_cluster(np.ones(2, dtype=np.float32))
+
+        with pytest.raises(ValueError, match="same shape"):
+            cluster.sqdistance_to_centroid(np.ones(3, dtype=np.float32))
+
+
+class TestCentroidNorm:
+    """Tests for the cached centroid norm."""
+
+    def test_norm_follows_vector_cache(self):
+        """Test assigning centroid_vector_cache replaces a norm cached from the blob."""
+        cluster = make_cluster(np.array([1.0, 0.0], dtype=np.float32))
+        assert cluster.centroid_norm == pytest.approx(1.0)
+
+        cluster.centroid_vector_cache = np.array([3.0, 4.0], dtype=np.float32)
+        assert cluster.centroid_norm == pytest.approx(5.0)
@@ -0,0 +1,281 @@
+"""
+Tests for the Embedding model.
+"""
+import numpy as np
+import pytest
+
+from src.models.embedding import Embedding, EmbeddingStore
+
+
+def make_embedding(post_id: int, vector: np.ndarray) -> Embedding:
+    """Create an embedding holding vector."""
+    embedding = Embedding(post_id=post_id, model_name="test-model")
+    embedding.embedding_vector = vector
+    return embedding
+
+
+class TestBatchCosine:
+    """Tests for Embedding.batch_cosine."""
+    
+    def test_matches_pairwise_similarity(self):
+        """Test batch results equal similarity() for each embedding, in order."""
+        rng = np.random.default_rng(0)
+        query = make_embedding(0, rng.random(8, dtype=np.float32))
+        others = [make_embedding(i, rng.random(8, dtype=np.float32)) for i in range(1, 4)]
+        
+        result = Embedding.batch_cosine(query.embedding_vector, others)
+        
+        np.testing.assert_allclose(result, [query.similarity(o) for o in others], atol=1e-6)
+    
+    def test_empty(self):
+        """Test no embeddings gives an empty result."""
+        assert Embedding.batch_cosine(np.ones(8, dtype=np.float32), []).shape == (0,)
+    
+    def test_shape_mismatch(self):
+        """Test embeddings of a different dimension are rejected."""
+        others = [make_embedding(1, np.ones(4, dtype=np.float32))]
+        
+        with pytest.raises(ValueError, match="same shape"):
+            Embedding.batch_cosine(np.ones(8, dtype=np.float32), others)
+    
+    def test_missing_vector(self):
+        """Test embeddings without a vector are rejected."""
+        with pytest.raises(ValueError, match="must have vectors"):
+            Embedding.batch_cosine(np.ones(8), [Embedding(post_id=1, model_name="m")])
+
+
+class TestEmbeddingNorm:
+    """Tests for the cached embedding norm."""
+    
+    def test_norm_follows_stored_vector(self):
+        """Test the norm is recomputed when a new vector is stored."""
+        embedding = make_embedding(1, np.array([3.0, 4.0], dtype=np.float32))
+        assert embedding.embedding_norm == pytest.approx(5.0)
+        
+        embedding.embedding_vector = np.array([6.0, 8.0], dtype=np.float32)
+        assert embedding.embedding_norm == pytest.approx(10.0)
+    
+    def test_norm_from_blob(self):
+        """Test an embedding loaded from a blob computes its norm from it."""
+        blob = np.array([0.0, 2.0], dtype=np.float32).tobytes()
+        embedding = Embedding(post_id=1, model_name="test-model", embedding_blob=blob)
+        
+        assert embedding.embedding_norm == pytest.approx(2.0)
+    
+    def test_similarity_uses_norms(self):
+        """Test similarity with cached norms matches the direct formula."""
+        a = make_embedding(1, np.array([1.0, 0.0, 1.0], dtype=np.float32))
+        b = make_embedding(2, np.array([1.0, 1.0, 0.0], dtype=np.float32))
+        zero = make_embedding(3, np.zeros(3, dtype=np.float32))
+        
+        assert a.similarity(b) == pytest.approx(0.5)
+        assert a.similarity(zero) == 0.0
+    
+    def test_norm_follows_vector_cache(self):
+        """Test assigning embedding_vector_cache replaces a norm cached from the blob."""
+        a = make_embedding(1, np.array([1.0, 0.0, 0.0], dtype=np.float32))
+        b = make_embedding(2, np.array([1.0, 0.0, 0.0], dtype=np.float32))
+        assert a.similarity(b) == pytest.approx(1.0)
+        
+        a.embedding_vector_cache = np.array([3.0, 4.0, 0.0], dtype=np.float32)
+        assert a.embedding_norm == pytest.approx(5.0)
+        assert a.similarity(b) == pytest.approx(0.6)
+        
+        a.embedding_vector_cache = None
+        assert a.embedding_norm == pytest.approx(1.0)
+    
+    def test_norm_follows_scale(self):
+        """Test changing an int8 embedding's scale in place rescales its vector and norm."""
+        embedding = Embedding(post_id=1, model_name="test-model", dtype="int8")
+        embedding.embedding_vector = np.array([0.0, 1.0], dtype=np.float32)
+        assert embedding.embedding_norm == pytest.approx(1.0)
+        
+        embedding.scale *= 2
+        np.testing.assert_allclose(embedding.embedding_vector, [0.0, 2.0])
+        assert embedding.embedding_norm == pytest.approx(2.0)
+
+
+class TestEmbeddingVector:
+    """Tests for decoding embedding_blob."""
+    
+    def test_decoded_view_reused_until_blob_changes(self):
+        """Test the blob is decoded once and again only after it is replaced."""
+        blob = np.array([1.0, 2.0], dtype=np.float32).tobytes()
+        embedding = Embedding(post_id=1, model_name="test-model", embedding_blob=blob)
+        
+        first = embedding.embedding_vector
+        assert embedding.embedding_vector is first
+        
+        embedding.embedding_blob = np.array([3.0, 4.0], dtype=np.float32).tobytes()
+        np.testing.assert_array_equal(embedding.embedding_vector, [3.0, 4.0])
+    
+    def test_setter_keeps_only_the_blob(self):
+        """Test a stored vector is a view of the blob, not the caller's array."""
+        vector = np.array([1.0, 2.0], dtype=np.float32)
+        embedding = make_embedding(1, vector)
+        vector[0] = 9.0
+        
+        assert embedding.embedding_vector_cache is None
+        assert embedding.embedding_vector.base is embedding.embedding_blob
+        np.testing.assert_array_equal(embedding.embedding_vector, [1.0, 2.0])
+
+
+class TestFloat16Storage:
+    """Tests for embeddings stored as float16."""
+    
+    def test_round_trip(self):
+        """Test a float16 embedding stores half-size blobs and decodes as float16."""
+        embedding = Embedding(post_id=1, model_name="test-model", dtype="float16")
+        embedding.embedding_vector = np.array([0.5, 1.0, 2.0], dtype=np.float32)
+        
+        assert len(embedding.embedding_blob) == 6
+        assert embedding.embedding_vector.dtype == np.float16
+        np.testing.assert_array_equal(embedding.embedding_vector, [0.5, 1.0, 2.0])
+    
+    def test_similarity_matches_float32(self):
+        """Test similarity on float16 embeddings stays close to the float32 result."""
+        rng = np.random.default_rng(1)
+        vectors = rng.standard_normal((2, 64)).astype(np.float32)
+        full = [make_embedding(i, v) for i, v in enumerate(vectors)]
+        half = [Embedding(post_id=i, model_name="test-model", dtype="float16") for i in range(2)]
+        for embedding, vector in zip(half, vectors, strict=True):
+            embedding.embedding_vector = vector
+        
+        assert half[0].similarity(half[1]) == pytest.approx(full[0].similarity(full[1]), abs=1e-3)
+    
+    def test_batch_cosine_mixed_dtypes(self):
+        """Test batch_cosine accepts embeddings stored with different dtypes."""
+        vector = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+        half = Embedding(post_id=1, model_name="test-model", dtype="float16")
+        half.embedding_vector = vector
+        others = [make_embedding(2, vector), half]
+        
+        result = Embedding.batch_cosine(vector, others)
+        
+        np.testing.assert_allclose(result, [1.0, 1.0], atol=1e-3)
+
+
+class TestInt8Storage:
+    """Tests for int8-quantized embeddings."""
+    
+    def test_round_trip(self):
+        """Test an int8 embedding stores one byte per value and dequantizes with its scale."""
+        embedding = Embedding(post_id=1, model_name="test-model", dtype="int8")
+        embedding.embedding_vector = np.array([-1.0, 0.5, 0.25], dtype=np.float32)
+        
+        assert len(embedding.embedding_blob) == 3
+        assert embedding.scale == pytest.approx(1.0 / 127)
+        reloaded = Embedding(
+            post_id=1,
+            model_name="test-model",
+            dtype="int8",
+            scale=embedding.scale,
+            embedding_blob=embedding.embedding_blob,
+        )
+        np.testing.assert_allclose(reloaded.embedding_vector, [-1.0, 0.5, 0.25], atol=1 / 127)
+        np.testing.assert_array_equal(reloaded.embedding_vector, embedding.embedding_vector)
+    
+    def test_zero_vector(self):
+        """Test an all-zero vector quantizes without dividing by zero."""
+        embedding = Embedding(post_id=1, model_name="test-model", dtype="int8")
+        embedding.embedding_vector = np.zeros(4, dtype=np.float32)
+        
+        np.testing.assert_array_equal(embedding.stored_vector, np.zeros(4, dtype=np.int8))
+    
+    def test_similarity_matches_float32(self):
+        """Test similarity on int8 embeddings stays close to the float32 result."""
+        rng = np.random.default_rng(2)
+        vectors = rng.standard_normal((2, 384)).astype(np.float32)
+        full = [make_embedding(i, v) for i, v in enumerate(vectors)]
+        quantized = [Embedding(post_id=i, model_name="test-model", dtype="int8") for i in range(2)]
+        for embedding, vector in zip(quantized, vectors, strict=True):
+            embedding.embedding_vector = vector
+        
+        expected = full[0].similarity(full[1])
+        assert quantized[0].similarity(quantized[1]) == pytest.approx(expected, abs=1e-2)
+        assert quantized[0].similarity(full[1]) == pytest.approx(expected, abs=1e-2)
+        np.testing.assert_allclose(
+            Embedding.batch_cosine(vectors[0], [full[1], quantized[1]]), expected, atol=1e-2
+        )
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+    
+    def test_top_k_matches_batch_cosine(self):
+        """Test top_k returns the most similar embeddings in order with their similarities."""
+        rng = np.random.default_rng(3)
+        vectors = rng.standard_normal((50, 16)).astype(np.float32)
+        embeddings = [make_embedding(i, vector) for i, vector in enumerate(vectors)]
+        query = rng.standard_normal(16).astype(np.float32)
+        store = EmbeddingStore(dimension=16, capacity=4)
+        for embedding in embeddings:
+            store.add(embedding)
+        
+        result = store.top_k(query, 5)
+        
+        expected = Embedding.batch_cosine(query, embeddings)
+        best = np.argsort(-expected)[:5]
+        assert len(store) == 50
+        assert [post_id for post_id, _ in result] == [embeddings[i].post_id for i in best]
+        np.testing.assert_allclose([score for _, score in result], expected[best], atol=1e-5)
+    
+    def test_top_k_larger_than_store(self):
+        """Test asking for more results than stored returns all of them."""
+        store = EmbeddingStore(dimension=2)
+        store.add(make_embedding(1, np.array([1.0, 0.0], dtype=np.float32)))
+        store.add(make_embedding(2, np.array([0.0, 1.0], dtype=np.float32)))
+        
+        result = store.top_k(np.array([0.0, 2.0], dtype=np.float32), 10)
+        
+        assert [post_id for post_id, _ in result] == [2, 1]
+        assert result[0][1] == pytest.approx(1.0)
+    
+    def test_add_uses_current_vector_norm(self):
+        """Test a vector assigned to embedding_vector_cache is stored at unit length."""
+        embedding = make_embedding(1, np.array([1.0, 0.0], dtype=np.float32))
+        assert embedding.embedding_norm == pytest.approx(1.0)
+        embedding.embedding_vector_cache = np.array([3.0, 4.0], dtype=np.float32)
+        store = EmbeddingStore(dimension=2)
+        
+        store.add(embedding)
+        
+        np.testing.assert_allclose(store.matrix[0], [0.6, 0.8], atol=1e-6)
+    
+    def test_rejects_wrong_dimension(self):
+        """Test vectors of another dimension are rejected."""
+        store = EmbeddingStore(dimension=3)
+        
+        with pytest.raises(ValueError, match="same shape"):
+            store.add(make_embedding(1, np.ones(2, dtype=np.float32)))
+
+
+class TestTorch:
+    """Tests for the optional torch conversions, run on the CPU device."""
+    
+    def test_to_torch(self):
+        """Test an embedding converts to a tensor with the same values."""
+        torch = pytest.importorskip("torch")
+        embedding = make_embedding(1, np.array([1.0, 2.0], dtype=np.float32))
+        
+        tensor = embedding.to_torch(device="cpu")
+        
+        assert tensor.dtype == torch.float32
+        assert tensor.tolist() == [1.0, 2.0]
+    
+    def test_top_k_torch_matches_top_k(self):
+        """Test the torch search returns the same results as top_k."""
+        torch = pytest.importorskip("torch")
+        rng = np.random.default_rng(4)
+        store = EmbeddingStore(dimension=8)
+        for i, vector in enumerate(rng.standard_normal((20, 8)).astype(np.float32)):
+            store.add(make_embedding(i, vector))
+        query = rng.standard_normal(8).astype(np.float32)
+        
+        result = store.top_k_torch(torch.from_numpy(query), 3)
+        
+        expected = store.top_k(query, 3)
+        assert [post_id for post_id, _ in result] == [post_id for post_id, _ in expected]
+        np.testing.assert_allclose(
+            [score for _, score in result], [score for _, score in expected], atol=1e-5
+        )
@@ -0,0 +1,75 @@
+"""
+Tests for building models from database rows.
+"""
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.intel.init_db import initialize_database
+from src.models import Cluster, Embedding, Post, Source, SourceType
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Connection to an initialized database holding one row per table."""
+    db_path = tmp_path / "intel.db"
+    assert initialize_database(str(db_path))
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    connection.execute(
+        "INSERT INTO sources (type, url, name, config_json, active) VALUES (?, ?, ?, ?, ?)",
+        ("rss", "https://example.com/feed.xml", "Example", '{"parse_full_content": true}', 0),
+    )
+    connection.execute(
+        "INSERT INTO posts (source_id, title, content, url, published_at, content_hash,"
+        " metadata_json) VALUES (1, 'Title', 'Body', 'https://example.com/1',"
+        " '2024-01-02 03:04:05', 'stored-hash', '{\"tags\": [\"ai\"]}')"
+    )
+    connection.execute(
+        "INSERT INTO embeddings (post_id, embedding_blob, model_name) VALUES (1, ?, 'm')",
+        (np.array([3.0, 4.0], dtype=np.float32).tobytes(),),
+    )
+    connection.execute("INSERT INTO clusters (label, post_count) VALUES ('Topic', 2)")
+    yield connection
+    connection.close()
+
+
+class TestFromRow:
+    """Tests for the from_row constructors."""
+
+    def test_post(self, conn):
+        """Test a post row keeps its stored hash and decodes timestamps and JSON."""
+        post = Post.from_row(conn.execute("SELECT * FROM posts").fetchone())
+
+        assert post.content_hash == "stored-hash"
+        assert post.published_at == datetime(2024, 1, 2, 3, 4, 5)
+        assert isinstance(post.ingested_at, datetime)
+        assert post.metadata_json == {"tags": ["ai"]}
+
+    def test_source(self, conn):
+        """Test a source row maps url and config_json and converts type and active."""
+        source = Source.from_row(conn.execute("SELECT * FROM sources").fetchone())
+
+        assert source.type is SourceType.RSS
+        assert source.identifier == "https://example.com/feed.xml"
+        assert source.config == {"parse_full_content": True}
+        assert source.active is False
+        assert source.typed_config.parse_full_content is True
+
+    def test_embedding(self, conn):
+        """Test an embedding row decodes its vector."""
+        embedding = Embedding.from_row(conn.execute("SELECT * FROM embeddings").fetchone())
+
+        assert embedding.dtype == "float32"
+        assert embedding.embedding_norm == pytest.approx(5.0)
+        np.testing.assert_array_equal(embedding.embedding_vector, [3.0, 4.0])
+
+    def test_cluster(self, conn):
+        """Test a cluster row is built with its columns."""
+        cluster = Cluster.from_row(conn.execute("SELECT * FROM clusters").fetchone())
+
+        assert cluster.label == "Topic"
+        assert cluster.post_count == 2
+        assert cluster.centroid_vector is None
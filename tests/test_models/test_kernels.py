@@ -0,0 +1,89 @@
+"""
+Tests for the shared vector kernels.
+"""
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.models._kernels import (
+    batch_cosine_similarity,
+    cosine_similarity,
+    euclidean_distance,
+    squared_euclidean_distance,
+    vector_norm,
+)
+
+
+@pytest.fixture(params=["simsimd", "numba", "numpy"])
+def kernel_backend(request):
+    """Run each test with each optional backend, and with neither."""
+    if request.param == "simsimd":
+        pytest.importorskip("simsimd")
+        yield
+    elif request.param == "numba":
+        pytest.importorskip("numba")
+        with patch("src.models._kernels.simsimd", None):
+            yield
+    else:
+        with patch("src.models._kernels.simsimd", None), patch(
+            "src.models._kernels._get_jit_cosine", return_value=None
+        ):
+            yield
+
+
+class TestKernels:
+    """Tests for cosine_similarity and euclidean_distance."""
+    
+    def test_cosine_similarity(self, kernel_backend):
+        """Test cosine similarity matches the textbook formula."""
+        rng = np.random.default_rng(0)
+        a = rng.random(384, dtype=np.float32)
+        b = rng.random(384, dtype=np.float32)
+        
+        expected = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        assert cosine_similarity(a, b) == pytest.approx(expected, abs=1e-6)
+    
+    def test_cosine_similarity_zero_vector(self, kernel_backend):
+        """Test a zero vector has similarity 0.0 with anything."""
+        a = np.ones(8, dtype=np.float32)
+        
+        assert cosine_similarity(a, np.zeros(8, dtype=np.float32)) == 0.0
+    
+    def test_euclidean_distance(self, kernel_backend):
+        """Test Euclidean distance, including for float64 input."""
+        a = np.array([0.0, 3.0], dtype=np.float32)
+        b = np.array([4.0, 0.0])
+        
+        assert euclidean_distance(a, b) == pytest.approx(5.0)
+        assert squared_euclidean_distance(a, b) == pytest.approx(25.0)
+    
+    def test_batch_cosine_similarity(self, kernel_backend):
+        """Test batch similarity matches per-row similarity, with zero rows at 0.0."""
+        rng = np.random.default_rng(1)
+        query = rng.random(16, dtype=np.float32)
+        matrix = rng.random((4, 16), dtype=np.float32)
+        matrix[2] = 0.0
+        
+        result = batch_cosine_similarity(query, matrix)
+        
+        expected = [cosine_similarity(query, row) for row in matrix]
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+    
+    def test_cosine_similarity_with_norms(self, kernel_backend):
+        """Test precomputed norms give the same result as computing them."""
+        rng = np.random.default_rng(2)
+        a = rng.random(32, dtype=np.float32)
+        b = rng.random(32, dtype=np.float32)
+        
+        result = cosine_similarity(a, b, vector_norm(a), vector_norm(b))
+        assert result == pytest.approx(cosine_similarity(a, b), abs=1e-6)
+
+
+def test_import_does_not_load_numba():
+    """Test importing the models leaves Numba unimported until the JIT kernel is needed."""
+    code = "import sys, src.models; assert 'numba' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
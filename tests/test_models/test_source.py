@@ -0,0 +1,47 @@
+"""
+Tests for the Source model.
+"""
+from src.connectors.configs.base import BaseConnectorConfig
+from src.connectors.configs.rss import RSSConfig
+from src.models.source import Source, SourceType
+
+
+def make_source(source_type: SourceType = SourceType.RSS, **config) -> Source:
+    """Create a source with the given config."""
+    return Source(
+        type=source_type,
+        identifier="https://example.com/feed.xml",
+        name="Example",
+        config=config or None,
+    )
+
+
+class TestTypedConfig:
+    """Tests for Source.typed_config."""
+
+    def test_config_class_by_type(self):
+        """Test each source type gets its config class, defaulting to the base config."""
+        assert type(make_source(parse_full_content=True).typed_config) is RSSConfig
+        assert type(make_source(SourceType.EMAIL).typed_config) is BaseConnectorConfig
+
+    def test_reused_until_config_reassigned(self):
+        """Test the validated config is reused until config is replaced."""
+        source = make_source(parse_full_content=True)
+        first = source.typed_config
+        assert source.typed_config is first
+
+        source.config = {"parse_full_content": False}
+        assert source.typed_config is not first
+        assert source.typed_config.parse_full_content is False
+
+    def test_rebuilt_after_config_modified_in_place(self):
+        """Test changes made inside the config dict, including nested values, are picked up."""
+        source = make_source(max_items_per_fetch=10, filter_keywords=["python"])
+        first = source.typed_config
+        assert source.typed_config is first
+
+        source.config["max_items_per_fetch"] = 5
+        assert source.typed_config.max_items_per_fetch == 5
+
+        source.config["filter_keywords"].append("rust")
+        assert source.typed_config.filter_keywords == ["python", "rust"]
@@ -1,8 +1,8 @@
 """Tests for Settings environment variable expansion."""
 
 import os
-import tempfile
-from pathlib import Path
+
+import yaml
 
 from src.models.config import Settings
 
@@ -50,6 +50,20 @@ class TestSettingsEnvExpansion:
         assert result["items"][0]["key"] == "dict_value"
         assert result["items"][1]["other"] == "static"
 
+    def test_expand_deeply_nested(self, monkeypatch):
+        """Test Settings._expand_env_vars expands placeholders 50 levels deep"""
+        monkeypatch.setenv("DEEP_VAR", "deep_value")
+
+        config = "${DEEP_VAR}"
+        for _ in range(50):
+            config = {"static": "text", "items": [1, {"key": config}]}
+        result = Settings._expand_env_vars(config)
+
+        for _ in range(50):
+            assert result["static"] == "text"
+            result = result["items"][1]["key"]
+        assert result == "deep_value"
+
     def test_non_placeholder_strings_unchanged(self):
         """Test Settings._expand_env_vars leaves non-placeholder strings unchanged"""
         config = {
@@ -88,19 +102,48 @@ class TestSettingsEnvExpansion:
         assert result["float_value"] == 3.14
         assert result["nested"]["list_with_env"] == ["string_value", 123]
 
+    def test_input_not_mutated(self, monkeypatch):
+        """Test Settings._expand_env_vars returns expanded copies of containers"""
+        monkeypatch.setenv("COPY_VAR", "copied")
+
+        config = {"nested": {"key": "${COPY_VAR}"}, "items": ["${COPY_VAR}"]}
+        result = Settings._expand_env_vars(config)
+        assert result == {"nested": {"key": "copied"}, "items": ["copied"]}
+        assert config == {"nested": {"key": "${COPY_VAR}"}, "items": ["${COPY_VAR}"]}
+
+    def test_unchanged_containers_not_copied(self, monkeypatch):
+        """Test Settings._expand_env_vars only copies containers that contain a placeholder"""
+        monkeypatch.setenv("COPY_VAR", "copied")
+
+        static = {"server": "imap.gmail.com", "ports": [993]}
+        config = {"static": static, "auth": {"token": "${COPY_VAR}"}}
+        result = Settings._expand_env_vars(config)
+        assert result is not config
+        assert result["static"] is static
+        assert result["auth"] == {"token": "copied"}
+        assert Settings._expand_env_vars(static) is static
+
+    def test_expand_from_given_environ(self, monkeypatch):
+        """Test Settings._expand_env_vars looks variables up in the given mapping"""
+        monkeypatch.setenv("SNAPSHOT_VAR", "from_os")
+
+        config = {"key": "${SNAPSHOT_VAR}", "other": "${ONLY_IN_SNAPSHOT}"}
+        result = Settings._expand_env_vars(config, {"ONLY_IN_SNAPSHOT": "from_snapshot"})
+        assert result == {"key": None, "other": "from_snapshot"}
+
 
 class TestSettingsFromYamlIntegration:
     """Integration tests for Settings.from_yaml with environment expansion."""
 
-    def test_from_yaml_with_env_vars(self, monkeypatch):
+    def test_from_yaml_with_env_vars(self, monkeypatch, tmp_path):
         """Test Settings.from_yaml successfully loads and expands environment variables"""
         monkeypatch.setenv("DIR_X_API_TOKEN", "test_x_token")
         monkeypatch.setenv("DIR_EMAIL_PASS", "test_email_pass")
         monkeypatch.setenv("DIR_TRANSCRIPT_API_KEY", "test_transcript_key")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 storage:
   sqlite_path: "./data/test.db"
 auth:
@@ -110,96 +153,103 @@ transcription:
   provider: "whisper"
   api_key: "${DIR_TRANSCRIPT_API_KEY}"
 """
-            )
-            temp_path = f.name
-
-        try:
-            settings = Settings.from_yaml(temp_path)
-            assert settings.auth.x_bearer_token == "test_x_token"
-            assert settings.auth.imap_password == "test_email_pass"
-            assert settings.transcription.api_key == "test_transcript_key"
-            assert settings.storage.sqlite_path == "./data/test.db"
-        finally:
-            os.unlink(temp_path)
-
-    def test_from_yaml_with_missing_env_vars(self):
+        )
+
+        settings = Settings.from_yaml(config_file)
+        assert settings.auth.x_bearer_token == "test_x_token"
+        assert settings.auth.imap_password == "test_email_pass"
+        assert settings.transcription.api_key == "test_transcript_key"
+        assert settings.storage.sqlite_path == "./data/test.db"
+
+    def test_from_yaml_with_missing_env_vars(self, tmp_path):
         """Test Settings.from_yaml handles missing environment variables"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(
-                """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 storage:
   sqlite_path: "./data/test.db"
 auth:
   x_bearer_token: "${MISSING_X_TOKEN}"
   imap_password: "${MISSING_EMAIL_PASS}"
 """
-            )
-            temp_path = f.name
-
-        try:
-            settings = Settings.from_yaml(temp_path)
-            # Missing env vars should result in None values
-            assert settings.auth.x_bearer_token is None
-            assert settings.auth.imap_password is None
-            assert settings.storage.sqlite_path == "./data/test.db"
-        finally:
-            os.unlink(temp_path)
-
-    def test_from_yaml_with_dotenv_file(self, monkeypatch):
+        )
+
+        settings = Settings.from_yaml(config_file)
+        # Missing env vars should result in None values
+        assert settings.auth.x_bearer_token is None
+        assert settings.auth.imap_password is None
+        assert settings.storage.sqlite_path == "./data/test.db"
+
+    def test_from_yaml_with_dotenv_file(self, monkeypatch, tmp_path):
         """Test Settings.from_yaml loads from .env file"""
         # Clear any existing DIR_ environment variables to avoid contamination
         for key in list(os.environ.keys()):
             if key.startswith("DIR_"):
                 monkeypatch.delenv(key, raising=False)
         
-        # Create temporary directory for config and .env files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create .env file
-            env_file = temp_path / ".env"
-            env_file.write_text(
-                """DIR_X_API_TOKEN=dotenv_x_token
+        # Create .env file
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            """DIR_X_API_TOKEN=dotenv_x_token
 DIR_EMAIL_PASS=dotenv_email_pass
 """
-            )
-            
-            # Create config file
-            config_file = temp_path / "config.yaml"
-            config_file.write_text(
-                """
+        )
+        
+        # Create config file
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 auth:
   x_bearer_token: "${DIR_X_API_TOKEN}"
   imap_password: "${DIR_EMAIL_PASS}"
 """
-            )
-            
-            settings = Settings.from_yaml(str(config_file))
-            assert settings.auth.x_bearer_token == "dotenv_x_token"
-            assert settings.auth.imap_password == "dotenv_email_pass"
+        )
+        
+        settings = Settings.from_yaml(config_file)
+        assert settings.auth.x_bearer_token == "dotenv_x_token"
+        assert settings.auth.imap_password == "dotenv_email_pass"
 
-    def test_from_yaml_env_precedence_over_dotenv(self, monkeypatch):
+    def test_from_yaml_env_precedence_over_dotenv(self, monkeypatch, tmp_path):
         """Test that environment variables take precedence over .env file"""
         # Set env var
         monkeypatch.setenv("DIR_X_API_TOKEN", "env_var_token")
         
-        # Create temporary directory for config and .env files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create .env file with different value
-            env_file = temp_path / ".env"
-            env_file.write_text("DIR_X_API_TOKEN=dotenv_token")
-            
-            # Create config file
-            config_file = temp_path / "config.yaml"
-            config_file.write_text(
-                """
+        # Create .env file with different value
+        env_file = tmp_path / ".env"
+        env_file.write_text("DIR_X_API_TOKEN=dotenv_token")
+        
+        # Create config file
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
 auth:
   x_bearer_token: "${DIR_X_API_TOKEN}"
 """
-            )
-            
-            settings = Settings.from_yaml(str(config_file))
-            # Environment variable should take precedence
-            assert settings.auth.x_bearer_token == "env_var_token"
\ No newline at end of file
+        )
+        
+        settings = Settings.from_yaml(config_file)
+        # Environment variable should take precedence
+        assert settings.auth.x_bearer_token == "env_var_token"
+
+    def test_from_yaml_reuses_parse_but_not_expansion(self, monkeypatch, tmp_path):
+        """Test an unchanged file is parsed once while env vars are expanded on every call"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text('auth:\n  x_bearer_token: "${DIR_X_API_TOKEN}"\n')
+        monkeypatch.setenv("DIR_X_API_TOKEN", "first_token")
+        assert Settings.from_yaml(config_file).auth.x_bearer_token == "first_token"
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("unchanged config file was parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail_load)
+        monkeypatch.setenv("DIR_X_API_TOKEN", "second_token")
+        assert Settings.from_yaml(config_file).auth.x_bearer_token == "second_token"
+
+    def test_from_yaml_reparses_modified_file(self, tmp_path):
+        """Test a config file is parsed again after it changes"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("storage:\n  sqlite_path: first.db\n")
+        assert Settings.from_yaml(config_file).storage.sqlite_path == "first.db"
+
+        config_file.write_text("storage:\n  sqlite_path: second_path.db\n")
+        assert Settings.from_yaml(config_file).storage.sqlite_path == "second_path.db"